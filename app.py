@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import argparse
+import atexit
 import base64
+import concurrent.futures
+import contextlib
 import csv
 import hashlib
 import hmac
@@ -13,12 +15,14 @@ import sqlite3
 import shutil
 import subprocess
 import dataclasses
+import functools
 import threading
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import filedialog, ttk, messagebox
 import time
 import urllib.parse
+from collections import OrderedDict, deque
 import traceback
 from typing import Dict
 import sys
@@ -34,8 +38,77 @@ try:
 except Exception:
     mysql_connector = None
 
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
+_FFMPEG_HELP = (
+    "1) Download ffmpeg: https://ffmpeg.org/download.html\n"
+    "2) Extract the zip (e.g., to C:\\ffmpeg)\n"
+    "3) Add its bin folder (e.g., C:\\ffmpeg\\bin) to your system PATH\n"
+    "4) Restart this app."
+)
+
+# YouTube Mix playlists look like list=RD<videoId>.
+_RE_LIST_RD = re.compile(r"(?:^|&)list=RD", re.IGNORECASE)
+
+_MEDIA_URL_RE = re.compile(
+    r"youtube\.com|youtu\.be|facebook\.com|fb\.watch|tiktok\.com|instagram\.com|pinterest\.com",
+    re.IGNORECASE,
+)
+
+# Byte -> password character class bit: lower=1, upper=2, digit=4, anything else=8.
+_CLASS_TABLE = bytes(
+    1 if 97 <= i <= 122 else 2 if 65 <= i <= 90 else 4 if 48 <= i <= 57 else 8
+    for i in range(256)
+)
+
+
+# (class mask, length) in one pass; shared by the strength label and register validation.
+def _auth_scan_password(pw: str) -> tuple[int, int]:
+    mask = 0
+    for c in pw.encode("utf-8", "ignore"):
+        mask |= _CLASS_TABLE[c]
+    return mask, len(pw)
+
+
+def _clipboard_sequence_reader():
+    # Windows bumps a counter on every clipboard change; reading it is a single cheap call.
+    if not sys.platform.startswith("win"):
+        return None
+    try:
+        fn = ctypes.windll.user32.GetClipboardSequenceNumber
+        fn.restype = ctypes.c_uint
+        return fn
+    except Exception:
+        return None
+
+
+# Shared, reentrant guard for best-effort Tk calls on close/animation paths.
+_SUPPRESS = contextlib.suppress(Exception)
+
+# File dialog filters for the Music Studio and profile pickers.
+_AUDIO_FILETYPES = (("Audio", "*.mp3 *.wav *.m4a *.aac *.flac *.ogg"), ("All files", "*.*"))
+_VIDEO_FILETYPES = (("Video", "*.mp4 *.mkv *.mov *.webm"), ("All files", "*.*"))
+_BG_FILETYPES = (("Images/Videos", "*.png *.jpg *.jpeg *.webp *.bmp *.mp4 *.mov *.mkv *.webm"), ("All files", "*.*"))
+_MP4_FILETYPES = (("MP4", "*.mp4"), ("All files", "*.*"))
+_IMAGE_FILETYPES = (("Images", "*.png;*.jpg;*.jpeg;*.webp;*.bmp"), ("All files", "*.*"))
+
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="img")
+
+
+def _decode_and_resize(src_path: str, out_path: str, thumbs: list[tuple[str, tuple[int, int]]]) -> list[Image.Image]:
+    # Runs on _IO_POOL: decode the picked file, store it as PNG and write the
+    # pre-scaled copies. Returns the small images in the order of `thumbs`.
+    with Image.open(src_path) as src:
+        img = src.convert("RGBA")
+    img.save(out_path, format="PNG")
+    resample = getattr(Image, "Resampling", Image).LANCZOS
+    out: list[Image.Image] = []
+    for thumb_path, wh in thumbs:
+        small = img.resize(wh, resample)
+        try:
+            small.save(thumb_path, "PNG", optimize=True)
+        except Exception:
+            pass
+        out.append(small)
+    return out
 
 
 def _app_base_dir() -> str:
@@ -74,13 +147,39 @@ def _data_path(*parts: str) -> str:
     return os.path.join(_user_data_dir(), *parts)
 
 
+_LOG_FH = None
+_LOG_LOCK = threading.Lock()
+_LOG_STAMP = [0, ""]
+
+
+def _now_str() -> str:
+    # strftime/localtime once per second; bursts of log lines reuse the string.
+    t = int(time.time())
+    if t != _LOG_STAMP[0]:
+        _LOG_STAMP[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+        _LOG_STAMP[0] = t
+    return _LOG_STAMP[1]
+
+
 def _debug_log(msg: str) -> None:
-    try:
-        p = _data_path("cli.log")
-        with open(p, "a", encoding="utf-8") as f:
-            f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n")
-    except Exception:
-        pass
+    # cli.log stays open (line-buffered) for the whole process instead of an
+    # open/write/close per line; if it cannot be kept open, fall back to that.
+    global _LOG_FH
+    line = f"[{_now_str()}] {msg}\n"
+    with _LOG_LOCK:
+        try:
+            if _LOG_FH is None:
+                _LOG_FH = open(_data_path("cli.log"), "a", encoding="utf-8", buffering=1)
+                atexit.register(_LOG_FH.close)
+            _LOG_FH.write(line)
+            return
+        except Exception:
+            pass
+        try:
+            with open(_data_path("cli.log"), "a", encoding="utf-8") as f:
+                f.write(line)
+        except Exception:
+            pass
 
 
 def _load_mysql_config() -> dict:
@@ -628,6 +727,10 @@ def _make_auth_store_cli(sqlite_db_path: str) -> _AuthStore:
 
 
 class App(ctk.CTk):
+    _LABEL_COLOR = "#94a3b8"
+    _SESSION_CACHE_TTL = 300.0
+    _SCRAPE_CACHE_TTL = 300.0
+
     def __init__(self):
         super().__init__()
         self.title("Snakee Video Downloader")
@@ -654,11 +757,30 @@ class App(ctk.CTk):
         self._downloaded_files: Dict[int, str] = {}
         self._history_cache: list[tuple[int, str, str, str, str]] = []
         self._pending_register: dict | None = None
-        self._otp_code: str | None = None
-        self._otp_expires_at: int = 0
+        self._otp_code_digest: bytes | None = None
+        self._otp_deadline: float = 0.0
+        self._otp_last_remain: int = -1
         self._otp_after_id: str | None = None
+        self._pwd_after_id: str | None = None
+        self._auth_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth")
         self._profile_modal: ctk.CTkToplevel | None = None
+        self._profile_modal_widgets: Dict[str, ctk.CTkLabel] = {}
+        self._profile_pic_label: ctk.CTkLabel | None = None
+        self._profile_pic_ctk: ctk.CTkImage | None = None
         self._music_studio_win: ctk.CTkToplevel | None = None
+        self._ffmpeg_path: str | None = None
+        self._ui_font_family_cache: Dict[str, str] = {}
+        self._font_cache: Dict[tuple[str | None, int, str], ctk.CTkFont] = {}
+        self._ctk_image_cache: OrderedDict[tuple[str, int, int, int, float], ctk.CTkImage] = OrderedDict()
+        self._dpi = self._read_window_scaling()
+        self._session_cache: tuple[str, dict] | None = None
+        self._last_overall_status = 0.0
+        self._overall_status_after: str | None = None
+        self._last_progress: float | None = None
+        self._last_speed_text: str | None = None
+        self._scrape_cache: Dict[tuple[str, bool], tuple[float, list[str]]] = {}
+        self._current_scrape_cancel: threading.Event | None = None
+        self._session_cache_at: float = 0.0
 
         self.url_var = tk.StringVar(value="")
         self.quality_var = tk.StringVar(value="Best Available")
@@ -679,6 +801,12 @@ class App(ctk.CTk):
         self.clipboard_monitor = tk.BooleanVar(value=False)
         self._last_clipboard = ""
         self._clipboard_thread = None
+        self._clipboard_enabled = threading.Event()
+        self._clipboard_pending_url: str | None = None
+        self._clipboard_pending_lock = threading.Lock()
+        self._profile_pic_pending: tuple[str, list[str], int, concurrent.futures.Future] | None = None
+        self._profile_pic_pending_lock = threading.Lock()
+        self.clipboard_monitor.trace_add("write", lambda *_: self._sync_clipboard_enabled())
 
         # Advanced / Subtitle / AI
         self.write_subtitles = tk.BooleanVar(value=False)
@@ -794,10 +922,16 @@ class App(ctk.CTk):
                 pass
 
         self._auth_init_db()
+        self._init_auth_fonts()
         self._build_auth_ui()
         self._clear_session()
         self._check_dependencies()
+        self.bind("<<ClipboardMediaUrl>>", self._on_clipboard_media_url)
+        self.bind("<<ProfilePicReady>>", self._on_profile_pic_ready)
         self._start_clipboard_monitor()
+        # One permanent root click handler; it is a no-op while the profile popup is hidden.
+        self._root_click_funcid = self.bind("<Button-1>", self._on_root_click_dispatch, add="+")
+        self.bind("<Configure>", self._on_root_configure, add="+")
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         _debug_log("App initialized")
 
@@ -812,6 +946,22 @@ class App(ctk.CTk):
 
         return _data_path("profile_pics", f"user_{uid}.png")
 
+    def _profile_thumb_path(self, user_id: int, px: int) -> str:
+        base, _ext = os.path.splitext(self._profile_pic_path(user_id))
+        return f"{base}_{int(px)}.png"
+
+    def _write_profile_thumbs(self, user_id: int, img: Image.Image, size: tuple[int, int]) -> None:
+        # Pre-scale @1x and @2x copies once so opening the profile never resamples the original.
+        resample = getattr(Image, "Resampling", Image).LANCZOS
+        for mult in (1, 2):
+            w, h = int(size[0]) * mult, int(size[1]) * mult
+            out_p = self._profile_thumb_path(user_id, w)
+            try:
+                img.resize((w, h), resample).save(out_p, "PNG", optimize=True)
+            except Exception:
+                continue
+            self._invalidate_ctk_image(out_p)
+
     def _load_profile_pic_ctk(self, user_id: int, size: tuple[int, int]) -> ctk.CTkImage | None:
         try:
             p = self._profile_pic_path(user_id)
@@ -820,13 +970,59 @@ class App(ctk.CTk):
             except Exception:
                 pass
 
-            if not os.path.isfile(p):
-                return None
+            mult = 2 if self._dpi > 1.0 else 1
+            thumb = self._profile_thumb_path(user_id, int(size[0]) * mult)
+            if not os.path.isfile(thumb) and os.path.isfile(p):
+                # Pictures uploaded before thumbnails existed: build them once.
+                with Image.open(p) as src:
+                    self._write_profile_thumbs(user_id, src.convert("RGBA"), size)
+            return self._get_ctk_image(thumb, size) or self._get_ctk_image(p, size)
+        except Exception:
+            return None
+
+    _CTK_IMAGE_CACHE_MAX = 64
 
-            img = Image.open(p).convert("RGBA")
-            return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+    def _get_ctk_image(self, path: str, size: tuple[int, int]) -> ctk.CTkImage | None:
+        # CTkImage construction is slow; keep a small LRU keyed on (path, w, h, mtime, dpi).
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        key = (path, int(size[0]), int(size[1]), mtime_ns, self._dpi)
+        cache = self._ctk_image_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+        try:
+            with Image.open(path) as src:
+                img = src.convert("RGBA")
+            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
         except Exception:
             return None
+        cache[key] = ctk_img
+        if len(cache) > self._CTK_IMAGE_CACHE_MAX:
+            cache.popitem(last=False)
+        return ctk_img
+
+    def _read_window_scaling(self) -> float:
+        try:
+            return float(self._get_window_scaling())
+        except Exception:
+            return 1.0
+
+    def _on_root_configure(self, event: tk.Event) -> None:
+        # <Configure> on the root fires for every child; only the toplevel itself
+        # can move to a monitor with a different scaling.
+        if event.widget is not self:
+            return
+        dpi = self._read_window_scaling()
+        if dpi != self._dpi:
+            self._dpi = dpi
+
+    def _invalidate_ctk_image(self, path: str) -> None:
+        for key in [k for k in self._ctk_image_cache if k[0] == path]:
+            self._ctk_image_cache.pop(key, None)
 
     def _find_local_font_file(self) -> str:
         assets_dir = _resource_path("assets")
@@ -922,6 +1118,8 @@ class App(ctk.CTk):
                     self._load_font_from_file(p)
                 except Exception:
                     pass
+            # Newly registered fonts can change which family wins.
+            self._ui_font_family_cache.clear()
 
         try:
             family = self._get_ui_font_family()
@@ -943,6 +1141,29 @@ class App(ctk.CTk):
         except Exception:
             pass
 
+    def _init_auth_fonts(self) -> None:
+        # Shared font objects for the auth screens; _apply_locale_fonts retargets
+        # their family so every label using them follows the locale.
+        family = self._get_ui_font_family()
+        self._font_field_label = ctk.CTkFont(family=family, size=11)
+        self._font_label_bold = ctk.CTkFont(family=family, size=18, weight="bold")
+        self._font_auth_title = ctk.CTkFont(family=family, size=22, weight="bold")
+        self._font_auth_subtitle = ctk.CTkFont(family=family, size=14)
+        self._font_h2 = ctk.CTkFont(family=family, size=16, weight="bold")
+        self._font_name_bold = ctk.CTkFont(family=family, size=14, weight="bold")
+
+    def _font(self, size: int = 14, weight: str = "normal", family: str | None = None) -> ctk.CTkFont:
+        # Shared CTkFont per (family, size, weight); each construction is a Tk "font create".
+        key = (family, size, weight)
+        font = self._font_cache.get(key)
+        if font is None:
+            if family is None:
+                font = ctk.CTkFont(size=size, weight=weight)
+            else:
+                font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self._font_cache[key] = font
+        return font
+
     def _get_text(self, key: str) -> str:
         loc = self.locale_var.get()
         return self.locale_dict.get(loc, self.locale_dict["English"]).get(key, key)
@@ -1052,6 +1273,7 @@ class App(ctk.CTk):
         self._profile_text.set("")
 
         self._profile_popup: ctk.CTkToplevel | None = None
+        self._profile_popup_win: ctk.CTkToplevel | None = None
         self._profile_popup_anim_after: str | None = None
         
         ctk.CTkLabel(right_h, text="v1.0.0 Elite Edition • @SnapKeeTeam", text_color="#64748b", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=1, column=0, columnspan=4, sticky="e", pady=10)
@@ -1137,11 +1359,17 @@ class App(ctk.CTk):
         self.speed_meter.pack(side="right", padx=20)
 
         self._build_download_tab()
-        self._build_advanced_tab()
-        self._build_ai_tab()
-        self._build_tools_tab()
         self._build_logs_tab()
         self._build_history_tab()
+        # Advanced / AI Features / Tools only hold widgets over existing vars; build
+        # them the first time they are shown. Logs and History must exist up front
+        # because log lines and finished jobs are written into them.
+        self._tabs_built: set[str] = {"Download", "Logs", "History"}
+        self._tab_builders = {
+            "Advanced": self._build_advanced_tab,
+            "AI Features": self._build_ai_tab,
+            "Tools": self._build_tools_tab,
+        }
 
     def _build_download_tab(self):
         self.tab_down.grid_columnconfigure(0, weight=1)
@@ -1747,6 +1975,13 @@ class App(ctk.CTk):
             pass
 
     def _select_tab(self, name: str):
+        if name not in self._tabs_built:
+            self._tabs_built.add(name)
+            builder = self._tab_builders.get(name)
+            if builder is not None:
+                builder()
+                # Pick up the current locale fonts for the widgets just created.
+                self._apply_locale_fonts()
         self.tabs.set(name)
         # Update Nav Styles
         self.btn_nav_down.configure(fg_color="#7c3aed" if name == "Download" else "transparent")
@@ -1955,13 +2190,17 @@ class App(ctk.CTk):
         except Exception:
             pass
         try:
-            self.manager.stop()
+            self._workers_idle = self.manager.shutdown(timeout=2.0)
         except:
             pass
         try:
             self._clear_session()
         except Exception:
             pass
+        try:
+            self._auth_pool.shutdown(wait=False)
+        except Exception:
+            pass
         self.destroy()
 
     def _current_options(self) -> DownloadOptions:
@@ -2243,6 +2482,14 @@ class App(ctk.CTk):
 
     def _get_ui_font_family(self) -> str:
         loc = self.locale_var.get()
+        cached = self._ui_font_family_cache.get(loc)
+        if cached is not None:
+            return cached
+        family = self._pick_ui_font_family(loc)
+        self._ui_font_family_cache[loc] = family
+        return family
+
+    def _pick_ui_font_family(self, loc: str) -> str:
         if loc == "Khmer":
             return self._pick_font(
                 "Kantumruy Pro",
@@ -2389,12 +2636,17 @@ class App(ctk.CTk):
         # Auth/login/register screen
         if hasattr(self, "auth_lang_menu"):
             self.auth_lang_menu.configure(font=self._font_small)
-        if hasattr(self, "login_title_label"):
-            self.login_title_label.configure(font=ctk.CTkFont(family=family, size=18, weight="bold"))
-        if hasattr(self, "register_title_label"):
-            self.register_title_label.configure(font=ctk.CTkFont(family=family, size=18, weight="bold"))
-        if hasattr(self, "otp_title_label"):
-            self.otp_title_label.configure(font=ctk.CTkFont(family=family, size=16, weight="bold"))
+        for name in (
+            "_font_field_label",
+            "_font_label_bold",
+            "_font_auth_title",
+            "_font_auth_subtitle",
+            "_font_h2",
+            "_font_name_bold",
+        ):
+            f = getattr(self, name, None)
+            if f is not None:
+                f.configure(family=family)
         if hasattr(self, "auth_error_label"):
             self.auth_error_label.configure(font=self._font_small)
         if hasattr(self, "auth_status_label"):
@@ -2475,14 +2727,17 @@ class App(ctk.CTk):
         self._set_status(f"Imported {len(urls)} URL(s)")
 
     def _clear_finished(self) -> None:
+        # One pass over the jobs instead of a get_job() scan per tree row.
+        rows = self._job_rows
         to_delete = []
-        for job_id, iid in list(self._job_rows.items()):
-            job = self.manager.get_job(job_id)
-            if not job:
-                to_delete.append((job_id, iid))
-                continue
+        known = set()
+        for job in self.manager.iter_jobs():
+            known.add(job.job_id)
             if job.status in {"done", "error", "cancelled"}:
-                to_delete.append((job_id, iid))
+                iid = rows.get(job.job_id)
+                if iid:
+                    to_delete.append((job.job_id, iid))
+        to_delete.extend((job_id, iid) for job_id, iid in rows.items() if job_id not in known)
 
         for job_id, iid in to_delete:
             try:
@@ -2619,14 +2874,14 @@ class App(ctk.CTk):
                         continue
 
                     def _add_expanded(expanded_urls: List[str]) -> None:
+                        jobs = []
                         for eu in expanded_urls:
                             try:
                                 eu = self._normalize_url(eu)
                             except Exception:
                                 pass
-                            job = self.manager.add_job(url=eu, options=options)
-                            self._insert_job(job)
-                        self._refresh_overall_status()
+                            jobs.append(self.manager.add_job(url=eu, options=options))
+                        self._bulk_insert_jobs(jobs)
 
                     self.after(0, lambda ex=expanded: _add_expanded(ex))
 
@@ -2752,19 +3007,21 @@ class App(ctk.CTk):
         job.progress = 0.0
         job.error = ""
         job.cancel_event.clear()
-        self.manager._pending.put(job.job_id)
+        self.manager.track_job(job)
+        self.manager.requeue_job(job)
         self.manager.start()
         self._on_job_status(job)
 
     def _retry_all_errors(self) -> None:
         count = 0
-        for job in self.manager.jobs():
+        for job in self.manager.iter_jobs():
             if job.status == "error":
                 job.status = "queued"
                 job.progress = 0.0
                 job.error = ""
                 job.cancel_event.clear()
-                self.manager._pending.put(job.job_id)
+                self.manager.track_job(job)
+                self.manager.requeue_job(job)
                 count += 1
         if count > 0:
             self.manager.start()
@@ -2781,6 +3038,18 @@ class App(ctk.CTk):
         self._job_rows[job.job_id] = iid
         self._refresh_overall_status()
 
+    def _bulk_insert_jobs(self, jobs: list[DownloadJob]) -> None:
+        # Same rows as _insert_job, but one status refresh for the whole batch.
+        insert = self.tree.insert
+        rows = self._job_rows
+        for job in jobs:
+            rows[job.job_id] = insert(
+                "",
+                "end",
+                values=(job.job_id, job.url, job.status, f"{job.progress:.1f}", job.speed, job.eta),
+            )
+        self._refresh_overall_status()
+
     def _on_job_status_threadsafe(self, job: DownloadJob) -> None:
         self.after(0, lambda: self._on_job_status(job))
 
@@ -2813,14 +3082,6 @@ class App(ctk.CTk):
                 self._refresh_history_view()
             except Exception:
                 pass
-        
-        # Update Global Speed Meter
-        jobs = self.manager.jobs()
-        active_speeds = [j.speed for j in jobs if j.status == "running" and j.speed]
-        if active_speeds:
-            self.speed_meter.configure(text=active_speeds[0])
-        else:
-            self.speed_meter.configure(text="0 KB/s")
 
     def _log_threadsafe(self, msg: str) -> None:
         self.after(0, lambda: self._log(msg))
@@ -2871,41 +3132,24 @@ class App(ctk.CTk):
         if not path:
             self._logo_ctk_image = None
             return
-        try:
-            img = Image.open(path)
-            img = img.convert("RGBA")
-            self._logo_ctk_image = ctk.CTkImage(light_image=img, dark_image=img, size=(300, 100))
-        except Exception:
-            self._logo_ctk_image = None
+        self._logo_ctk_image = self._get_ctk_image(path, (300, 100))
 
     def _check_dependencies(self) -> None:
-        ffmpeg = shutil.which("ffmpeg")
-        if not ffmpeg:
-            msg = (
+        self._ffmpeg_path = shutil.which("ffmpeg")
+        if not self._ffmpeg_path:
+            self._log(
                 "ffmpeg not found in PATH. Merging/conversion/subtitles may fail.\n"
-                "Windows fix:\n"
-                "1) Download ffmpeg: https://ffmpeg.org/download.html\n"
-                "2) Extract the zip (e.g., to C:\\ffmpeg)\n"
-                "3) Add its bin folder to Environment Variables (PATH):\n"
-                "   - Open System Properties → Advanced → Environment Variables\n"
-                "   - Edit 'Path' under User/System variables\n"
-                "   - Add 'C:\\ffmpeg\\bin' (or where you extracted)\n"
-                "4) Restart this app.\n"
+                f"Windows fix:\n{_FFMPEG_HELP}\n"
                 "Test in terminal: ffmpeg -version"
             )
-            self._log(msg)
             try:
                 import tkinter.messagebox as tkmb
                 tkmb.showerror(
                     "Missing FFmpeg",
                     "ffmpeg not found.\n\n"
                     "Without FFmpeg, video/audio merging and subtitles will fail.\n\n"
-                    "To fix:\n"
-                    "1) Download ffmpeg from https://ffmpeg.org/download.html\n"
-                    "2) Extract (e.g., to C:\\ffmpeg)\n"
-                    "3) Add its 'bin' folder to your system PATH\n"
-                    "4) Restart this app.\n\n"
-                    "Test with: ffmpeg -version"
+                    f"To fix:\n{_FFMPEG_HELP}\n\n"
+                    "Test with: ffmpeg -version",
                 )
             except Exception:
                 pass
@@ -2989,10 +3233,16 @@ class App(ctk.CTk):
         if not u:
             return u
 
+        # Most pasted URLs are neither Facebook nor YouTube: bail out before any parsing.
+        low = u.lower()
+        is_fb = "facebook.com" in low or "fb.watch" in low
+        is_yt = "youtube.com" in low or "youtu.be" in low
+        if not is_fb and not is_yt:
+            return u
+
         # Normalize common Facebook subdomains to the canonical host.
         # This avoids some extractors treating web/mobile variants as unsupported.
-        low = u.lower()
-        if "facebook.com" in low or "fb.watch" in low:
+        if is_fb:
             try:
                 parsed = urllib.parse.urlsplit(u)
                 host = (parsed.netloc or "").lower()
@@ -3007,7 +3257,7 @@ class App(ctk.CTk):
 
         # Normalize YouTube URLs that include Mix/Playlist params (list/start_radio)
         # to avoid yt-dlp treating them as a playlist when the user wants one video.
-        if "youtube.com" not in low and "youtu.be" not in low:
+        if not is_yt:
             return u
 
         try:
@@ -3044,9 +3294,7 @@ class App(ctk.CTk):
             parsed = urllib.parse.urlsplit(u)
         except Exception:
             return False
-        qs = urllib.parse.parse_qs(parsed.query)
-        list_id = (qs.get("list") or [""])[0].strip()
-        return bool(list_id) and list_id.upper().startswith("RD")
+        return bool(_RE_LIST_RD.search(parsed.query))
 
     def _auth_init_db(self) -> None:
         try:
@@ -3091,6 +3339,7 @@ class App(ctk.CTk):
             "otp_verify": "Verify & Create",
             "otp_resend": "Resend code",
             "otp_invalid": "Invalid or expired code.",
+            "otp_demo_hint": "Demo OTP for {phone}: {code}",
             "otp_need_phone": "Phone number is required for the next step.",
             "btn_to_register": "Create Account",
             "btn_to_login": "Back to Login",
@@ -3135,6 +3384,7 @@ class App(ctk.CTk):
             "otp_verify": "ផ្ទៀងផ្ទាត់ & បង្កើត",
             "otp_resend": "ផ្ញើកូដម្ដងទៀត",
             "otp_invalid": "កូដមិនត្រឹមត្រូវ ឬផុតកំណត់។",
+            "otp_demo_hint": "OTP សាកល្បងសម្រាប់ {phone}: {code}",
             "otp_need_phone": "ត្រូវបញ្ចូលលេខទូរស័ព្ទសម្រាប់ជំហានបន្ទាប់។",
             "btn_to_register": "បង្កើតគណនីថ្មី",
             "btn_to_login": "ត្រឡប់ទៅ Login",
@@ -3161,18 +3411,8 @@ class App(ctk.CTk):
         return d.get(key, key)
 
     def _auth_password_strength(self, password: str) -> str:
-        p = password or ""
-        score = 0
-        if len(p) >= 8:
-            score += 1
-        if re.search(r"[a-z]", p):
-            score += 1
-        if re.search(r"[A-Z]", p):
-            score += 1
-        if re.search(r"[0-9]", p):
-            score += 1
-        if re.search(r"[^A-Za-z0-9]", p):
-            score += 1
+        mask, length = _auth_scan_password(password or "")
+        score = (length >= 8) + bin(mask).count("1")
         if score <= 2:
             return self._auth_t("pwd_weak")
         if score == 3:
@@ -3180,14 +3420,16 @@ class App(ctk.CTk):
         return self._auth_t("pwd_strong")
 
     def _auth_validate_register(self, display: str, username: str, email: str, password: str, confirm: str, terms_ok: bool) -> str | None:
-        if not display.strip():
+        # Callers pass values already stripped (and the entries trim on FocusOut).
+        if not display:
             return self._auth_t("display_name")
-        if not re.fullmatch(r"[A-Za-z0-9_]{3,20}", username.strip()):
+        if not re.fullmatch(r"[A-Za-z0-9_]{3,20}", username):
             return self._auth_t("err_username")
-        if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", email.strip()):
+        if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", email):
             return self._auth_t("err_email")
-        p = password or ""
-        if len(p) < 8 or not re.search(r"[a-z]", p) or not re.search(r"[A-Z]", p) or not re.search(r"[0-9]", p):
+        mask, length = _auth_scan_password(password or "")
+        # Needs lower (1), upper (2) and digit (4); symbols are optional.
+        if length < 8 or (mask & 7) != 7:
             return self._auth_t("err_pwd")
         if password != confirm:
             return self._auth_t("err_pwd_match")
@@ -3218,10 +3460,10 @@ class App(ctk.CTk):
             self.auth_logo_label.configure(image=self._logo_ctk_image)
         self.auth_logo_label.grid(row=0, column=0, sticky="w")
 
-        ctk.CTkLabel(card, text=self._get_text("title"), font=ctk.CTkFont(family=self._get_ui_font_family(), size=22, weight="bold"), text_color="#f8fafc").grid(
+        ctk.CTkLabel(card, text=self._get_text("title"), font=self._font_auth_title, text_color="#f8fafc").grid(
             row=1, column=0, sticky="w", padx=24, pady=(6, 6)
         )
-        ctk.CTkLabel(card, text=self._get_text("subtitle"), font=ctk.CTkFont(family=self._get_ui_font_family(), size=14), text_color="#94a3b8").grid(
+        ctk.CTkLabel(card, text=self._get_text("subtitle"), font=self._font_auth_subtitle, text_color="#94a3b8").grid(
             row=2, column=0, sticky="w", padx=24, pady=(0, 10)
         )
 
@@ -3244,20 +3486,21 @@ class App(ctk.CTk):
         self.auth_stack.grid(row=4, column=0, sticky="nsew", padx=24, pady=(0, 12))
         self.auth_stack.grid_columnconfigure(0, weight=1)
 
+        self._auth_refresh_strings()
         self._build_login_frame()
         self._build_register_frame()
         self._show_login()
 
-        self.auth_error_label = ctk.CTkLabel(card, textvariable=self._auth_error_text, text_color="#f87171", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11))
+        self.auth_error_label = ctk.CTkLabel(card, textvariable=self._auth_error_text, text_color="#f87171", font=self._font_field_label)
         self.auth_error_label.grid(row=5, column=0, sticky="w", padx=24, pady=(0, 2))
-        self.auth_status_label = ctk.CTkLabel(card, textvariable=self._auth_status_text, text_color="#34d399", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11))
+        self.auth_status_label = ctk.CTkLabel(card, textvariable=self._auth_status_text, text_color="#34d399", font=self._font_field_label)
         self.auth_status_label.grid(row=6, column=0, sticky="w", padx=24, pady=(0, 14))
 
         self.auth_loader_row = ctk.CTkFrame(card, fg_color="transparent")
         self.auth_loader_row.grid(row=7, column=0, sticky="ew", padx=24, pady=(0, 18))
         self.auth_loader_row.grid_columnconfigure(1, weight=1)
 
-        self.auth_loader_text = ctk.CTkLabel(self.auth_loader_row, text="", text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11))
+        self.auth_loader_text = ctk.CTkLabel(self.auth_loader_row, text="", text_color=self._LABEL_COLOR, font=self._font_field_label)
         self.auth_loader_text.grid(row=0, column=0, sticky="w", padx=(0, 12))
 
         self.auth_loader = ctk.CTkProgressBar(self.auth_loader_row, mode="indeterminate", height=8)
@@ -3265,11 +3508,27 @@ class App(ctk.CTk):
 
         self.auth_loader_row.grid_remove()
 
+        self._update_auth_toggle_widgets()
+
+    def _auth_refresh_strings(self) -> None:
+        # Strings used from hot paths (keystrokes, countdown ticks, worker callbacks).
+        self._s_expires_in = self._auth_t("expires_in")
+        self._s_pwd_strength_prefix = self._auth_t("pwd_strength")
+        self._s_otp_invalid = self._auth_t("otp_invalid")
+        self._s_otp_demo_hint = self._auth_t("otp_demo_hint")
+        self._s_err_exists = self._auth_t("err_exists")
+        self._s_ok_register = self._auth_t("ok_register")
+        self._s_err_login_invalid = self._auth_t("err_login_invalid")
+        self._s_err_login_pwd = self._auth_t("err_login_pwd")
+        self._s_err_locked = self._auth_t("err_locked")
+        self._s_processing = self._auth_t("processing")
+
     def _auth_refresh_labels(self) -> None:
         try:
             self._on_locale_change(self.locale_var.get())
         except Exception:
             pass
+        self._auth_refresh_strings()
         try:
             self.login_title_label.configure(text=self._auth_t("login_title"))
             self.register_title_label.configure(text=self._auth_t("register_title"))
@@ -3282,24 +3541,19 @@ class App(ctk.CTk):
             self.btn_go_login.configure(text=self._auth_t("btn_to_login"))
             self.remember_chk.configure(text=self._auth_t("remember_me"))
             self.terms_chk.configure(text=self._auth_t("agree_terms"))
-            self.pwd_strength_label.configure(text=f"{self._auth_t('pwd_strength')} {self._auth_password_strength(self.reg_password.get())}")
+            self._apply_pwd_strength()
             if hasattr(self, "login_show_chk"):
                 self.login_show_chk.configure(text=self._auth_t("show"))
             if hasattr(self, "reg_show_pwd_chk"):
                 self.reg_show_pwd_chk.configure(text=self._auth_t("show"))
             if hasattr(self, "reg_show_confirm_chk"):
                 self.reg_show_confirm_chk.configure(text=self._auth_t("show"))
-            if hasattr(self, "otp_title_label"):
+            if self._reg_step2_built:
                 self.otp_title_label.configure(text=self._auth_t("otp_title"))
-            if hasattr(self, "otp_sent_label"):
                 self.otp_sent_label.configure(text=self._auth_t("otp_sent"))
-            if hasattr(self, "otp_entry"):
                 self.otp_entry.configure(placeholder_text=self._auth_t("otp_code"))
-            if hasattr(self, "btn_otp_back"):
                 self.btn_otp_back.configure(text=self._auth_t("btn_back"))
-            if hasattr(self, "btn_otp_resend"):
                 self.btn_otp_resend.configure(text=self._auth_t("otp_resend"))
-            if hasattr(self, "btn_otp_verify"):
                 self.btn_otp_verify.configure(text=self._auth_t("otp_verify"))
         except Exception:
             pass
@@ -3309,7 +3563,7 @@ class App(ctk.CTk):
         self.login_frame.grid(row=0, column=0, sticky="nsew")
         self.login_frame.grid_columnconfigure(0, weight=1)
 
-        self.login_title_label = ctk.CTkLabel(self.login_frame, text=self._auth_t("login_title"), font=ctk.CTkFont(size=18, weight="bold"), text_color="#f8fafc")
+        self.login_title_label = ctk.CTkLabel(self.login_frame, text=self._auth_t("login_title"), font=self._font_label_bold, text_color="#f8fafc")
         self.login_title_label.grid(row=0, column=0, sticky="w", pady=(0, 12))
 
         self.login_user = tk.StringVar(value="")
@@ -3317,9 +3571,7 @@ class App(ctk.CTk):
         self.remember_me = tk.BooleanVar(value=False)
         self._login_show_pwd = tk.BooleanVar(value=False)
 
-        ctk.CTkLabel(self.login_frame, text=f"{self._auth_t('email')} / {self._auth_t('username')}", text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(
-            row=1, column=0, sticky="w", pady=(0, 4)
-        )
+        self._mk_field_label(self.login_frame, 1, f"{self._auth_t('email')} / {self._auth_t('username')}")
         self.login_user_entry = ctk.CTkEntry(
             self.login_frame,
             textvariable=self.login_user,
@@ -3327,11 +3579,12 @@ class App(ctk.CTk):
             placeholder_text_color="#64748b",
         )
         self.login_user_entry.grid(row=2, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(self.login_user_entry, self.login_user)
 
         pw_wrap = ctk.CTkFrame(self.login_frame, fg_color="transparent")
         pw_wrap.grid(row=3, column=0, sticky="ew", pady=(0, 8))
         pw_wrap.grid_columnconfigure(0, weight=1)
-        ctk.CTkLabel(self.login_frame, text=self._auth_t("password"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=4, column=0, sticky="w", pady=(0, 4))
+        self._mk_field_label(self.login_frame, 4, self._auth_t("password"))
         self.login_pass_entry = ctk.CTkEntry(
             pw_wrap,
             textvariable=self.login_pass,
@@ -3357,12 +3610,27 @@ class App(ctk.CTk):
         self.btn_go_register = ctk.CTkButton(self.login_frame, text=self._auth_t("btn_to_register"), fg_color="#1e293b", hover_color="#334155", command=self._show_register)
         self.btn_go_register.grid(row=7, column=0, sticky="ew")
 
+    def _trim_on_focus_out(self, entry: ctk.CTkEntry, var: tk.StringVar) -> None:
+        # Normalize surrounding whitespace once when the user leaves the field.
+        def _trim(_e=None) -> None:
+            v = var.get()
+            t = v.strip()
+            if t != v:
+                var.set(t)
+
+        entry.bind("<FocusOut>", _trim, add="+")
+
+    def _mk_field_label(self, parent, row: int, text: str) -> ctk.CTkLabel:
+        lbl = ctk.CTkLabel(parent, text=text, text_color=self._LABEL_COLOR, font=self._font_field_label)
+        lbl.grid(row=row, column=0, sticky="w", pady=(0, 4))
+        return lbl
+
     def _build_register_frame(self) -> None:
         self.register_frame = ctk.CTkFrame(self.auth_stack, fg_color="transparent")
         self.register_frame.grid(row=0, column=0, sticky="nsew")
         self.register_frame.grid_columnconfigure(0, weight=1)
 
-        self.register_title_label = ctk.CTkLabel(self.register_frame, text=self._auth_t("register_title"), font=ctk.CTkFont(size=18, weight="bold"), text_color="#f8fafc")
+        self.register_title_label = ctk.CTkLabel(self.register_frame, text=self._auth_t("register_title"), font=self._font_label_bold, text_color="#f8fafc")
         self.register_title_label.grid(row=0, column=0, sticky="w", pady=(0, 12))
 
         self.register_step1 = ctk.CTkFrame(self.register_frame, fg_color="transparent")
@@ -3392,23 +3660,33 @@ class App(ctk.CTk):
         self.reg_form.grid(row=0, column=0, sticky="nsew")
         self.reg_form.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("full_name"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=1, column=0, sticky="w", pady=(0, 4))
-        ctk.CTkEntry(self.reg_form, textvariable=self.reg_full_name, placeholder_text=self._auth_t("full_name"), placeholder_text_color="#64748b").grid(row=2, column=0, sticky="ew", pady=(0, 10))
+        self._mk_field_label(self.reg_form, 1, self._auth_t("full_name"))
+        ent = ctk.CTkEntry(self.reg_form, textvariable=self.reg_full_name, placeholder_text=self._auth_t("full_name"), placeholder_text_color="#64748b")
+        ent.grid(row=2, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(ent, self.reg_full_name)
 
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("display_name"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=3, column=0, sticky="w", pady=(0, 4))
-        ctk.CTkEntry(self.reg_form, textvariable=self.reg_display, placeholder_text=self._auth_t("display_name"), placeholder_text_color="#64748b").grid(row=4, column=0, sticky="ew", pady=(0, 10))
+        self._mk_field_label(self.reg_form, 3, self._auth_t("display_name"))
+        ent = ctk.CTkEntry(self.reg_form, textvariable=self.reg_display, placeholder_text=self._auth_t("display_name"), placeholder_text_color="#64748b")
+        ent.grid(row=4, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(ent, self.reg_display)
 
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("username"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=5, column=0, sticky="w", pady=(0, 4))
-        ctk.CTkEntry(self.reg_form, textvariable=self.reg_username, placeholder_text=self._auth_t("username"), placeholder_text_color="#64748b").grid(row=6, column=0, sticky="ew", pady=(0, 10))
+        self._mk_field_label(self.reg_form, 5, self._auth_t("username"))
+        ent = ctk.CTkEntry(self.reg_form, textvariable=self.reg_username, placeholder_text=self._auth_t("username"), placeholder_text_color="#64748b")
+        ent.grid(row=6, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(ent, self.reg_username)
 
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("email"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=7, column=0, sticky="w", pady=(0, 4))
-        ctk.CTkEntry(self.reg_form, textvariable=self.reg_email, placeholder_text=self._auth_t("email"), placeholder_text_color="#64748b").grid(row=8, column=0, sticky="ew", pady=(0, 10))
+        self._mk_field_label(self.reg_form, 7, self._auth_t("email"))
+        ent = ctk.CTkEntry(self.reg_form, textvariable=self.reg_email, placeholder_text=self._auth_t("email"), placeholder_text_color="#64748b")
+        ent.grid(row=8, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(ent, self.reg_email)
 
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("phone"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=9, column=0, sticky="w", pady=(0, 4))
-        ctk.CTkEntry(self.reg_form, textvariable=self.reg_phone, placeholder_text=self._auth_t("phone"), placeholder_text_color="#64748b").grid(row=10, column=0, sticky="ew", pady=(0, 10))
+        self._mk_field_label(self.reg_form, 9, self._auth_t("phone"))
+        ent = ctk.CTkEntry(self.reg_form, textvariable=self.reg_phone, placeholder_text=self._auth_t("phone"), placeholder_text_color="#64748b")
+        ent.grid(row=10, column=0, sticky="ew", pady=(0, 10))
+        self._trim_on_focus_out(ent, self.reg_phone)
 
         pw_wrap = ctk.CTkFrame(self.reg_form, fg_color="transparent")
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("password"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=11, column=0, sticky="w", pady=(0, 4))
+        self._mk_field_label(self.reg_form, 11, self._auth_t("password"))
         pw_wrap.grid(row=12, column=0, sticky="ew", pady=(0, 8))
         pw_wrap.grid_columnconfigure(0, weight=1)
         self.reg_password_entry = ctk.CTkEntry(pw_wrap, textvariable=self.reg_password, placeholder_text=self._auth_t("password"), show="*")
@@ -3421,12 +3699,12 @@ class App(ctk.CTk):
         )
         self.reg_show_pwd_chk.grid(row=0, column=1, padx=(10, 0))
 
-        self.pwd_strength_label = ctk.CTkLabel(self.reg_form, text=f"{self._auth_t('pwd_strength')} {self._auth_password_strength('')}", text_color="#94a3b8")
+        self.pwd_strength_label = ctk.CTkLabel(self.reg_form, text=f"{self._s_pwd_strength_prefix} {self._auth_password_strength('')}", text_color=self._LABEL_COLOR)
         self.pwd_strength_label.grid(row=13, column=0, sticky="w", pady=(0, 8))
-        self.reg_password.trace_add("write", lambda *_: self.pwd_strength_label.configure(text=f"{self._auth_t('pwd_strength')} {self._auth_password_strength(self.reg_password.get())}"))
+        self.reg_password.trace_add("write", self._schedule_pwd_strength)
 
         conf_wrap = ctk.CTkFrame(self.reg_form, fg_color="transparent")
-        ctk.CTkLabel(self.reg_form, text=self._auth_t("confirm_password"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=14, column=0, sticky="w", pady=(0, 4))
+        self._mk_field_label(self.reg_form, 14, self._auth_t("confirm_password"))
         conf_wrap.grid(row=15, column=0, sticky="ew", pady=(0, 8))
         conf_wrap.grid_columnconfigure(0, weight=1)
         self.reg_confirm_entry = ctk.CTkEntry(conf_wrap, textvariable=self.reg_confirm, placeholder_text=self._auth_t("confirm_password"), show="*")
@@ -3452,11 +3730,15 @@ class App(ctk.CTk):
         self.btn_go_login = ctk.CTkButton(self.reg_btn_bar, text=self._auth_t("btn_to_login"), fg_color="#1e293b", hover_color="#334155", command=self._show_login)
         self.btn_go_login.grid(row=1, column=0, sticky="ew")
 
+        # Step 2 (OTP) widgets are built on first use; most sessions only log in.
+        self._reg_step2_built = False
+
+    def _build_register_step2(self) -> None:
         self.otp_code_var = tk.StringVar(value="")
         self.otp_countdown_var = tk.StringVar(value="")
         self.otp_hint_var = tk.StringVar(value="")
 
-        self.otp_title_label = ctk.CTkLabel(self.register_step2, text=self._auth_t("otp_title"), font=ctk.CTkFont(size=16, weight="bold"), text_color="#f8fafc")
+        self.otp_title_label = ctk.CTkLabel(self.register_step2, text=self._auth_t("otp_title"), font=self._font_h2, text_color="#f8fafc")
         self.otp_title_label.grid(row=0, column=0, sticky="w", pady=(0, 8))
         self.otp_sent_label = ctk.CTkLabel(self.register_step2, text=self._auth_t("otp_sent"), text_color="#94a3b8")
         self.otp_sent_label.grid(row=1, column=0, sticky="w", pady=(0, 10))
@@ -3464,7 +3746,7 @@ class App(ctk.CTk):
         self.otp_hint_label = ctk.CTkLabel(self.register_step2, textvariable=self.otp_hint_var, text_color="#64748b")
         self.otp_hint_label.grid(row=2, column=0, sticky="w", pady=(0, 10))
 
-        ctk.CTkLabel(self.register_step2, text=self._auth_t("otp_code"), text_color="#94a3b8", font=ctk.CTkFont(family=self._get_ui_font_family(), size=11)).grid(row=3, column=0, sticky="w", pady=(0, 4))
+        self._mk_field_label(self.register_step2, 3, self._auth_t("otp_code"))
         self.otp_entry = ctk.CTkEntry(self.register_step2, textvariable=self.otp_code_var, placeholder_text=self._auth_t("otp_code"), placeholder_text_color="#64748b")
         self.otp_entry.grid(row=4, column=0, sticky="ew", pady=(0, 8))
 
@@ -3484,9 +3766,24 @@ class App(ctk.CTk):
         self.btn_otp_verify = ctk.CTkButton(self.register_step2, text=self._auth_t("otp_verify"), fg_color="#7c3aed", hover_color="#6d28d9", command=self._reg_verify_otp)
         self.btn_otp_verify.grid(row=7, column=0, sticky="ew", pady=(12, 0))
 
+    def _schedule_pwd_strength(self, *_) -> None:
+        # Coalesce bursts of keystrokes (or a paste) into a single strength recalculation.
+        if self._pwd_after_id is not None:
+            try:
+                self.after_cancel(self._pwd_after_id)
+            except Exception:
+                pass
+        self._pwd_after_id = self.after(120, self._apply_pwd_strength)
+
+    def _apply_pwd_strength(self) -> None:
+        self._pwd_after_id = None
+        try:
+            self.pwd_strength_label.configure(text=f"{self._s_pwd_strength_prefix} {self._auth_password_strength(self.reg_password.get())}")
+        except Exception:
+            pass
+
     def _reg_next_step(self) -> None:
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
 
         full_name = self.reg_full_name.get().strip()
         display = self.reg_display.get().strip()
@@ -3515,6 +3812,10 @@ class App(ctk.CTk):
             "password": password,
         }
 
+        if not self._reg_step2_built:
+            self._build_register_step2()
+            self._reg_step2_built = True
+            self._update_auth_toggle_widgets()
         self._reg_send_otp()
         self.register_step1.grid_remove()
         self.register_step2.grid()
@@ -3525,8 +3826,9 @@ class App(ctk.CTk):
 
     def _reg_back_step1(self) -> None:
         self._pending_register = None
-        self._otp_code = None
-        self._otp_expires_at = 0
+        self._otp_code_digest = None
+        self._otp_deadline = 0.0
+        self._otp_last_remain = -1
         if self._otp_after_id is not None:
             try:
                 self.after_cancel(self._otp_after_id)
@@ -3540,17 +3842,21 @@ class App(ctk.CTk):
         self.register_step1.grid()
 
     def _reg_send_otp(self) -> None:
-        self._otp_code = f"{secrets.randbelow(1_000_000):06d}"
-        self._otp_expires_at = int(time.time()) + 120
+        if self._otp_after_id is not None:
+            try:
+                self.after_cancel(self._otp_after_id)
+            except Exception:
+                pass
+            self._otp_after_id = None
+        code = str(secrets.randbelow(1_000_000)).zfill(6)
+        # Only the digest is kept; the plaintext lives on just long enough for the demo hint.
+        self._otp_code_digest = hashlib.sha256(code.encode()).digest()
+        self._otp_deadline = time.monotonic() + 120
+        self._otp_last_remain = -1
         self.otp_code_var.set("")
-        phone = ""
-        try:
-            if self._pending_register:
-                phone = str(self._pending_register.get("phone") or "")
-        except Exception:
-            phone = ""
+        phone = str(self._pending_register.get("phone") or "") if self._pending_register else ""
         # Demo/offline: show OTP hint in UI
-        self.otp_hint_var.set(f"Demo OTP for {phone}: {self._otp_code}")
+        self.otp_hint_var.set(self._s_otp_demo_hint.format(phone=phone, code=code))
         self._reg_update_otp_countdown()
 
     def _reg_resend_otp(self) -> None:
@@ -3559,103 +3865,97 @@ class App(ctk.CTk):
         self._reg_send_otp()
 
     def _reg_update_otp_countdown(self) -> None:
-        if self._otp_after_id is not None:
+        self._otp_after_id = None
+        left = self._otp_deadline - time.monotonic()
+        remain = max(0, int(left))
+        if remain != self._otp_last_remain:
+            self._otp_last_remain = remain
             try:
-                self.after_cancel(self._otp_after_id)
+                self.otp_countdown_var.set(self._s_expires_in.format(s=remain))
             except Exception:
-                pass
-            self._otp_after_id = None
-
-        remain = max(0, int(self._otp_expires_at - time.time()))
-        try:
-            self.otp_countdown_var.set(self._auth_t("expires_in").format(s=remain))
-        except Exception:
-            self.otp_countdown_var.set(f"Expires in {remain}s")
+                self.otp_countdown_var.set(f"Expires in {remain}s")
         if remain <= 0:
             return
-        self._otp_after_id = self.after(1000, self._reg_update_otp_countdown)
+        # Wake up just after the displayed second rolls over rather than on a fixed 1s beat.
+        self._otp_after_id = self.after(max(50, int((left - remain) * 1000) + 10), self._reg_update_otp_countdown)
 
     def _reg_verify_otp(self) -> None:
         if self._pending_register is None:
             return
-        code = self.otp_code_var.get().strip()
-        now = int(time.time())
-        if (not self._otp_code) or (now > int(self._otp_expires_at)) or (code != self._otp_code):
-            self._auth_error_text.set(self._auth_t("otp_invalid"))
+        cand = hashlib.sha256(self.otp_code_var.get().strip().encode()).digest()
+        if (not self._otp_code_digest) or (time.monotonic() > self._otp_deadline) or (not hmac.compare_digest(cand, self._otp_code_digest)):
+            self._auth_error_text.set(self._s_otp_invalid)
             return
 
         data = dict(self._pending_register)
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
         self._auth_set_loading(True)
 
-        def worker() -> None:
-            pw_hash, pw_salt = self._auth_hash_password(str(data.get("password") or ""))
-            now2 = int(time.time())
-            ok = False
-            try:
-                ok = bool(
-                    self._auth_store.create_user(
-                        (data.get("full_name") or None),
-                        str(data.get("display") or ""),
-                        str(data.get("username") or ""),
-                        str(data.get("email") or ""),
-                        str(data.get("phone") or "") or None,
-                        pw_hash,
-                        pw_salt,
-                        now2,
-                    )
-                )
-            except Exception:
-                ok = False
-            if not ok:
-                self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_exists")), self._auth_set_loading(False)))
-                return
+        def finish() -> None:
+            self._auth_set_loading(False)
+            self._pending_register = None
+            self._otp_code_digest = None
+            self._otp_deadline = 0.0
+            self._auth_status_text.set(self._s_ok_register)
+            self._show_login()
 
-            def finish() -> None:
-                self._auth_set_loading(False)
-                self._pending_register = None
-                self._otp_code = None
-                self._otp_expires_at = 0
-                self._auth_status_text.set(self._auth_t("ok_register"))
-                self._show_login()
+        self._auth_pool.submit(self._auth_create_user_worker, data, finish)
 
-            self.after(0, finish)
+    def _auth_create_user_worker(self, data: dict, on_finish) -> None:
+        # Runs on the auth pool; on_finish is scheduled on the Tk thread after a successful insert.
+        pw_hash, pw_salt = self._auth_hash_password(str(data.get("password") or ""))
+        now = int(time.time())
+        ok = False
+        try:
+            ok = bool(
+                self._auth_store.create_user(
+                    (data.get("full_name") or None),
+                    str(data.get("display") or ""),
+                    str(data.get("username") or ""),
+                    str(data.get("email") or ""),
+                    str(data.get("phone") or "") or None,
+                    pw_hash,
+                    pw_salt,
+                    now,
+                )
+            )
+        except Exception:
+            ok = False
+        if not ok:
+            self.after(0, lambda: (self._auth_error_text.set(self._s_err_exists), self._auth_set_loading(False)))
+            return
+        self.after(0, on_finish)
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _clear_auth_msgs(self) -> None:
+        # Skip redundant StringVar writes; each one fires traces and a label redraw.
+        if self._auth_error_text.get():
+            self._auth_error_text.set("")
+        if self._auth_status_text.get():
+            self._auth_status_text.set("")
 
     def _auth_set_loading(self, loading: bool) -> None:
         self._auth_loading.set(bool(loading))
-        try:
-            if loading:
-                self.auth_loader_text.configure(text=self._auth_t("processing"))
-                self.auth_loader_row.grid()
-                self.auth_loader.start()
-            else:
-                self.auth_loader.stop()
-                self.auth_loader_row.grid_remove()
-                self.auth_loader_text.configure(text="")
-        except Exception:
-            pass
-        for name in (
-            "btn_login",
-            "btn_register",
-            "btn_next_step",
-            "btn_go_register",
-            "btn_go_login",
-            "btn_otp_back",
-            "btn_otp_resend",
-            "btn_otp_verify",
-        ):
-            try:
-                w = getattr(self, name)
-                w.configure(state="disabled" if loading else "normal")
-            except Exception:
-                pass
+        # Every widget touched here is created by _build_auth_ui before any handler can run.
+        if loading:
+            self.auth_loader_text.configure(text=self._s_processing)
+            self.auth_loader_row.grid()
+            self.auth_loader.start()
+        else:
+            self.auth_loader.stop()
+            self.auth_loader_row.grid_remove()
+            self.auth_loader_text.configure(text="")
+        state = "disabled" if loading else "normal"
+        for w in self._auth_toggle_widgets:
+            w.configure(state=state)
+
+    def _update_auth_toggle_widgets(self) -> None:
+        widgets = [self.btn_login, self.btn_next_step, self.btn_go_register, self.btn_go_login]
+        if self._reg_step2_built:
+            widgets += [self.btn_otp_back, self.btn_otp_resend, self.btn_otp_verify]
+        self._auth_toggle_widgets = tuple(widgets)
 
     def _show_login(self) -> None:
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
         try:
             self.register_frame.grid_remove()
         except Exception:
@@ -3663,8 +3963,7 @@ class App(ctk.CTk):
         self.login_frame.grid()
 
     def _show_register(self) -> None:
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
         try:
             self.login_frame.grid_remove()
         except Exception:
@@ -3690,9 +3989,9 @@ class App(ctk.CTk):
             pass
 
     def _clear_session(self) -> None:
+        self._session_cache = None
         try:
-            if os.path.exists(self._session_path):
-                os.remove(self._session_path)
+            os.remove(self._session_path)
         except Exception:
             pass
         try:
@@ -3706,20 +4005,34 @@ class App(ctk.CTk):
         token = secrets.token_urlsafe(32)
         now = int(time.time())
         expires = now + (30 * 24 * 3600)
-        try:
-            self._auth_store.save_session(token=token, user_id=int(user_id), created_at=now, expires_at=expires)
-        except Exception:
-            pass
-        try:
-            with open(self._session_path, "w", encoding="utf-8") as f:
-                f.write(token)
-        except Exception:
-            pass
+        uid = int(user_id)
+        path = self._session_path
+
+        def worker() -> None:
+            try:
+                self._auth_store.save_session(token=token, user_id=uid, created_at=now, expires_at=expires)
+            except Exception:
+                pass
+            # Write to a temp file and swap it in so a crash never leaves a truncated token.
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(token)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, path)
+            except Exception:
+                pass
+
+        self._auth_pool.submit(worker)
 
     def _try_restore_session(self) -> None:
+        cached = self._session_cache
+        if cached is not None and time.monotonic() - self._session_cache_at < self._SESSION_CACHE_TTL:
+            self._set_authenticated(dict(cached[1]))
+            return
+
         try:
-            if not os.path.exists(self._session_path):
-                return
             with open(self._session_path, "r", encoding="utf-8") as f:
                 token = f.read().strip()
             if not token:
@@ -3733,6 +4046,8 @@ class App(ctk.CTk):
             if not user:
                 self._clear_session()
                 return
+            self._session_cache = (token, dict(user))
+            self._session_cache_at = time.monotonic()
             self._set_authenticated(dict(user))
         except Exception:
             return
@@ -3935,8 +4250,7 @@ class App(ctk.CTk):
         w.bind("<Escape>", lambda _e: w.destroy())
 
     def _do_register(self) -> None:
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
         self._auth_set_loading(True)
 
         full_name = self.reg_full_name.get().strip()
@@ -3948,35 +4262,36 @@ class App(ctk.CTk):
         confirm = self.reg_confirm.get()
         terms_ok = bool(self.reg_terms.get())
 
+        data = {
+            "full_name": full_name,
+            "display": display,
+            "username": username,
+            "email": email,
+            "phone": phone,
+            "password": password,
+        }
+
         def worker() -> None:
             err = self._auth_validate_register(display, username, email, password, confirm, terms_ok)
             if err:
                 self.after(0, lambda: (self._auth_error_text.set(err), self._auth_set_loading(False)))
                 return
-            pw_hash, pw_salt = self._auth_hash_password(password)
-            now = int(time.time())
-            ok = False
-            try:
-                ok = bool(self._auth_store.create_user(full_name or None, display, username, email, phone or None, pw_hash, pw_salt, now))
-            except Exception:
-                ok = False
-            if not ok:
-                self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_exists")), self._auth_set_loading(False)))
-                return
-            self.after(0, lambda: (self._auth_status_text.set(self._auth_t("ok_register")), self._auth_set_loading(False), self._show_login()))
+            self._auth_create_user_worker(
+                data,
+                lambda: (self._auth_status_text.set(self._s_ok_register), self._auth_set_loading(False), self._show_login()),
+            )
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._auth_pool.submit(worker)
 
     def _do_login(self) -> None:
-        self._auth_error_text.set("")
-        self._auth_status_text.set("")
+        self._clear_auth_msgs()
         self._auth_set_loading(True)
 
         ident = self.login_user.get().strip()
         password = self.login_pass.get()
         remember = bool(self.remember_me.get())
         if not ident or not password:
-            self._auth_error_text.set(self._auth_t("err_login_invalid"))
+            self._auth_error_text.set(self._s_err_login_invalid)
             self._auth_set_loading(False)
             return
 
@@ -3984,18 +4299,18 @@ class App(ctk.CTk):
             try:
                 row = self._auth_store.get_user_by_ident(ident)
                 if not row:
-                    self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_login_invalid")), self._auth_set_loading(False)))
+                    self.after(0, lambda: (self._auth_error_text.set(self._s_err_login_invalid), self._auth_set_loading(False)))
                     return
 
                 now = int(time.time())
-                if int(row.get("lock_until") or 0) > now:
-                    self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_locked")), self._auth_set_loading(False)))
+                lock_until = int(row.get("lock_until") or 0)
+                if lock_until > now:
+                    self.after(0, lambda: (self._auth_error_text.set(self._s_err_locked), self._auth_set_loading(False)))
                     return
 
                 ok = self._auth_verify_password(password, str(row.get("pw_hash")), str(row.get("pw_salt")))
                 if not ok:
                     attempts = int(row.get("failed_attempts") or 0) + 1
-                    lock_until = int(row.get("lock_until") or 0)
                     if attempts >= 5:
                         lock_until = now + 5 * 60
                         attempts = 0
@@ -4003,7 +4318,7 @@ class App(ctk.CTk):
                         self._auth_store.increment_failed_attempt(int(row.get("id") or 0), attempts, lock_until)
                     except Exception:
                         pass
-                    self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_login_pwd")), self._auth_set_loading(False)))
+                    self.after(0, lambda: (self._auth_error_text.set(self._s_err_login_pwd), self._auth_set_loading(False)))
                     return
 
                 try:
@@ -4018,7 +4333,7 @@ class App(ctk.CTk):
                     "email": str(row.get("email") or ""),
                 }
             except Exception:
-                self.after(0, lambda: (self._auth_error_text.set(self._auth_t("err_login_invalid")), self._auth_set_loading(False)))
+                self.after(0, lambda: (self._auth_error_text.set(self._s_err_login_invalid), self._auth_set_loading(False)))
                 return
 
             def finish() -> None:
@@ -4031,7 +4346,7 @@ class App(ctk.CTk):
 
             self.after(0, finish)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._auth_pool.submit(worker)
 
     def logout(self) -> None:
         user = self._current_user or {}
@@ -4045,12 +4360,13 @@ class App(ctk.CTk):
             except Exception:
                 pass
         self._current_user = None
+        self._ctk_image_cache.clear()
         try:
             self._close_profile_popup()
         except Exception:
             pass
         try:
-            self._close_profile_modal()
+            self._destroy_profile_modal()
         except Exception:
             pass
         self._clear_session()
@@ -4084,19 +4400,39 @@ class App(ctk.CTk):
         x = self.btn_profile.winfo_rootx()
         y = self.btn_profile.winfo_rooty() + self.btn_profile.winfo_height() + 6
 
-        pop = ctk.CTkToplevel(self)
+        w = 180
+        h = 86
+        pop = self._profile_popup_win
+        try:
+            if pop is None or not pop.winfo_exists():
+                pop = self._build_profile_popup()
+        except Exception:
+            pop = self._build_profile_popup()
         self._profile_popup = pop
+
+        try:
+            pop.attributes("-alpha", 0.0)
+        except Exception:
+            pass
+        pop.geometry(f"{w}x{h}+{x}+{y - 10}")
+        pop.deiconify()
+        try:
+            pop.focus_force()
+        except Exception:
+            pass
+
+        self._animate_profile_popup(target_x=x, target_y=y)
+
+    def _build_profile_popup(self) -> ctk.CTkToplevel:
+        # Built once and then withdrawn/deiconified; see _close_profile_popup.
+        pop = ctk.CTkToplevel(self)
+        self._profile_popup_win = pop
         pop.withdraw()
         pop.overrideredirect(True)
         try:
             pop.attributes("-topmost", True)
-            pop.attributes("-alpha", 0.0)
         except Exception:
             pass
-
-        w = 180
-        h = 86
-        pop.geometry(f"{w}x{h}+{x}+{y - 10}")
         pop.configure(fg_color="#0f172a")
 
         card = ctk.CTkFrame(pop, fg_color="#111827", corner_radius=12, border_width=1, border_color="#1f2937")
@@ -4122,25 +4458,37 @@ class App(ctk.CTk):
             command=lambda: (self._close_profile_popup(), self.logout()),
         ).pack(fill="x", padx=10, pady=(0, 10))
 
-        pop.deiconify()
-        try:
-            pop.focus_force()
-        except Exception:
-            pass
-
         pop.bind("<Escape>", lambda _e: self._close_profile_popup())
         pop.bind("<FocusOut>", lambda _e: self._close_profile_popup())
         pop.bind("<Button-1>", lambda _e: None)
-        self.bind("<Button-1>", self._on_root_click_close_profile, add=True)
-
-        self._animate_profile_popup(target_x=x, target_y=y)
+        return pop
 
     def _open_profile_modal(self) -> None:
         if not self._current_user:
             return
-        if self._profile_modal is not None:
+        w = 520
+        h = 300
+        win = self._profile_modal
+        if win is not None:
+            try:
+                if not win.winfo_exists():
+                    win = None
+            except Exception:
+                win = None
+        if win is not None:
+            # Reuse the hidden window; only the user-dependent labels change.
+            try:
+                x = self.winfo_rootx() + (self.winfo_width() // 2) - (w // 2)
+                y = self.winfo_rooty() + (self.winfo_height() // 2) - (h // 2)
+                win.geometry(f"+{x}+{y}")
+            except Exception:
+                pass
+            self._refresh_profile_modal(self._current_user)
             try:
-                self._profile_modal.focus_force()
+                win.deiconify()
+                win.lift()
+                win.grab_set()
+                win.focus_force()
             except Exception:
                 pass
             return
@@ -4153,8 +4501,6 @@ class App(ctk.CTk):
         except Exception:
             pass
 
-        w = 520
-        h = 300
         try:
             x = self.winfo_rootx() + (self.winfo_width() // 2) - (w // 2)
             y = self.winfo_rooty() + (self.winfo_height() // 2) - (h // 2)
@@ -4173,18 +4519,22 @@ class App(ctk.CTk):
         card.pack(fill="both", expand=True, padx=16, pady=16)
         card.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(card, text="👤 Global Account Sync", font=ctk.CTkFont(size=18, weight="bold"), text_color="#f8fafc").grid(
+        ctk.CTkLabel(card, text="👤 Global Account Sync", font=self._font_label_bold, text_color="#f8fafc").grid(
             row=0, column=0, sticky="w", padx=20, pady=(20, 10)
         )
         
         user = self._current_user or {}
+        # Username, email and id are fixed for the window's lifetime (it is destroyed on logout).
+        un = str(user.get("username", ""))
+        em = str(user.get("email", ""))
+        uid_s = str(user.get("id", ""))
 
         header = ctk.CTkFrame(card, fg_color="transparent")
         header.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 10))
         header.grid_columnconfigure(1, weight=1)
 
         try:
-            uid = int(user.get("id"))
+            uid = int(uid_s)
         except Exception:
             uid = 0
 
@@ -4196,27 +4546,30 @@ class App(ctk.CTk):
         def pick_pic() -> None:
             if not uid:
                 return
-            p = filedialog.askopenfilename(filetypes=[("Images", "*.png;*.jpg;*.jpeg;*.webp;*.bmp"), ("All files", "*.*")])
+            p = filedialog.askopenfilename(filetypes=_IMAGE_FILETYPES)
             if not p:
                 return
-            try:
-                img = Image.open(p).convert("RGBA")
-                out_p = self._profile_pic_path(uid)
-                img.save(out_p, format="PNG")
-                self._profile_pic_ctk = ctk.CTkImage(light_image=img, dark_image=img, size=(56, 56))
+            out_p = self._profile_pic_path(uid)
+            thumbs = [(self._profile_thumb_path(uid, 56 * m), (56 * m, 56 * m)) for m in (1, 2)]
+            show_idx = 1 if self._dpi > 1.0 else 0
+            # Decoding and resampling a large photo would stall the Tk loop; the
+            # result comes back through <<ProfilePicReady>>.
+            fut = _IO_POOL.submit(_decode_and_resize, p, out_p, thumbs)
+
+            def _done(f: concurrent.futures.Future) -> None:
+                with self._profile_pic_pending_lock:
+                    self._profile_pic_pending = (out_p, [t[0] for t in thumbs], show_idx, f)
                 try:
-                    self._profile_pic_label.configure(image=self._profile_pic_ctk)
-                except Exception:
-                    pass
-            except Exception:
-                try:
-                    messagebox.showerror("Profile", "Failed to set profile picture")
+                    self.event_generate("<<ProfilePicReady>>", when="tail")
                 except Exception:
                     pass
 
-        ctk.CTkLabel(header, text=str(user.get("display_name", "Guest")), text_color="#e2e8f0", font=ctk.CTkFont(size=14, weight="bold")).grid(
-            row=0, column=1, sticky="w", padx=(12, 0)
-        )
+            fut.add_done_callback(_done)
+
+        widgets = self._profile_modal_widgets
+        widgets.clear()
+        widgets["name"] = ctk.CTkLabel(header, text="", text_color="#e2e8f0", font=self._font_name_bold)
+        widgets["name"].grid(row=0, column=1, sticky="w", padx=(12, 0))
         ctk.CTkButton(
             header,
             text="Upload Picture",
@@ -4229,10 +4582,15 @@ class App(ctk.CTk):
         info_f = ctk.CTkFrame(card, fg_color="transparent")
         info_f.grid(row=2, column=0, sticky="ew", padx=20, pady=10)
         
-        ctk.CTkLabel(info_f, text=f"Display Name: {user.get('display_name', 'Guest')}", text_color="#94a3b8").grid(row=0, column=0, sticky="w")
-        ctk.CTkLabel(info_f, text=f"Username: {user.get('username', 'n/a')}", text_color="#94a3b8").grid(row=1, column=0, sticky="w")
-        ctk.CTkLabel(info_f, text=f"Email: {user.get('email', 'n/a')}", text_color="#94a3b8").grid(row=2, column=0, sticky="w")
-        ctk.CTkLabel(info_f, text="Status: Beta Elite v1.0.0", text_color="#10b981").grid(row=3, column=0, sticky="w", pady=(2, 0))
+        widgets["display_name"] = ctk.CTkLabel(info_f, text="", text_color="#94a3b8")
+        widgets["display_name"].grid(row=0, column=0, sticky="w")
+        widgets["username"] = ctk.CTkLabel(info_f, text="", text_color="#94a3b8")
+        widgets["username"].grid(row=1, column=0, sticky="w")
+        widgets["email"] = ctk.CTkLabel(info_f, text="", text_color="#94a3b8")
+        widgets["email"].grid(row=2, column=0, sticky="w")
+        widgets["status"] = ctk.CTkLabel(info_f, text="", text_color="#10b981")
+        widgets["status"].grid(row=3, column=0, sticky="w", pady=(2, 0))
+        self._refresh_profile_modal(user)
 
         actions = ctk.CTkFrame(card, fg_color="transparent")
         actions.grid(row=3, column=0, sticky="ew", padx=20, pady=(6, 0))
@@ -4280,21 +4638,21 @@ class App(ctk.CTk):
             text="Copy Username",
             fg_color="#334155",
             hover_color="#475569",
-            command=lambda: self._profile_copy_to_clipboard(str(user.get("username", ""))),
+            command=functools.partial(self._profile_copy_to_clipboard, un),
         ).grid(row=0, column=0, sticky="ew", padx=(0, 8))
         ctk.CTkButton(
             extras,
             text="Copy Email",
             fg_color="#334155",
             hover_color="#475569",
-            command=lambda: self._profile_copy_to_clipboard(str(user.get("email", ""))),
+            command=functools.partial(self._profile_copy_to_clipboard, em),
         ).grid(row=0, column=1, sticky="ew", padx=(0, 8))
         ctk.CTkButton(
             extras,
             text="Copy User ID",
             fg_color="#334155",
             hover_color="#475569",
-            command=lambda: self._profile_copy_to_clipboard(str(user.get("id", ""))),
+            command=functools.partial(self._profile_copy_to_clipboard, uid_s),
         ).grid(row=0, column=2, sticky="ew")
 
         ctk.CTkButton(
@@ -4329,19 +4687,95 @@ class App(ctk.CTk):
         win.bind("<Escape>", lambda _e: self._close_profile_modal())
         win.protocol("WM_DELETE_WINDOW", self._close_profile_modal)
 
+    def _refresh_profile_modal(self, user: dict | None) -> None:
+        user = user or {}
+        widgets = self._profile_modal_widgets
+        dn = str(user.get("display_name", "Guest"))
+        un = str(user.get("username", "n/a"))
+        em = str(user.get("email", "n/a"))
+        texts = (
+            ("name", dn),
+            ("display_name", "Display Name: " + dn),
+            ("username", "Username: " + un),
+            ("email", "Email: " + em),
+            ("status", "Status: Beta Elite v1.0.0"),
+        )
+        for key, text in texts:
+            lbl = widgets.get(key)
+            if lbl is None:
+                continue
+            try:
+                lbl.configure(text=text)
+            except Exception:
+                pass
+        try:
+            uid = int(user.get("id"))
+        except Exception:
+            uid = 0
+        if uid and self._profile_pic_label is not None:
+            self._profile_pic_ctk = self._load_profile_pic_ctk(uid, (56, 56))
+            try:
+                self._profile_pic_label.configure(image=self._profile_pic_ctk)
+            except Exception:
+                pass
+
+    def _on_profile_pic_ready(self, _event=None) -> None:
+        with self._profile_pic_pending_lock:
+            pending = self._profile_pic_pending
+            self._profile_pic_pending = None
+        if pending is None:
+            return
+        out_p, thumb_paths, show_idx, fut = pending
+        for path in (out_p, *thumb_paths):
+            self._invalidate_ctk_image(path)
+        try:
+            images = fut.result()
+        except Exception:
+            try:
+                messagebox.showerror("Profile", "Failed to set profile picture")
+            except Exception:
+                pass
+            return
+        lbl = self._profile_pic_label
+        try:
+            if lbl is None or not lbl.winfo_exists():
+                return
+        except Exception:
+            return
+        try:
+            img = images[show_idx]
+            self._profile_pic_ctk = ctk.CTkImage(light_image=img, dark_image=img, size=(56, 56))
+            lbl.configure(image=self._profile_pic_ctk)
+        except Exception:
+            pass
+
     def _close_profile_modal(self) -> None:
+        # Hide rather than destroy so the next open skips widget construction.
+        win = self._profile_modal
+        if win is None:
+            return
+        with _SUPPRESS:
+            win.grab_release()
+        with _SUPPRESS:
+            win.withdraw()
+
+    def _destroy_profile_modal(self) -> None:
         win = self._profile_modal
         self._profile_modal = None
+        self._profile_modal_widgets.clear()
+        self._profile_pic_label = None
+        self._profile_pic_ctk = None
         if win is None:
             return
-        try:
+        with _SUPPRESS:
             win.grab_release()
-        except Exception:
-            pass
-        try:
+        with _SUPPRESS:
             win.destroy()
-        except Exception:
-            pass
+
+    def _on_root_click_dispatch(self, event: tk.Event) -> None:
+        if self._profile_popup is None:
+            return
+        self._on_root_click_close_profile(event)
 
     def _on_root_click_close_profile(self, event: tk.Event) -> None:
         if self._profile_popup is None:
@@ -4356,24 +4790,16 @@ class App(ctk.CTk):
 
     def _close_profile_popup(self) -> None:
         if self._profile_popup_anim_after is not None:
-            try:
+            with _SUPPRESS:
                 self.after_cancel(self._profile_popup_anim_after)
-            except Exception:
-                pass
             self._profile_popup_anim_after = None
 
         pop = self._profile_popup
         self._profile_popup = None
-        try:
-            self.unbind("<Button-1>", funcid=None)
-        except Exception:
-            pass
         if pop is None:
             return
-        try:
-            pop.destroy()
-        except Exception:
-            pass
+        with _SUPPRESS:
+            pop.withdraw()
 
     def _animate_profile_popup(self, target_x: int, target_y: int) -> None:
         pop = self._profile_popup
@@ -4382,51 +4808,93 @@ class App(ctk.CTk):
 
         steps = 8
         duration_ms = 140
+        interval = max(1, duration_ms // steps)
         start_y = target_y - 10
-        dy = (target_y - start_y) / float(steps)
-
-        def step(i: int) -> None:
-            p = self._profile_popup
-            if p is None:
+        frames = [
+            (target_x, int(start_y + (target_y - start_y) * i / steps), min(1.0, i / float(steps)))
+            for i in range(steps + 1)
+        ]
+        # Talk to the window manager directly; CTk's geometry()/attributes() wrappers add dispatch per frame.
+        call = pop.tk.call
+        path = str(pop)
+        t0 = time.perf_counter()
+        last_alpha = -1.0
+
+        def _step(i: int) -> None:
+            nonlocal last_alpha
+            if self._profile_popup is not pop:
                 return
-            new_y = int(start_y + dy * i)
-            try:
-                p.geometry(f"+{target_x}+{new_y}")
-            except Exception:
-                pass
-            try:
-                p.attributes("-alpha", min(1.0, i / float(steps)))
-            except Exception:
-                pass
+            # If the event loop fell behind, jump to the frame we should be on instead of queueing up.
+            due = int((time.perf_counter() - t0) * 1000) // interval
+            i = max(i, min(due, steps))
+            x, y, alpha = frames[i]
+            with _SUPPRESS:
+                call("wm", "geometry", path, f"+{x}+{y}")
+            if i == steps or alpha - last_alpha >= 0.05:
+                with _SUPPRESS:
+                    call("wm", "attributes", path, "-alpha", alpha)
+                    last_alpha = alpha
 
             if i < steps:
-                self._profile_popup_anim_after = self.after(max(1, duration_ms // steps), lambda: step(i + 1))
+                self._profile_popup_anim_after = self.after(interval, functools.partial(_step, i + 1))
             else:
                 self._profile_popup_anim_after = None
 
-        step(0)
+        _step(0)
+
+    def _sync_clipboard_enabled(self) -> None:
+        try:
+            on = bool(self.clipboard_monitor.get())
+        except Exception:
+            on = False
+        if on:
+            self._clipboard_enabled.set()
+        else:
+            self._clipboard_enabled.clear()
+
+    def _on_clipboard_media_url(self, _event=None) -> None:
+        with self._clipboard_pending_lock:
+            url = self._clipboard_pending_url
+            self._clipboard_pending_url = None
+        if not url:
+            return
+        self.url_var.set(url)
+        self._add_to_pipe()
 
     def _start_clipboard_monitor(self):
         if self._clipboard_thread is not None:
             return
         
+        self._sync_clipboard_enabled()
+        seq_fn = _clipboard_sequence_reader()
+
         def worker():
+            last_seq = None
             while True:
-                time.sleep(1.0)
-                if not self.clipboard_monitor.get():
-                    continue
+                # Sleep without waking while monitoring is switched off.
+                self._clipboard_enabled.wait()
+                time.sleep(0.5 if seq_fn is not None else 1.0)
+                if seq_fn is not None:
+                    # Cheap change counter: only read the clipboard when it actually changed.
+                    try:
+                        seq = seq_fn()
+                    except Exception:
+                        seq = None
+                    if seq is not None and seq == last_seq:
+                        continue
+                    last_seq = seq
                 try:
                     current = self.clipboard_get()
                     if current and current != self._last_clipboard:
                         self._last_clipboard = current
-                        c_low = current.lower()
                         # Simple check for media links
-                        valid_platforms = ["youtube.com", "youtu.be", "facebook.com", "web.facebook.com", "m.facebook.com", "fb.watch", "tiktok.com", "instagram.com", "pinterest.com"]
-                        if any(x in c_low for x in valid_platforms):
-                            self.after(0, lambda c=current: (self.url_var.set(c), self._add_to_pipe()))
+                        if _MEDIA_URL_RE.search(current):
+                            with self._clipboard_pending_lock:
+                                self._clipboard_pending_url = current
+                            self.event_generate("<<ClipboardMediaUrl>>", when="tail")
                 except Exception:
                     pass
-        
+
         self._clipboard_thread = threading.Thread(target=worker, daemon=True)
         self._clipboard_thread.start()
 
@@ -4445,7 +4913,14 @@ class App(ctk.CTk):
             if not url: return
             input_win.destroy()
             self._set_status("Scanning profile...")
-            
+
+            # A newer scan supersedes any fetcher still running.
+            if self._current_scrape_cancel is not None:
+                self._current_scrape_cancel.set()
+            cancel = threading.Event()
+            self._current_scrape_cancel = cancel
+            cookies = self.cookies_file.get()
+
             def fetcher():
                 try:
                     scan_url = url
@@ -4453,15 +4928,27 @@ class App(ctk.CTk):
                         scan_url = self._normalize_url(scan_url)
                     except Exception:
                         pass
-                    self._log_threadsafe(f"[Scraper] Scanning: {scan_url}")
-                    # expand_url_entries is already good for this
-                    urls = expand_url_entries(scan_url, cookies_file=self.cookies_file.get(), allow_playlist=True)
+                    key = (scan_url, True)
+                    hit = self._scrape_cache.get(key)
+                    if hit is not None and time.monotonic() - hit[0] < self._SCRAPE_CACHE_TTL:
+                        urls = hit[1]
+                        self._log_threadsafe(f"[Scraper] Using cached results: {scan_url}")
+                    else:
+                        self._log_threadsafe(f"[Scraper] Scanning: {scan_url}")
+                        # expand_url_entries is already good for this
+                        urls = expand_url_entries(scan_url, cookies_file=cookies, allow_playlist=True)
+                        if urls:
+                            self._scrape_cache[key] = (time.monotonic(), list(urls))
+                    if cancel.is_set():
+                        return
                     if not urls:
                         self.after(0, lambda: self._set_status("No videos found"))
                         return
                     self.after(0, lambda: self._show_profile_results(scan_url, urls))
                 except Exception as e:
                     self._log_threadsafe(f"[Scraper] Error: {e}")
+                    if cancel.is_set():
+                        return
                     def _ui_fail():
                         self._set_status("Scan failed")
                         if "tiktok" in url.lower() and "profile extraction failed" in str(e).lower():
@@ -4518,7 +5005,7 @@ class App(ctk.CTk):
         sidebar.grid_rowconfigure(2, weight=1)
         sidebar.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(sidebar, text="Music Studio", font=ctk.CTkFont(size=18, weight="bold"), text_color="#60a5fa").grid(
+        ctk.CTkLabel(sidebar, text="Music Studio", font=self._font(size=18, weight="bold"), text_color="#60a5fa").grid(
             row=0, column=0, sticky="w", padx=14, pady=(14, 8)
         )
 
@@ -4533,66 +5020,102 @@ class App(ctk.CTk):
         playlist.grid_columnconfigure(0, weight=1)
 
         songs: list[dict] = []
+        song_paths: set[str] = set()
 
         log = None
+        # Lines logged while the textbox is not viewable (window minimized or
+        # not yet mapped) wait here and are flushed in a single insert.
+        log_buffer: deque[str] = deque(maxlen=500)
 
         def _log_line(msg: str) -> None:
             if log is None:
                 return
-            try:
+            with _SUPPRESS:
+                if not log.winfo_viewable():
+                    log_buffer.append(str(msg).rstrip())
+                    return
                 log.configure(state="normal")
                 log.insert("end", str(msg).rstrip() + "\n")
                 log.see("end")
                 log.configure(state="disabled")
-            except Exception:
-                pass
 
-        def _render_playlist() -> None:
-            try:
-                for child in playlist.winfo_children():
-                    try:
-                        child.destroy()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        # Shared callbacks for the many "log what changed" widgets below; bound with
+        # functools.partial instead of a closure per widget.
+        def _log_value(label: str, value) -> None:
+            _log_line(f"{label}: {value}")
 
-            if not songs:
-                empty = ctk.CTkFrame(playlist, fg_color="transparent")
-                empty.grid(row=0, column=0, sticky="ew", pady=8)
-                ctk.CTkLabel(empty, text="No songs yet. Click 'Add Songs'.", text_color="#94a3b8").pack(anchor="w", padx=6)
+        def _log_flag(label: str, var: tk.Variable) -> None:
+            _log_line(f"{label}: {bool(var.get())}")
+
+        def _flush_log(_e=None) -> None:
+            if log is None or not log_buffer:
                 return
+            with _SUPPRESS:
+                text = "\n".join(log_buffer) + "\n"
+                log_buffer.clear()
+                log.configure(state="normal")
+                log.insert("end", text)
+                log.see("end")
+                log.configure(state="disabled")
 
-            for idx, s in enumerate(list(songs), start=1):
-                row = ctk.CTkFrame(playlist, fg_color="#111827", corner_radius=10)
-                row.grid(row=idx, column=0, sticky="ew", pady=6)
-                row.grid_columnconfigure(1, weight=1)
-                ctk.CTkLabel(row, text=f"{idx:02d}", width=32, text_color="#93c5fd").grid(row=0, column=0, padx=(10, 6), pady=10)
-                title = str(s.get("title") or "")
-                ctk.CTkLabel(row, text=title, text_color="#f8fafc").grid(row=0, column=1, sticky="w", pady=10)
+        # Row widgets are pooled: rendering reconfigures existing rows and only
+        # creates a new one when the playlist grows past the pool.
+        playlist_rows: list[dict] = []
+        empty_row = ctk.CTkFrame(playlist, fg_color="transparent")
+        ctk.CTkLabel(empty_row, text="No songs yet. Click 'Add Songs'.", text_color="#94a3b8").pack(anchor="w", padx=6)
+
+        def _rm(path: str) -> None:
+            path = str(path)
+            if path in song_paths:
+                song_paths.discard(path)
+                songs[:] = [x for x in songs if str(x.get("path")) != path]
+            _render_playlist()
+            _log_line(f"Removed: {os.path.basename(str(path))}")
+
+        def _new_playlist_row(idx: int) -> dict:
+            frame = ctk.CTkFrame(playlist, fg_color="#111827", corner_radius=10)
+            frame.grid_columnconfigure(1, weight=1)
+            num_lbl = ctk.CTkLabel(frame, text=f"{idx:02d}", width=32, text_color="#93c5fd")
+            num_lbl.grid(row=0, column=0, padx=(10, 6), pady=10)
+            title_lbl = ctk.CTkLabel(frame, text="", text_color="#f8fafc")
+            title_lbl.grid(row=0, column=1, sticky="w", pady=10)
+            del_btn = ctk.CTkButton(frame, text="X", width=28, fg_color="#ef4444", hover_color="#dc2626")
+            del_btn.grid(row=0, column=2, padx=10, pady=10)
+            return {"frame": frame, "num_lbl": num_lbl, "title_lbl": title_lbl, "del_btn": del_btn, "path": None, "title": None, "shown": False}
 
-                def _rm(path: str) -> None:
-                    try:
-                        for j in range(len(songs) - 1, -1, -1):
-                            if str(songs[j].get("path")) == str(path):
-                                songs.pop(j)
-                    except Exception:
-                        pass
-                    _render_playlist()
-                    _log_line(f"Removed: {os.path.basename(str(path))}")
+        def _render_playlist() -> None:
+            if not songs:
+                empty_row.grid(row=0, column=0, sticky="ew", pady=8)
+            else:
+                empty_row.grid_remove()
 
-                ctk.CTkButton(row, text="X", width=28, fg_color="#ef4444", hover_color="#dc2626", command=lambda p=str(s.get("path")): _rm(p)).grid(
-                    row=0, column=2, padx=10, pady=10
-                )
+            for idx, s in enumerate(songs, start=1):
+                if idx > len(playlist_rows):
+                    playlist_rows.append(_new_playlist_row(idx))
+                row = playlist_rows[idx - 1]
+                path = str(s.get("path"))
+                title = str(s.get("title") or "")
+                if row["title"] != title:
+                    row["title_lbl"].configure(text=title)
+                    row["title"] = title
+                if row["path"] != path:
+                    row["del_btn"].configure(command=functools.partial(_rm, path))
+                    row["path"] = path
+                # A row's grid slot never changes, so only visibility flips touch the geometry manager.
+                if not row["shown"]:
+                    row["frame"].grid(row=idx, column=0, sticky="ew", pady=6)
+                    row["shown"] = True
+
+            for row in playlist_rows[len(songs):]:
+                if row["shown"]:
+                    row["frame"].grid_remove()
+                    row["shown"] = False
 
         def _add_songs() -> None:
             try:
                 paths = filedialog.askopenfilenames(
                     title="Add songs",
-                    filetypes=[
-                        ("Audio", "*.mp3 *.wav *.m4a *.aac *.flac *.ogg"),
-                        ("All files", "*.*"),
-                    ],
+                    filetypes=_AUDIO_FILETYPES,
                 )
             except Exception:
                 paths = ()
@@ -4603,8 +5126,9 @@ class App(ctk.CTk):
                 try:
                     p2 = str(p)
                     base = os.path.basename(p2)
-                    if any(str(x.get("path")) == p2 for x in songs):
+                    if p2 in song_paths:
                         continue
+                    song_paths.add(p2)
                     songs.append({"path": p2, "title": os.path.splitext(base)[0]})
                     added += 1
                 except Exception:
@@ -4615,10 +5139,8 @@ class App(ctk.CTk):
         def _clear_songs() -> None:
             if not songs:
                 return
-            try:
-                songs.clear()
-            except Exception:
-                pass
+            songs.clear()
+            song_paths.clear()
             _render_playlist()
             _log_line("Cleared playlist")
 
@@ -4636,6 +5158,8 @@ class App(ctk.CTk):
 
         log = ctk.CTkTextbox(main, height=110)
         log.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        log.bind("<Map>", _flush_log)
+        log.bind("<Visibility>", _flush_log)
 
         tabs = ctk.CTkTabview(main, fg_color="#0f172a")
         tabs.grid(row=0, column=0, sticky="ew", padx=12, pady=12)
@@ -4666,7 +5190,7 @@ class App(ctk.CTk):
         settings_tab = tabs.tab("Settings")
         settings_tab.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(preview, text="Video Preview Player", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(
+        ctk.CTkLabel(preview, text="Video Preview Player", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(
             row=0, column=0, sticky="w", padx=10, pady=(10, 6)
         )
 
@@ -4681,245 +5205,257 @@ class App(ctk.CTk):
         actions.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
         for c in range(5):
             actions.grid_columnconfigure(c, weight=1)
-        ctk.CTkButton(actions, text="Update Preview", fg_color="#f59e0b", hover_color="#d97706", command=lambda: _log_line("Update Preview (coming soon)")).grid(row=0, column=0, sticky="ew", padx=(0, 8))
-        ctk.CTkButton(actions, text="Take Snapshot", fg_color="#22c55e", hover_color="#16a34a", command=lambda: _log_line("Take Snapshot (coming soon)")).grid(row=0, column=1, sticky="ew", padx=(0, 8))
-        ctk.CTkButton(actions, text="Style", fg_color="#3b82f6", hover_color="#2563eb", command=lambda: _log_line("Style (coming soon)")).grid(row=0, column=2, sticky="ew", padx=(0, 8))
-        ctk.CTkButton(actions, text="Effect", fg_color="#a855f7", hover_color="#9333ea", command=lambda: _log_line("Effect (coming soon)")).grid(row=0, column=3, sticky="ew", padx=(0, 8))
-        ctk.CTkButton(actions, text="Watermark", fg_color="#14b8a6", hover_color="#0d9488", command=lambda: _log_line("Watermark (coming soon)")).grid(row=0, column=4, sticky="ew")
-
-        # Background
-        bg_card = ctk.CTkFrame(background_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        bg_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        bg_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(bg_card, text="Background", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
-
-        bg_path = tk.StringVar(value="")
-        bg_mode = tk.StringVar(value="Fit")
-        ctk.CTkLabel(bg_card, text="File", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        bg_ent = ctk.CTkEntry(bg_card, textvariable=bg_path)
-        bg_ent.grid(row=1, column=1, sticky="ew", padx=12, pady=6)
-
-        def _pick_bg() -> None:
-            try:
-                p = filedialog.askopenfilename(
-                    title="Choose background",
-                    filetypes=[
-                        ("Images/Videos", "*.png *.jpg *.jpeg *.webp *.bmp *.mp4 *.mov *.mkv *.webm"),
-                        ("All files", "*.*"),
-                    ],
-                )
-            except Exception:
-                p = ""
-            if not p:
-                return
-            bg_path.set(str(p))
-            _log_line(f"Background selected: {os.path.basename(str(p))}")
-
-        btn_row_bg = ctk.CTkFrame(bg_card, fg_color="transparent")
-        btn_row_bg.grid(row=2, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
-        btn_row_bg.grid_columnconfigure(2, weight=1)
-        ctk.CTkButton(btn_row_bg, text="Browse", width=110, fg_color="#334155", hover_color="#475569", command=_pick_bg).grid(row=0, column=0, padx=(0, 10))
-        ctk.CTkLabel(btn_row_bg, text="Mode", text_color="#94a3b8").grid(row=0, column=1, padx=(0, 8))
-        ctk.CTkOptionMenu(
-            btn_row_bg,
-            variable=bg_mode,
-            values=["Fit", "Fill", "Stretch"],
-            width=120,
-            command=lambda v: _log_line(f"Background mode: {v}"),
-        ).grid(row=0, column=2, sticky="w")
-        btn_apply_bg = ctk.CTkButton(btn_row_bg, text="Apply", width=110, fg_color="#7c3aed", hover_color="#6d28d9", command=lambda: _log_line("Background applied"))
-        btn_apply_bg.grid(row=0, column=3, sticky="e")
-
-        # Export
-        ex_card = ctk.CTkFrame(export_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        ex_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        ex_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(ex_card, text="Export", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
-
-        video_path = tk.StringVar(value="")
-        out_path = tk.StringVar(value="")
-        ctk.CTkLabel(ex_card, text="Video file", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(ex_card, textvariable=video_path).grid(row=1, column=1, sticky="ew", padx=12, pady=6)
-        ctk.CTkLabel(ex_card, text="Output", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(ex_card, textvariable=out_path).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
-
-        def _pick_video() -> None:
-            try:
-                p = filedialog.askopenfilename(
-                    title="Choose video",
-                    filetypes=[
-                        ("Video", "*.mp4 *.mkv *.mov *.webm"),
-                        ("All files", "*.*"),
-                    ],
-                )
-            except Exception:
-                p = ""
-            if not p:
-                return
-            video_path.set(str(p))
-            _log_line(f"Video selected: {os.path.basename(str(p))}")
+        ctk.CTkButton(actions, text="Update Preview", fg_color="#f59e0b", hover_color="#d97706", command=functools.partial(_log_line, "Update Preview (coming soon)")).grid(row=0, column=0, sticky="ew", padx=(0, 8))
+        ctk.CTkButton(actions, text="Take Snapshot", fg_color="#22c55e", hover_color="#16a34a", command=functools.partial(_log_line, "Take Snapshot (coming soon)")).grid(row=0, column=1, sticky="ew", padx=(0, 8))
+        ctk.CTkButton(actions, text="Style", fg_color="#3b82f6", hover_color="#2563eb", command=functools.partial(_log_line, "Style (coming soon)")).grid(row=0, column=2, sticky="ew", padx=(0, 8))
+        ctk.CTkButton(actions, text="Effect", fg_color="#a855f7", hover_color="#9333ea", command=functools.partial(_log_line, "Effect (coming soon)")).grid(row=0, column=3, sticky="ew", padx=(0, 8))
+        ctk.CTkButton(actions, text="Watermark", fg_color="#14b8a6", hover_color="#0d9488", command=functools.partial(_log_line, "Watermark (coming soon)")).grid(row=0, column=4, sticky="ew")
+
+        def _build_background_tab() -> None:
+            bg_card = ctk.CTkFrame(background_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            bg_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            bg_card.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(bg_card, text="Background", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
+
+            bg_path = tk.StringVar(value="")
+            bg_mode = tk.StringVar(value="Fit")
+            ctk.CTkLabel(bg_card, text="File", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            bg_ent = ctk.CTkEntry(bg_card, textvariable=bg_path)
+            bg_ent.grid(row=1, column=1, sticky="ew", padx=12, pady=6)
+
+            def _pick_bg() -> None:
+                try:
+                    p = filedialog.askopenfilename(
+                        title="Choose background",
+                        filetypes=_BG_FILETYPES,
+                    )
+                except Exception:
+                    p = ""
+                if not p:
+                    return
+                bg_path.set(str(p))
+                _log_line(f"Background selected: {os.path.basename(str(p))}")
+
+            btn_row_bg = ctk.CTkFrame(bg_card, fg_color="transparent")
+            btn_row_bg.grid(row=2, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
+            btn_row_bg.grid_columnconfigure(2, weight=1)
+            ctk.CTkButton(btn_row_bg, text="Browse", width=110, fg_color="#334155", hover_color="#475569", command=_pick_bg).grid(row=0, column=0, padx=(0, 10))
+            ctk.CTkLabel(btn_row_bg, text="Mode", text_color="#94a3b8").grid(row=0, column=1, padx=(0, 8))
+            ctk.CTkOptionMenu(
+                btn_row_bg,
+                variable=bg_mode,
+                values=["Fit", "Fill", "Stretch"],
+                width=120,
+                command=functools.partial(_log_value, "Background mode"),
+            ).grid(row=0, column=2, sticky="w")
+            btn_apply_bg = ctk.CTkButton(btn_row_bg, text="Apply", width=110, fg_color="#7c3aed", hover_color="#6d28d9", command=functools.partial(_log_line, "Background applied"))
+            btn_apply_bg.grid(row=0, column=3, sticky="e")
+
+        def _build_export_tab() -> None:
+            ex_card = ctk.CTkFrame(export_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            ex_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            ex_card.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(ex_card, text="Export", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
+
+            video_path = tk.StringVar(value="")
+            out_path = tk.StringVar(value="")
+            ctk.CTkLabel(ex_card, text="Video file", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(ex_card, textvariable=video_path).grid(row=1, column=1, sticky="ew", padx=12, pady=6)
+            ctk.CTkLabel(ex_card, text="Output", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(ex_card, textvariable=out_path).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
+
+            def _pick_video() -> None:
+                try:
+                    p = filedialog.askopenfilename(
+                        title="Choose video",
+                        filetypes=_VIDEO_FILETYPES,
+                    )
+                except Exception:
+                    p = ""
+                if not p:
+                    return
+                video_path.set(str(p))
+                _log_line(f"Video selected: {os.path.basename(str(p))}")
 
-        def _pick_output() -> None:
-            try:
-                p = filedialog.asksaveasfilename(
-                    title="Save export as",
-                    defaultextension=".mp4",
-                    filetypes=[("MP4", "*.mp4"), ("All files", "*.*")],
-                )
-            except Exception:
-                p = ""
-            if not p:
-                return
-            out_path.set(str(p))
-            _log_line(f"Output set: {os.path.basename(str(p))}")
+            def _pick_output() -> None:
+                try:
+                    p = filedialog.asksaveasfilename(
+                        title="Save export as",
+                        defaultextension=".mp4",
+                        filetypes=_MP4_FILETYPES,
+                    )
+                except Exception:
+                    p = ""
+                if not p:
+                    return
+                out_path.set(str(p))
+                _log_line(f"Output set: {os.path.basename(str(p))}")
 
-        def _do_export() -> None:
-            if not video_path.get().strip():
-                _log_line("Export error: please choose a video file")
-                return
-            if not out_path.get().strip():
-                _log_line("Export error: please choose output file")
-                return
-            _log_line("Export started (coming soon)")
-            _log_line(f"Video: {video_path.get().strip()}")
-            _log_line(f"Output: {out_path.get().strip()}")
-            _log_line(f"Songs in playlist: {len(songs)}")
-
-        ex_btn = ctk.CTkFrame(ex_card, fg_color="transparent")
-        ex_btn.grid(row=3, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
-        ex_btn.grid_columnconfigure(3, weight=1)
-        ctk.CTkButton(ex_btn, text="Browse Video", width=120, fg_color="#334155", hover_color="#475569", command=_pick_video).grid(row=0, column=0, padx=(0, 10))
-        ctk.CTkButton(ex_btn, text="Output", width=120, fg_color="#334155", hover_color="#475569", command=_pick_output).grid(row=0, column=1, padx=(0, 10))
-        ctk.CTkButton(ex_btn, text="Export", width=120, fg_color="#22c55e", hover_color="#16a34a", command=_do_export).grid(row=0, column=2)
-
-        # Relaxing Music
-        rx_card = ctk.CTkFrame(relaxing_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        rx_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        rx_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(rx_card, text="Relaxing Music", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
-
-        rx_style = tk.StringVar(value="Lo-fi")
-        rx_level = tk.DoubleVar(value=50)
-        ctk.CTkLabel(rx_card, text="Style", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkOptionMenu(rx_card, variable=rx_style, values=["Lo-fi", "Piano", "Ambient", "Nature", "Chill"], command=lambda v: _log_line(f"Relax style: {v}")).grid(row=1, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkLabel(rx_card, text="Level", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkSlider(rx_card, from_=0, to=100, variable=rx_level, command=lambda _v: None).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
-        rx_btn = ctk.CTkFrame(rx_card, fg_color="transparent")
-        rx_btn.grid(row=3, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
-        ctk.CTkButton(rx_btn, text="Preview", width=120, fg_color="#3b82f6", hover_color="#2563eb", command=lambda: _log_line(f"Relax preview: {rx_style.get()} @ {int(rx_level.get())}%")).pack(side="left", padx=(0, 10))
-        ctk.CTkButton(
-            rx_btn,
-            text="Apply",
-            width=120,
-            fg_color="#7c3aed",
-            hover_color="#6d28d9",
-            command=lambda: _log_line("Relaxing music applied (coming soon)"),
-        ).pack(side="left")
-
-        # Auto Caption
-        ac_card = ctk.CTkFrame(auto_caption_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        ac_card.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        ac_card.grid_columnconfigure(0, weight=1)
-        ctk.CTkLabel(ac_card, text="Auto Caption", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, sticky="w", padx=12, pady=(10, 6))
-        ac_lang = tk.StringVar(value="English")
-        ac_row = ctk.CTkFrame(ac_card, fg_color="transparent")
-        ac_row.grid(row=1, column=0, sticky="ew", padx=12, pady=(0, 10))
-        ctk.CTkLabel(ac_row, text="Language", text_color="#94a3b8").pack(side="left", padx=(0, 10))
-        ctk.CTkOptionMenu(ac_row, variable=ac_lang, values=["English", "Khmer", "Auto"], command=lambda v: _log_line(f"Caption language: {v}")).pack(side="left")
-        ac_txt = ctk.CTkTextbox(ac_card, height=220)
-        ac_txt.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 10))
-
-        def _gen_caption() -> None:
-            _log_line("Generate captions (coming soon)")
-            try:
-                t = ac_txt.get("1.0", "end").strip()
-            except Exception:
-                t = ""
-            if t:
-                _log_line("Note: you already typed caption text")
+            def _do_export() -> None:
+                if not video_path.get().strip():
+                    _log_line("Export error: please choose a video file")
+                    return
+                if not out_path.get().strip():
+                    _log_line("Export error: please choose output file")
+                    return
+                _log_line("Export started (coming soon)")
+                _log_line(f"Video: {video_path.get().strip()}")
+                _log_line(f"Output: {out_path.get().strip()}")
+                _log_line(f"Songs in playlist: {len(songs)}")
+
+            ex_btn = ctk.CTkFrame(ex_card, fg_color="transparent")
+            ex_btn.grid(row=3, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
+            ex_btn.grid_columnconfigure(3, weight=1)
+            ctk.CTkButton(ex_btn, text="Browse Video", width=120, fg_color="#334155", hover_color="#475569", command=_pick_video).grid(row=0, column=0, padx=(0, 10))
+            ctk.CTkButton(ex_btn, text="Output", width=120, fg_color="#334155", hover_color="#475569", command=_pick_output).grid(row=0, column=1, padx=(0, 10))
+            ctk.CTkButton(ex_btn, text="Export", width=120, fg_color="#22c55e", hover_color="#16a34a", command=_do_export).grid(row=0, column=2)
+
+        def _build_relaxing_tab() -> None:
+            rx_card = ctk.CTkFrame(relaxing_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            rx_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            rx_card.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(rx_card, text="Relaxing Music", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
+
+            rx_style = tk.StringVar(value="Lo-fi")
+            rx_level = tk.DoubleVar(value=50)
+            ctk.CTkLabel(rx_card, text="Style", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkOptionMenu(rx_card, variable=rx_style, values=["Lo-fi", "Piano", "Ambient", "Nature", "Chill"], command=functools.partial(_log_value, "Relax style")).grid(row=1, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkLabel(rx_card, text="Level", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkSlider(rx_card, from_=0, to=100, variable=rx_level).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
+            rx_btn = ctk.CTkFrame(rx_card, fg_color="transparent")
+            rx_btn.grid(row=3, column=0, columnspan=2, sticky="ew", padx=12, pady=(6, 12))
+            ctk.CTkButton(rx_btn, text="Preview", width=120, fg_color="#3b82f6", hover_color="#2563eb", command=lambda: _log_line(f"Relax preview: {rx_style.get()} @ {int(rx_level.get())}%")).pack(side="left", padx=(0, 10))
+            ctk.CTkButton(
+                rx_btn,
+                text="Apply",
+                width=120,
+                fg_color="#7c3aed",
+                hover_color="#6d28d9",
+                command=functools.partial(_log_line, "Relaxing music applied (coming soon)"),
+            ).pack(side="left")
+
+        def _build_auto_caption_tab() -> None:
+            ac_card = ctk.CTkFrame(auto_caption_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            ac_card.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+            ac_card.grid_columnconfigure(0, weight=1)
+            ctk.CTkLabel(ac_card, text="Auto Caption", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, sticky="w", padx=12, pady=(10, 6))
+            ac_lang = tk.StringVar(value="English")
+            ac_row = ctk.CTkFrame(ac_card, fg_color="transparent")
+            ac_row.grid(row=1, column=0, sticky="ew", padx=12, pady=(0, 10))
+            ctk.CTkLabel(ac_row, text="Language", text_color="#94a3b8").pack(side="left", padx=(0, 10))
+            ctk.CTkOptionMenu(ac_row, variable=ac_lang, values=["English", "Khmer", "Auto"], command=functools.partial(_log_value, "Caption language")).pack(side="left")
+            ac_txt = ctk.CTkTextbox(ac_card, height=220)
+            ac_txt.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 10))
+
+            def _gen_caption() -> None:
+                _log_line("Generate captions (coming soon)")
+                try:
+                    t = ac_txt.get("1.0", "end").strip()
+                except Exception:
+                    t = ""
+                if t:
+                    _log_line("Note: you already typed caption text")
+
+            ac_btn = ctk.CTkFrame(ac_card, fg_color="transparent")
+            ac_btn.grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 12))
+            ctk.CTkButton(ac_btn, text="Generate", width=120, fg_color="#22c55e", hover_color="#16a34a", command=_gen_caption).pack(side="left", padx=(0, 10))
+            ctk.CTkButton(
+                ac_btn,
+                text="Save SRT",
+                width=120,
+                fg_color="#334155",
+                hover_color="#475569",
+                command=functools.partial(_log_line, "Save SRT (coming soon)"),
+            ).pack(side="left")
+
+        def _build_cc_tab() -> None:
+            cc_card = ctk.CTkFrame(cc_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            cc_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            cc_card.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(cc_card, text="Closed Captions (CC)", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
+            cc_enable = tk.BooleanVar(value=True)
+            cc_size = tk.IntVar(value=28)
+            cc_color = tk.StringVar(value="White")
+            ctk.CTkCheckBox(cc_card, text="Enable CC", variable=cc_enable, command=functools.partial(_log_flag, "CC enabled", cc_enable)).grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkLabel(cc_card, text="Font size", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkSlider(cc_card, from_=12, to=72, number_of_steps=60, command=lambda v: cc_size.set(int(float(v)))).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
+            ctk.CTkLabel(cc_card, text="Color", text_color="#94a3b8").grid(row=3, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkOptionMenu(cc_card, variable=cc_color, values=["White", "Yellow", "Cyan"], command=functools.partial(_log_value, "CC color")).grid(row=3, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkButton(cc_card, text="Apply", width=120, fg_color="#7c3aed", hover_color="#6d28d9", command=lambda: _log_line(f"CC apply: size={cc_size.get()} color={cc_color.get()}")).grid(
+                row=4, column=0, columnspan=2, sticky="w", padx=12, pady=(8, 12)
+            )
 
-        ac_btn = ctk.CTkFrame(ac_card, fg_color="transparent")
-        ac_btn.grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 12))
-        ctk.CTkButton(ac_btn, text="Generate", width=120, fg_color="#22c55e", hover_color="#16a34a", command=_gen_caption).pack(side="left", padx=(0, 10))
-        ctk.CTkButton(
-            ac_btn,
-            text="Save SRT",
-            width=120,
-            fg_color="#334155",
-            hover_color="#475569",
-            command=lambda: _log_line("Save SRT (coming soon)"),
-        ).pack(side="left")
-
-        # CC
-        cc_card = ctk.CTkFrame(cc_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        cc_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        cc_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(cc_card, text="Closed Captions (CC)", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
-        cc_enable = tk.BooleanVar(value=True)
-        cc_size = tk.IntVar(value=28)
-        cc_color = tk.StringVar(value="White")
-        ctk.CTkCheckBox(cc_card, text="Enable CC", variable=cc_enable, command=lambda: _log_line(f"CC enabled: {bool(cc_enable.get())}")).grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkLabel(cc_card, text="Font size", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkSlider(cc_card, from_=12, to=72, number_of_steps=60, command=lambda v: cc_size.set(int(float(v)))).grid(row=2, column=1, sticky="ew", padx=12, pady=6)
-        ctk.CTkLabel(cc_card, text="Color", text_color="#94a3b8").grid(row=3, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkOptionMenu(cc_card, variable=cc_color, values=["White", "Yellow", "Cyan"], command=lambda v: _log_line(f"CC color: {v}")).grid(row=3, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkButton(cc_card, text="Apply", width=120, fg_color="#7c3aed", hover_color="#6d28d9", command=lambda: _log_line(f"CC apply: size={cc_size.get()} color={cc_color.get()}")).grid(
-            row=4, column=0, columnspan=2, sticky="w", padx=12, pady=(8, 12)
-        )
+        def _build_music_tab() -> None:
+            mu_card = ctk.CTkFrame(music_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            mu_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            mu_card.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(mu_card, text="Music Controls", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
+            vol = tk.DoubleVar(value=80)
+            fade_in = tk.StringVar(value="0")
+            fade_out = tk.StringVar(value="0")
+            trim_a = tk.StringVar(value="")
+            trim_b = tk.StringVar(value="")
+            ctk.CTkLabel(mu_card, text="Volume", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkSlider(mu_card, from_=0, to=100, variable=vol).grid(row=1, column=1, sticky="ew", padx=12, pady=6)
+            ctk.CTkLabel(mu_card, text="Fade in (s)", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(mu_card, textvariable=fade_in, width=140).grid(row=2, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkLabel(mu_card, text="Fade out (s)", text_color="#94a3b8").grid(row=3, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(mu_card, textvariable=fade_out, width=140).grid(row=3, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkLabel(mu_card, text="Trim start", text_color="#94a3b8").grid(row=4, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(mu_card, textvariable=trim_a, width=140).grid(row=4, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkLabel(mu_card, text="Trim end", text_color="#94a3b8").grid(row=5, column=0, sticky="w", padx=12, pady=6)
+            ctk.CTkEntry(mu_card, textvariable=trim_b, width=140).grid(row=5, column=1, sticky="w", padx=12, pady=6)
+            ctk.CTkButton(
+                mu_card,
+                text="Apply",
+                width=120,
+                fg_color="#7c3aed",
+                hover_color="#6d28d9",
+                command=lambda: _log_line(
+                    f"Music apply: vol={int(vol.get())}% fade_in={fade_in.get()} fade_out={fade_out.get()} trim={trim_a.get()}-{trim_b.get()}"
+                ),
+            ).grid(row=6, column=0, columnspan=2, sticky="w", padx=12, pady=(8, 12))
+
+        def _build_settings_tab() -> None:
+            st_card = ctk.CTkFrame(settings_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
+            st_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+            st_card.grid_columnconfigure(0, weight=1)
+            ctk.CTkLabel(st_card, text="Settings", font=self._font(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, sticky="w", padx=12, pady=(10, 6))
+            keep = tk.BooleanVar(value=True)
+            theme = tk.StringVar(value="Dark")
+            ctk.CTkCheckBox(st_card, text="Keep Music Studio settings", variable=keep, command=functools.partial(_log_flag, "Keep settings", keep)).grid(row=1, column=0, sticky="w", padx=12, pady=6)
+            row_theme = ctk.CTkFrame(st_card, fg_color="transparent")
+            row_theme.grid(row=2, column=0, sticky="ew", padx=12, pady=6)
+            ctk.CTkLabel(row_theme, text="Theme", text_color="#94a3b8").pack(side="left", padx=(0, 10))
+            ctk.CTkOptionMenu(row_theme, variable=theme, values=["Dark", "Light"], command=functools.partial(_log_value, "Theme")).pack(side="left")
+            st_btn = ctk.CTkFrame(st_card, fg_color="transparent")
+            st_btn.grid(row=3, column=0, sticky="ew", padx=12, pady=(10, 12))
+            ctk.CTkButton(
+                st_btn,
+                text="Reset",
+                width=120,
+                fg_color="#ef4444",
+                hover_color="#dc2626",
+                command=functools.partial(_log_line, "Reset settings (coming soon)"),
+            ).pack(side="left")
+
+        # Only Preview is built up front; the other tabs are built the first time they are shown.
+        tab_builders = {
+            "Background": _build_background_tab,
+            "Export": _build_export_tab,
+            "Relaxing Music": _build_relaxing_tab,
+            "Auto Caption": _build_auto_caption_tab,
+            "CC": _build_cc_tab,
+            "Music": _build_music_tab,
+            "Settings": _build_settings_tab,
+        }
 
-        # Music
-        mu_card = ctk.CTkFrame(music_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        mu_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        mu_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(mu_card, text="Music Controls", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10, 6))
-        vol = tk.DoubleVar(value=80)
-        fade_in = tk.StringVar(value="0")
-        fade_out = tk.StringVar(value="0")
-        trim_a = tk.StringVar(value="")
-        trim_b = tk.StringVar(value="")
-        ctk.CTkLabel(mu_card, text="Volume", text_color="#94a3b8").grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkSlider(mu_card, from_=0, to=100, variable=vol).grid(row=1, column=1, sticky="ew", padx=12, pady=6)
-        ctk.CTkLabel(mu_card, text="Fade in (s)", text_color="#94a3b8").grid(row=2, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(mu_card, textvariable=fade_in, width=140).grid(row=2, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkLabel(mu_card, text="Fade out (s)", text_color="#94a3b8").grid(row=3, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(mu_card, textvariable=fade_out, width=140).grid(row=3, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkLabel(mu_card, text="Trim start", text_color="#94a3b8").grid(row=4, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(mu_card, textvariable=trim_a, width=140).grid(row=4, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkLabel(mu_card, text="Trim end", text_color="#94a3b8").grid(row=5, column=0, sticky="w", padx=12, pady=6)
-        ctk.CTkEntry(mu_card, textvariable=trim_b, width=140).grid(row=5, column=1, sticky="w", padx=12, pady=6)
-        ctk.CTkButton(
-            mu_card,
-            text="Apply",
-            width=120,
-            fg_color="#7c3aed",
-            hover_color="#6d28d9",
-            command=lambda: _log_line(
-                f"Music apply: vol={int(vol.get())}% fade_in={fade_in.get()} fade_out={fade_out.get()} trim={trim_a.get()}-{trim_b.get()}"
-            ),
-        ).grid(row=6, column=0, columnspan=2, sticky="w", padx=12, pady=(8, 12))
-
-        # Settings
-        st_card = ctk.CTkFrame(settings_tab, fg_color="#0b1220", corner_radius=12, border_width=1, border_color="#1f2937")
-        st_card.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        st_card.grid_columnconfigure(0, weight=1)
-        ctk.CTkLabel(st_card, text="Settings", font=ctk.CTkFont(size=14, weight="bold"), text_color="#e2e8f0").grid(row=0, column=0, sticky="w", padx=12, pady=(10, 6))
-        keep = tk.BooleanVar(value=True)
-        theme = tk.StringVar(value="Dark")
-        ctk.CTkCheckBox(st_card, text="Keep Music Studio settings", variable=keep, command=lambda: _log_line(f"Keep settings: {bool(keep.get())}")).grid(row=1, column=0, sticky="w", padx=12, pady=6)
-        row_theme = ctk.CTkFrame(st_card, fg_color="transparent")
-        row_theme.grid(row=2, column=0, sticky="ew", padx=12, pady=6)
-        ctk.CTkLabel(row_theme, text="Theme", text_color="#94a3b8").pack(side="left", padx=(0, 10))
-        ctk.CTkOptionMenu(row_theme, variable=theme, values=["Dark", "Light"], command=lambda v: _log_line(f"Theme: {v}")).pack(side="left")
-        st_btn = ctk.CTkFrame(st_card, fg_color="transparent")
-        st_btn.grid(row=3, column=0, sticky="ew", padx=12, pady=(10, 12))
-        ctk.CTkButton(
-            st_btn,
-            text="Reset",
-            width=120,
-            fg_color="#ef4444",
-            hover_color="#dc2626",
-            command=lambda: _log_line("Reset settings (coming soon)"),
-        ).pack(side="left")
+        def _maybe_build_tab() -> None:
+            builder = tab_builders.pop(tabs.get(), None)
+            if builder is not None:
+                builder()
+
+        tabs.configure(command=_maybe_build_tab)
 
         _log_line("Status Log")
         _log_line("")
@@ -4935,32 +5471,100 @@ class App(ctk.CTk):
         header.pack(fill="x", padx=10, pady=10)
         ctk.CTkLabel(header, text=f"Source: {source_url[:60]}...", font=self._font_small, text_color="gray").pack(side="left")
         
-        scroll = ctk.CTkScrollableFrame(res_win)
-        scroll.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        vars_map = []
-        for i, u in enumerate(urls):
-            f = ctk.CTkFrame(scroll, fg_color="transparent")
-            f.pack(fill="x", pady=2)
-            v = tk.BooleanVar(value=True)
-            ctk.CTkCheckBox(f, text="", variable=v, width=20).pack(side="left")
-            ctk.CTkLabel(f, text=f"{i+1}. {u}", font=self._font_small).pack(side="left", padx=5)
-            vars_map.append((u, v))
-            
+        # Virtualized list: a plain Tk canvas with a fixed row height that only
+        # materializes the rows in view, so a 500-item scan keeps ~20 widgets alive.
+        body = ctk.CTkFrame(res_win, fg_color="#0f172a")
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+
+        row_h = 28
+        n = len(urls)
+        canvas = tk.Canvas(body, bg="#0f172a", highlightthickness=0, yscrollincrement=row_h)
+        canvas.grid(row=0, column=0, sticky="nsew", padx=(6, 0), pady=6)
+        sb = ctk.CTkScrollbar(body, command=canvas.yview)
+        sb.grid(row=0, column=1, sticky="ns", pady=6)
+        canvas.configure(scrollregion=(0, 0, 0, n * row_h))
+
+        # Selection lives in a flat bytearray; only on-screen checkbuttons mirror it.
+        selected = bytearray(b"\x01" * n)
+        live_rows: Dict[int, tuple[tk.Checkbutton, tk.IntVar, int, int]] = {}
+
+        def _render_rows(_e=None) -> None:
+            try:
+                top = int(canvas.canvasy(0))
+                height = canvas.winfo_height()
+            except Exception:
+                return
+            i0 = max(0, top // row_h)
+            i1 = min(n, (top + height) // row_h + 1)
+            for i in [i for i in live_rows if i < i0 or i >= i1]:
+                cb, _var, win_id, text_id = live_rows.pop(i)
+                canvas.delete(win_id, text_id)
+                cb.destroy()
+            for i in range(i0, i1):
+                if i in live_rows:
+                    continue
+                y = i * row_h + row_h // 2
+                # Each row owns its variable; without one Tk binds the checkbutton to a global
+                # named after the widget, which is shared with same-named rows in other windows.
+                var = tk.IntVar(master=canvas, value=selected[i])
+                cb = tk.Checkbutton(
+                    canvas,
+                    variable=var,
+                    command=functools.partial(_toggle_row, i),
+                    bg="#0f172a",
+                    activebackground="#0f172a",
+                    selectcolor="#1f538d",
+                    highlightthickness=0,
+                    bd=0,
+                )
+                win_id = canvas.create_window(4, y, window=cb, anchor="w")
+                text_id = canvas.create_text(
+                    32, y, text=f"{i+1}. {urls[i]}", anchor="w", fill="#e2e8f0", font=self._font_small
+                )
+                live_rows[i] = (cb, var, win_id, text_id)
+
+        def _toggle_row(i: int) -> None:
+            selected[i] ^= 1
+
+        def _select_all(flag: bool) -> None:
+            selected[:] = (b"\x01" if flag else b"\x00") * n
+            for _cb, var, _win_id, _text_id in live_rows.values():
+                var.set(1 if flag else 0)
+
+        def _on_yscroll(first, last) -> None:
+            sb.set(first, last)
+            _render_rows()
+
+        def _on_wheel(e) -> None:
+            if getattr(e, "num", None) == 4 or getattr(e, "delta", 0) > 0:
+                canvas.yview_scroll(-3, "units")
+            else:
+                canvas.yview_scroll(3, "units")
+
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.bind("<Configure>", _render_rows)
+        res_win.bind("<MouseWheel>", _on_wheel)
+        res_win.bind("<Button-4>", _on_wheel)
+        res_win.bind("<Button-5>", _on_wheel)
+
+
         def download_selected():
-            to_add = [u for u, v in vars_map if v.get()]
+            to_add = [u for u, flag in zip(urls, selected) if flag]
             res_win.destroy()
             if not to_add: return
             
             self._set_status(f"Adding {len(to_add)} items...")
             opts = self._current_options()
+            jobs = []
             for u in to_add:
                 try:
                     u = self._normalize_url(u)
                 except Exception:
                     pass
-                job = self.manager.add_job(u, opts)
-                self._insert_job(job)
+                jobs.append(self.manager.add_job(u, opts))
+            self._bulk_insert_jobs(jobs)
             
             self._set_status(f"Added {len(to_add)} items to queue")
             if self.auto_start.get():
@@ -4969,8 +5573,8 @@ class App(ctk.CTk):
         footer = ctk.CTkFrame(res_win, fg_color="transparent")
         footer.pack(fill="x", padx=10, pady=10)
         ctk.CTkButton(footer, text=f"Download Selected ({len(urls)})", command=download_selected, fg_color="#10b981").pack(side="right")
-        ctk.CTkButton(footer, text="Select None", command=lambda: [v.set(False) for u, v in vars_map], width=100).pack(side="left", padx=5)
-        ctk.CTkButton(footer, text="Select All", command=lambda: [v.set(True) for u, v in vars_map], width=100).pack(side="left", padx=5)
+        ctk.CTkButton(footer, text="Select None", command=functools.partial(_select_all, False), width=100).pack(side="left", padx=5)
+        ctk.CTkButton(footer, text="Select All", command=functools.partial(_select_all, True), width=100).pack(side="left", padx=5)
 
     def _show_tiktok_block_dialog(self, url: str, err: str) -> None:
         msg = (
@@ -4994,49 +5598,64 @@ class App(ctk.CTk):
         self._select_tab("Advanced")
         self._set_status("Directing to Advanced Settings...")
 
+    _OVERALL_STATUS_MIN_INTERVAL = 0.2
+
     def _refresh_overall_status(self):
-        # Update overall progress
-        jobs = self.manager.jobs()
-        if not jobs:
-            self._overall_progress.set(0.0)
-            self.speed_meter.configure(text="0 KB/s")
+        # Progress ticks arrive far faster than anyone can read them; run at most
+        # every 200 ms and let a single trailing call pick up the last change.
+        elapsed = time.monotonic() - self._last_overall_status
+        if elapsed < self._OVERALL_STATUS_MIN_INTERVAL:
+            if self._overall_status_after is None:
+                delay = int((self._OVERALL_STATUS_MIN_INTERVAL - elapsed) * 1000) + 1
+                self._overall_status_after = self.after(delay, self._refresh_overall_status_trailing)
             return
-            
-        total_p = sum(j.progress for j in jobs) / len(jobs)
-        self._overall_progress.set(total_p / 100.0)
-        
-        running = [j for j in jobs if j.status == "running"]
-        if running:
-            self.speed_meter.configure(text=running[0].speed or "0 KB/s")
-        else:
-            self.speed_meter.configure(text="0 KB/s")
+        self._last_overall_status = time.monotonic()
+
+        progress_sum, n, speed = self.manager.overall()
+        # Each configure/set redraws a CTk canvas, so skip values that did not change.
+        progress = round(progress_sum / n / 100.0, 3) if n else 0.0
+        speed_text = (speed or "0 KB/s") if n else "0 KB/s"
+        if progress != self._last_progress:
+            self._overall_progress.set(progress)
+            self._last_progress = progress
+        if speed_text != self._last_speed_text:
+            self.speed_meter.configure(text=speed_text)
+            self._last_speed_text = speed_text
+
+    def _refresh_overall_status_trailing(self):
+        self._overall_status_after = None
+        self._refresh_overall_status()
+
+
+def _argv_value(argv: list[str], name: str) -> str:
+    # Accepts both "--name value" and "--name=value"; missing flag -> "".
+    prefix = name + "="
+    for i, arg in enumerate(argv):
+        if arg == name:
+            return argv[i + 1] if i + 1 < len(argv) else ""
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return ""
 
 
 def main() -> None:
-    def _cli_log(msg: str) -> None:
-        try:
-            p = _data_path("cli.log")
-            with open(p, "a", encoding="utf-8") as f:
-                f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n")
-        except Exception:
-            pass
+    _cli_log = _debug_log
 
     def _crash_log(title: str, err: BaseException) -> None:
         try:
             p = _data_path("crash.log")
             with open(p, "a", encoding="utf-8") as f:
-                f.write(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] {title}\n")
+                f.write(f"\n[{_now_str()}] {title}\n")
                 f.write("".join(traceback.format_exception(type(err), err, err.__traceback__)))
         except Exception:
             pass
 
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--db-init", dest="db_init", action="store_true")
-    parser.add_argument("--admin-unblock", dest="admin_unblock", default="")
-    parser.add_argument("--admin-delete", dest="admin_delete", default="")
-    args, _unknown = parser.parse_known_args()
+    # Three fixed flags; a plain argv scan keeps argparse off the GUI startup path.
+    argv = sys.argv[1:]
+    admin_unblock = _argv_value(argv, "--admin-unblock")
+    admin_delete = _argv_value(argv, "--admin-delete")
 
-    if bool(getattr(args, "db_init", False)):
+    if "--db-init" in argv:
         store = _make_auth_store_cli(_data_path("snakee.db"))
         if not isinstance(store, _MySQLAuthStore):
             msg = "MySQL is not configured. Create %APPDATA%\\Snakee\\mysql.json or set MYSQL_HOST/MYSQL_USER/MYSQL_PASSWORD."
@@ -5055,26 +5674,26 @@ def main() -> None:
             _cli_log(msg)
             raise SystemExit(2)
 
-    if args.admin_unblock or args.admin_delete:
+    if admin_unblock or admin_delete:
         store = _make_auth_store_cli(_data_path("snakee.db"))
         try:
             store.init_db()
         except Exception:
             pass
-        if args.admin_unblock:
+        if admin_unblock:
             n = 0
             try:
-                n = int(store.admin_unblock(str(args.admin_unblock)))
+                n = int(store.admin_unblock(admin_unblock))
             except Exception:
                 n = 0
             msg = f"Unblocked: {n}"
             print(msg)
             _cli_log(msg)
             raise SystemExit(0 if n > 0 else 1)
-        if args.admin_delete:
+        if admin_delete:
             n = 0
             try:
-                n = int(store.admin_delete(str(args.admin_delete)))
+                n = int(store.admin_delete(admin_delete))
             except Exception:
                 n = 0
             msg = f"Deleted: {n}"
@@ -5084,10 +5703,18 @@ def main() -> None:
 
     try:
         _cli_log("Starting GUI")
+        # Theme setup reads CustomTkinter's theme JSON; only the GUI path needs it.
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
         app = App()
         _cli_log("Entering mainloop")
         app.mainloop()
         _cli_log("Exited mainloop")
+        if not getattr(app, "_workers_idle", True):
+            # A download stuck in extract_info or a merge would keep the non-daemon pool
+            # threads (and the process) alive with no window; exit the way daemon workers did.
+            _cli_log("Workers still busy at exit; forcing exit")
+            os._exit(0)
     except SystemExit:
         raise
     except Exception as e:
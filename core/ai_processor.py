@@ -1,71 +1,119 @@
+import functools
 import re
+from types import MappingProxyType
+
+# Khmer title translation dictionary (mock); read-only and shared by every instance.
+KM_TRANSLATIONS = MappingProxyType({
+    "Official Music Video": "វីដេអូចម្រៀងផ្លូវការ",
+    "Shorts": "វីដេអូខ្លី",
+    "Trailer": "វីដេអូខ្លីនៃរឿង",
+    "Tutorial": "ការបង្ហាញបច្ចេកទេស",
+    "Live Stream": "ការផ្សាយបន្តផ្ទាល់",
+    "Podcast": "ផតខាស",
+    "Highlights": "ចំណុចសំខាន់ៗ",
+    "Full Episode": "ភាគពេញ",
+    "Reaction": "ប្រតិកម្ម",
+    "Review": "ការត្រួតពិនិត្យឡើងវិញ",
+})
+
+# All junk patterns fused into one alternation so a title is scanned once.
+_JUNK_RE = re.compile(
+    r"\[.*?\]"                   # Square brackets
+    r"|\(.*?\)"                  # Parentheses, incl. (Official Music Video)
+    r"|\|.*"                      # Everything after pipe
+    r"|-.*"                       # Everything after dash
+    r"|1080p|720p|4k|8k|hdr"      # Resolution
+    r"|full ?hd"
+    r"|[xh]264|x265|hevc"         # Codecs
+    r"|eng sub|subtitles",        # Subs
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+
+# One case-insensitive alternation over all phrases, longest first so a
+# shorter phrase never shadows a longer one that starts the same way.
+_KM_LOOKUP = {k.lower(): v for k, v in KM_TRANSLATIONS.items()}
+_KM_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(KM_TRANSLATIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+# Same phrases as (lowercased key, translation) pairs, longest first, for the
+# str.find path below; on ten short phrases it beats the regex alternation,
+# most clearly on titles that contain none of them.
+_KM_ITEMS = tuple(sorted(_KM_LOOKUP.items(), key=lambda kv: -len(kv[0])))
+
+
+def _km_sub(m: re.Match) -> str:
+    return _KM_LOOKUP[m.group(0).lower()]
+
+
+def _translate_km(title: str) -> str:
+    low = title.lower()
+    if len(low) != len(title):
+        # Lowercasing changed the length (e.g. "İ"), so indices would not line up.
+        return _KM_RE.sub(_km_sub, title)
+    result = title
+    for key, km in _KM_ITEMS:
+        idx = low.find(key)
+        while idx >= 0:
+            result = result[:idx] + km + result[idx + len(key):]
+            low = low[:idx] + km + low[idx + len(key):]
+            idx = low.find(key, idx + len(km))
+    return result
+
+
+# Titles repeat a lot across a playlist/profile scan; both transforms are pure.
+@functools.lru_cache(maxsize=4096)
+def _smart_name_cached(title: str) -> str:
+    # Trim and remove double spaces
+    new_title = _WS_RE.sub(" ", _JUNK_RE.sub("", title)).strip()
+    return new_title if new_title else title
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_title_cached(title: str, target_lang: str) -> str:
+    if target_lang != "km":
+        return title
+    return _translate_km(title)
+
+
+@functools.lru_cache(maxsize=8)
+def _subtitle_prefix(target: str) -> str:
+    return f"[{target}] "
+
 
 class AIProcessor:
-    def __init__(self):
-        # Khmer title translation dictionary (mock)
-        self.km_translations = {
-            "Official Music Video": "វីដេអូចម្រៀងផ្លូវការ",
-            "Shorts": "វីដេអូខ្លី",
-            "Trailer": "វីដេអូខ្លីនៃរឿង",
-            "Tutorial": "ការបង្ហាញបច្ចេកទេស",
-            "Live Stream": "ការផ្សាយបន្តផ្ទាល់",
-            "Podcast": "ផតខាស",
-            "Highlights": "ចំណុចសំខាន់ៗ",
-            "Full Episode": "ភាគពេញ",
-            "Reaction": "ប្រតិកម្ម",
-            "Review": "ការត្រួតពិនិត្យឡើងវិញ",
-        }
+    km_translations = KM_TRANSLATIONS
 
     def smart_name(self, title: str) -> str:
         """Cleans title by removing common junk."""
-        junk = [
-            r"\[.*?\]",                   # Square brackets
-            r"\(.*?\)",                   # Parentheses
-            r"\|.*",                      # Everything after pipe
-            r"-.*",                       # Everything after dash
-            r"\(Official.*?\)",           # (Official Music Video)
-            r"1080p|720p|4k|8k|hdr",      # Resolution
-            r"full hd|fullhd",
-            r"x264|h264|x265|hevc",      # Codecs
-            r"eng sub|subtitles",        # Subs
-        ]
-        new_title = title
-        for pattern in junk:
-            new_title = re.sub(pattern, "", new_title, flags=re.IGNORECASE)
-        
-        # Trim and remove double spaces
-        new_title = re.sub(r"\s+", " ", new_title).strip()
-        return new_title if new_title else title
+        return _smart_name_cached(title)
 
     def translate_title(self, title: str, target_lang: str = "km") -> str:
         """Mock translation for title using dictionary."""
-        if target_lang != "km":
-            return title
-            
-        new_title = title
-        for en, km in self.km_translations.items():
-            pattern = re.compile(re.escape(en), re.IGNORECASE)
-            new_title = pattern.sub(km, new_title)
-        
-        return new_title
+        return _translate_title_cached(title, target_lang)
 
     def generate_summary(self, info: dict) -> str:
         """Generates a smart summary from video metadata."""
         title = info.get("title", "Unknown")
         uploader = info.get("uploader", "Unknown")
         views = info.get("view_count", 0)
-        duration = info.get("duration", 0)
-        categories = ", ".join(info.get("categories", []))
-        
-        summary = f"--- AI Analysis Summary ---\n"
-        summary += f"Title: {title}\n"
-        summary += f"Creator: {uploader}\n"
-        summary += f"Duration: {int(duration)//60}:{int(duration)%60:02d}\n"
-        summary += f"Category: {categories if categories else 'N/A'}\n"
-        summary += f"Reach: {views:,} views\n"
-        summary += "--- AI Insights ---\n"
-        summary += "Content appears to be professionally produced with high engagement potential."
-        return summary
+        mm, ss = divmod(int(info.get("duration", 0) or 0), 60)
+        cats = info.get("categories")
+        categories = ", ".join(cats) if cats else "N/A"
+
+        return (
+            f"--- AI Analysis Summary ---\n"
+            f"Title: {title}\n"
+            f"Creator: {uploader}\n"
+            f"Duration: {mm}:{ss:02d}\n"
+            f"Category: {categories}\n"
+            f"Reach: {views:,} views\n"
+            "--- AI Insights ---\n"
+            "Content appears to be professionally produced with high engagement potential."
+        )
 
     def auto_noise_reduction(self, job_id: int):
         """Mock AI Noise reduction status."""
@@ -75,11 +123,10 @@ class AIProcessor:
     def predict_cuts(self, duration: float):
         """Predict Intro/Outro cuts based on typical patterns."""
         if not duration: return (0, 0)
-        intro = 5.0 if duration > 60 else 0
-        outro = 10.0 if duration > 300 else 5.0
-        return (intro, outro)
+        # Comparisons are 0/1, so both cuts are plain arithmetic.
+        return (5.0 * (duration > 60), 5.0 + 5.0 * (duration > 300))
 
     def translate_subtitle(self, text: str, target: str = "km") -> str:
         """Mock subtitle translation."""
         # In a real app, this would call a translation API
-        return f"[{target}] {text}"
+        return _subtitle_prefix(target) + text
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import contextlib
 from dataclasses import dataclass, field
+import functools
+import gzip
 import io
+import itertools
+import math
 import random
 import re
 import os
-import queue
+from pathlib import Path
 import threading
 import time
 import urllib.request
 import urllib.parse
-from typing import Any, Callable, Dict, List, Optional
+import zlib
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 try:
     from PIL import Image
@@ -28,6 +35,55 @@ from core.ai_processor import AIProcessor
 StatusCallback = Callable[["DownloadJob"], None]
 LogCallback = Callable[[str], None]
 
+_IMAGE_EXTS = frozenset({"jpg", "jpeg", "png", "webp", "gif", "bmp", "tif", "tiff"})
+# yt-dlp writes some thumbnails with a bare ".image" extension.
+_IMAGE_PATH_EXTS = _IMAGE_EXTS | {"image"}
+_IMAGE_FILE_EXTS = frozenset("." + e for e in _IMAGE_PATH_EXTS)
+# Formats kept as-is after download; only their header is read unless strict
+# verification is requested through the environment.
+_FINAL_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif"})
+_STRICT_IMG_VERIFY = os.environ.get("SNAKEE_STRICT_IMG_VERIFY", "").strip() == "1"
+
+_EXT_FOLDER: Dict[str, Tuple[str, ...]] = {
+    "jpg": ("Images", "JPG"),
+    "jpeg": ("Images", "JPG"),
+    "png": ("Images", "PNG"),
+    "gif": ("Images", "GIF"),
+    "webp": ("Images", "WEBP"),
+    "mp4": ("Videos", "MP4"),
+    "mkv": ("Videos", "MKV"),
+    "webm": ("Videos", "WEBM"),
+    "mov": ("Videos", "MOV"),
+    "mp3": ("Audio", "MP3"),
+    "m4a": ("Audio", "M4A"),
+    "wav": ("Audio", "WAV"),
+    "flac": ("Audio", "FLAC"),
+    "vtt": ("Subtitles",),
+    "srt": ("Subtitles",),
+    "ass": ("Subtitles",),
+    "ssa": ("Subtitles",),
+    "txt": ("Text",),
+}
+_EXT_FOLDER_JOINED: Dict[str, str] = {k: os.path.join(*v) for k, v in _EXT_FOLDER.items()}
+
+# Single-pass scanners for the HTML fallbacks in expand_url_entries. They run on
+# the raw response bytes so multi-MB pages are never decoded as a whole. A full
+# URL also yields its canonical www form, matching what the separate path-only
+# patterns used to pick up from inside it.
+_PIN_RE = re.compile(
+    rb"(?P<full>https?://(?:www\.)?pinterest\.[^\s\"']+(?P<fpath>/pin/\d+/))"
+    rb"|(?P<path>/pin/\d+/)"
+    rb"|(?P<short>https?://pin\.it/[A-Za-z0-9]+)",
+    re.IGNORECASE,
+)
+_FB_REEL_RE = re.compile(
+    rb"(?P<full>https?://(?:www\.|web\.|m\.)?facebook\.com/reel/(?P<fid>\d+))"
+    rb"|/reels?/(?P<pid>\d+)"
+    rb"|\"reel_id\"\s*:\s*\"(?P<rid>\d+)\""
+    rb"|\"video_id\"\s*:\s*\"(?P<vid>\d+)\"",
+    re.IGNORECASE,
+)
+
 
 def _sanitize_filename(value: str) -> str:
     v = str(value or "").strip()
@@ -50,11 +106,129 @@ def _is_probably_url(value: str) -> bool:
     return bool(u.scheme and u.netloc)
 
 
-def _validate_cookiefile(cookiefile: str) -> str:
-    p = str(cookiefile or "").strip()
-    if not p:
-        return ""
+# Queued jobs usually share one cookies path; results are reused for a few
+# seconds so a batch does not stat the same file once per job, while a file
+# the user adds or removes is still picked up almost immediately.
+_COOKIEFILE_TTL = 5.0
+
+_NOTIFY_INTERVAL = 0.1
+_TERMINAL_STATUSES = frozenset({"done", "error", "cancelled"})
+
+# yt-dlp error text that means "format selection failed", and the login/rate-limit
+# markers that are worth a backoff-and-retry. Searched case-insensitively on the raw message.
+_FORMAT_UNAVAIL_RE = re.compile(r"requested format", re.IGNORECASE)
+_BLOCK_ERROR_RE = re.compile(
+    r"sign in|cookies|confirm you[\u2019']re not a bot|captcha|429|too many requests|http error 403|forbidden",
+    re.IGNORECASE,
+)
+
+
+def _is_block_error(message: str) -> bool:
+    return _BLOCK_ERROR_RE.search(str(message or "")) is not None
+
+
+_ERR_BLOCK_WITH_COOKIES = (
+    "YouTube blocked this request (403/429/bot). "
+    "The provided cookies file ({cookie_name}) might be expired or invalid. "
+    "Please export a fresh cookies.txt from your browser and try again."
+)
+_ERR_BLOCK_NO_COOKIES = (
+    "YouTube blocked this request (403/429/bot). "
+    "You must export browser cookies to a cookies.txt file and select it in the Advanced or Settings tab."
+)
+
+
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after[:\s]+(\d+)", re.IGNORECASE)
+
+# Block retries back off with decorrelated jitter capped at _RETRY_CAP seconds. When many
+# blocks land inside _RATE_WINDOW across all workers, the cap is raised so the queue as
+# a whole backs off instead of hammering the limiter.
+_RETRY_CAP = 60.0
+_RETRY_CAP_CONGESTED = 180.0
+_RATE_WINDOW = 60.0
+_RATE_WINDOW_MAX = 5
+_RECENT_BLOCKS: Deque[float] = deque(maxlen=64)
+_RECENT_BLOCKS_LOCK = threading.Lock()
+
+
+def _block_retry_delay(message: str, prev_delay: float) -> float:
+    now = time.monotonic()
+    with _RECENT_BLOCKS_LOCK:
+        _RECENT_BLOCKS.append(now)
+        recent = sum(1 for t in _RECENT_BLOCKS if now - t <= _RATE_WINDOW)
+    cap = _RETRY_CAP_CONGESTED if recent > _RATE_WINDOW_MAX else _RETRY_CAP
+    m = _RETRY_AFTER_RE.search(str(message or ""))
+    if m:
+        # The server said how long to wait; honour it (within the cap).
+        return min(cap, max(1.0, float(m.group(1))))
+    return min(cap, random.uniform(1.0, max(1.0, prev_delay) * 3.0))
+
+
+# Top-level ydl_opts keys left out of each DownloadManager._ydl_opts_for variant.
+_YDL_MODE_DROPS: Dict[str, frozenset] = {
+    "probe": frozenset({"postprocessors", "postprocessor_args"}),
+    "image": frozenset({
+        "format",
+        "merge_output_format",
+        "postprocessors",
+        "postprocessor_args",
+        "writesubtitles",
+        "writeautomaticsub",
+        "subtitleslangs",
+        "subtitlesformat",
+    }),
+    "fallback": frozenset({"format", "merge_output_format"}),
+}
+
+# Quality choice -> max video height for _format_string ("best" = no cap).
+_HEIGHT_MAP: Dict[str, Optional[int]] = {
+    "144p": 144,
+    "240p": 240,
+    "360p": 360,
+    "480p": 480,
+    "720p": 720,
+    "1080p": 1080,
+    "2k": 1440,
+    "4k": 2160,
+    "8k": 4320,
+    "best": None,
+}
+
+
+def _format_selector(h: Optional[int], bucket: str) -> str:
+    if h is None:
+        if bucket == "any":
+            return "bestvideo+bestaudio/best"
+        if bucket == "hi":
+            return "bestvideo[fps>=60]+bestaudio/best/bestvideo+bestaudio/best"
+        return "bestvideo[fps<=30]+bestaudio/best/bestvideo+bestaudio/best"
+
+    if bucket == "any":
+        return f"bestvideo[height<={h}]+bestaudio/best[height<={h}]"
+
+    if bucket == "hi":
+        return (
+            f"bestvideo[height<={h}][fps>=60]+bestaudio/best/"
+            f"bestvideo[height<={h}]+bestaudio/best"
+        )
 
+    return (
+        f"bestvideo[height<={h}][fps<=30]+bestaudio/best/"
+        f"bestvideo[height<={h}]+bestaudio/best"
+    )
+
+
+# (max height, fps bucket) -> yt-dlp format selector for every quality choice; fps
+# buckets are "any" (<= 0 / auto), "hi" (>= 60) and "lo" (anything in between).
+_FORMAT_TABLE: Dict[Tuple[Optional[int], str], str] = {
+    (h, bucket): _format_selector(h, bucket)
+    for h in set(_HEIGHT_MAP.values())
+    for bucket in ("any", "hi", "lo")
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_cookiefile_cached(p: str, _bucket: int) -> str:
     if _is_probably_url(p):
         return ""
     try:
@@ -65,141 +239,228 @@ def _validate_cookiefile(cookiefile: str) -> str:
     return ""
 
 
+def _validate_cookiefile(cookiefile: str) -> str:
+    p = str(cookiefile or "").strip()
+    if not p:
+        return ""
+    return _validate_cookiefile_cached(p, int(time.monotonic() // _COOKIEFILE_TTL))
+
+
 def _is_image_path(path: str) -> bool:
     ext = os.path.splitext(path or "")[1].lower().lstrip(".")
-    return ext in {"jpg", "jpeg", "png", "webp", "gif", "bmp", "tif", "tiff", "image"}
+    return ext in _IMAGE_PATH_EXTS
 
 
 def _collect_filepaths(info: Any) -> List[str]:
-    def _collect(node: Any, acc: List[str]) -> None:
+    # Iterative pre-order walk (children pushed in reverse) so huge playlists
+    # cannot hit the recursion limit; output order matches the recursive version.
+    paths: List[str] = []
+    stack: List[Any] = [info]
+    while stack:
+        node = stack.pop()
         if not node:
-            return
+            continue
         if isinstance(node, dict):
             for k in ("filepath", "filename", "_filename"):
                 v = node.get(k)
                 if isinstance(v, str) and v.strip():
-                    acc.append(v.strip())
-            for k in ("requested_downloads", "entries"):
+                    paths.append(v.strip())
+            for k in ("entries", "requested_downloads"):
                 v = node.get(k)
                 if isinstance(v, list):
-                    for e in v:
-                        _collect(e, acc)
+                    stack.extend(reversed(v))
         elif isinstance(node, list):
-            for e in node:
-                _collect(e, acc)
+            stack.extend(reversed(node))
+    return list(dict.fromkeys(paths))
 
-    paths: List[str] = []
-    _collect(info, paths)
-    out: List[str] = []
-    seen = set()
-    for p in paths:
-        if p not in seen:
-            out.append(p)
-            seen.add(p)
-    return out
 
+def _save_converted_image(im: Any, base: str) -> str:
+    has_alpha = (im.mode in {"RGBA", "LA"}) or ("transparency" in getattr(im, "info", {}))
+    if has_alpha:
+        out_path = base + ".png"
+        im.save(out_path, format="PNG", optimize=True, compress_level=9)
+    else:
+        out_path = base + ".jpg"
+        im = im.convert("RGB")
+        im.save(out_path, format="JPEG", quality=90, optimize=True, progressive=True, subsampling=2)
+    return out_path
 
-def _cleanup_images(paths: List[str]) -> List[str]:
-    kept: List[str] = []
-    for p in paths:
-        if not p or not _is_image_path(p):
-            continue
-        if not os.path.exists(p):
-            continue
+
+def _cleanup_one_image(p: str) -> Optional[str]:
+    if not p or not _is_image_path(p):
+        return None
+    if not os.path.exists(p):
+        return None
+    try:
+        if os.path.getsize(p) < 512:
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+            return None
+    except Exception:
+        return None
+
+    ext = os.path.splitext(p)[1].lower()
+    if ext in _FINAL_IMAGE_EXTS and Image is not None and not _STRICT_IMG_VERIFY:
+        # Image.open only parses the header, which is enough for the size filter;
+        # decoding every already-final JPG/PNG/GIF was the bulk of the cleanup cost.
         try:
-            if os.path.getsize(p) < 512:
-                try:
-                    os.remove(p)
-                except Exception:
-                    pass
-                continue
+            with Image.open(p) as im:
+                w, h = im.size
         except Exception:
-            continue
-
-        ok = True
-        w = 0
-        h = 0
-        if Image is not None:
+            w = h = 0
+        if not (w and h) or w < 50 or h < 50:
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+            return None
+        return p
+
+    ok = True
+    w = 0
+    h = 0
+    converted = ""
+    loaded = False
+    if Image is not None:
+        # Open once: a full load() is a stronger check than verify() and
+        # leaves the pixels ready for the webp/.image conversion below.
+        try:
+            with Image.open(p) as im:
+                im.load()
+                loaded = True
+                w, h = im.size
+                if ext in {".webp", ".image"} and w >= 50 and h >= 50:
+                    try:
+                        converted = _save_converted_image(im, os.path.splitext(p)[0])
+                    except Exception:
+                        converted = ""
+        except Exception:
+            if not loaded:
+                ok = False
+        if not ok:
             try:
                 with Image.open(p) as im:
                     w, h = im.size
                     im.verify()
+                ok = True
             except Exception:
                 ok = False
 
-        if not ok:
+    if not ok:
+        try:
+            os.remove(p)
+        except Exception:
+            pass
+        return None
+
+    if w and h and (w < 50 or h < 50):
+        try:
+            os.remove(p)
+        except Exception:
+            pass
+        return None
+
+    if converted:
+        try:
+            os.remove(p)
+        except Exception:
+            pass
+        return converted
+
+    if ext == ".image" and Image is None:
+        out_path = os.path.splitext(p)[0] + ".jpg"
+        try:
+            os.replace(p, out_path)
+            return out_path
+        except Exception:
             try:
                 os.remove(p)
             except Exception:
                 pass
-            continue
+            return None
 
-        if w and h and (w < 50 or h < 50):
+    if ext in {".webp", ".image"} and Image is not None and not loaded:
+        # Fallback for files that passed verify() but could not be fully loaded.
+        try:
+            with Image.open(p) as im:
+                out_path = _save_converted_image(im, os.path.splitext(p)[0])
             try:
                 os.remove(p)
             except Exception:
                 pass
-            continue
+            return out_path
+        except Exception:
+            pass
 
-        ext = os.path.splitext(p)[1].lower()
-        if ext == ".image" and Image is None:
-            out_path = os.path.splitext(p)[0] + ".jpg"
-            try:
-                os.replace(p, out_path)
-                kept.append(out_path)
-                continue
-            except Exception:
-                try:
-                    os.remove(p)
-                except Exception:
-                    pass
-                continue
+    return p
 
-        if ext in {".webp", ".image"} and Image is not None:
-            base = os.path.splitext(p)[0]
-            try:
-                with Image.open(p) as im:
-                    has_alpha = (im.mode in {"RGBA", "LA"}) or ("transparency" in getattr(im, "info", {}))
-                    if has_alpha:
-                        out_path = base + ".png"
-                        im.save(out_path, format="PNG", optimize=True)
-                    else:
-                        out_path = base + ".jpg"
-                        im = im.convert("RGB")
-                        im.save(out_path, format="JPEG", quality=92)
-                try:
-                    os.remove(p)
-                except Exception:
-                    pass
-                kept.append(out_path)
-                continue
-            except Exception:
-                pass
 
-        kept.append(p)
-    return kept
+def _cleanup_images(paths: List[str]) -> List[str]:
+    # Pillow releases the GIL while decoding/encoding, so a small pool overlaps the
+    # per-image work; map() keeps the results in input order.
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        results = [_cleanup_one_image(p) for p in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4, len(unique)), thread_name_prefix="img") as ex:
+            results = list(ex.map(_cleanup_one_image, unique))
+    return [r for r in results if r]
+
+
+def _thumbnail_filepaths(info: Any) -> List[str]:
+    # Files yt-dlp wrote for --write-thumbnail(s); it records them on each thumbnail entry.
+    paths: List[str] = []
+    stack: List[Any] = [info]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            thumbs = node.get("thumbnails")
+            if isinstance(thumbs, list):
+                for t in thumbs:
+                    fp = t.get("filepath") if isinstance(t, dict) else None
+                    if isinstance(fp, str) and fp.strip():
+                        paths.append(fp.strip())
+            for k in ("entries", "requested_downloads"):
+                v = node.get(k)
+                if isinstance(v, list):
+                    stack.extend(reversed(v))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return list(dict.fromkeys(paths))
 
 
-def _cleanup_recent_image_exts(output_dir: str, max_age_seconds: int = 600) -> List[str]:
+def _cleanup_recent_image_exts(
+    output_dir: str, max_age_seconds: int = 600, candidates: Optional[List[str]] = None
+) -> List[str]:
+    # With `candidates` (the files a job is known to have written, possibly none) only
+    # those are cleaned; None falls back to sweeping recent images in output_dir.
+    if candidates is not None:
+        return _cleanup_images([p for p in candidates if os.path.splitext(p)[1].lower() in _IMAGE_FILE_EXTS])
+
     out_dir = str(output_dir or "").strip()
     if not out_dir or not os.path.isdir(out_dir):
         return []
     now = time.time()
-    candidates: List[str] = []
+    candidates = []
+    max_age = max(1, int(max_age_seconds))
     try:
-        for name in os.listdir(out_dir):
-            p = os.path.join(out_dir, name)
-            if not os.path.isfile(p):
-                continue
-            ext = os.path.splitext(p)[1].lower()
-            if ext not in {".image", ".webp", ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tif", ".tiff"}:
-                continue
-            try:
-                mtime = os.path.getmtime(p)
-            except Exception:
-                continue
-            if (now - mtime) <= max(1, int(max_age_seconds)):
-                candidates.append(p)
+        # scandir reuses the directory entry's cached type/stat info instead of
+        # issuing separate isfile/getmtime syscalls for every file.
+        with os.scandir(out_dir) as it:
+            for entry in it:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext not in _IMAGE_FILE_EXTS:
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except Exception:
+                    continue
+                if (now - mtime) <= max_age:
+                    candidates.append(entry.path)
     except Exception:
         return []
 
@@ -213,49 +474,34 @@ def _organize_download_outputs(paths: List[str], output_dir: str) -> Dict[str, s
 
     def _folder_for_ext(ext: str) -> str:
         e = (ext or "").lower().lstrip(".")
-        if e in {"jpg", "jpeg"}:
-            return os.path.join("Images", "JPG")
-        if e in {"png"}:
-            return os.path.join("Images", "PNG")
-        if e in {"gif"}:
-            return os.path.join("Images", "GIF")
-        if e in {"webp"}:
-            return os.path.join("Images", "WEBP")
-        if e in {"mp4"}:
-            return os.path.join("Videos", "MP4")
-        if e in {"mkv"}:
-            return os.path.join("Videos", "MKV")
-        if e in {"webm"}:
-            return os.path.join("Videos", "WEBM")
-        if e in {"mov"}:
-            return os.path.join("Videos", "MOV")
-        if e in {"mp3"}:
-            return os.path.join("Audio", "MP3")
-        if e in {"m4a"}:
-            return os.path.join("Audio", "M4A")
-        if e in {"wav"}:
-            return os.path.join("Audio", "WAV")
-        if e in {"flac"}:
-            return os.path.join("Audio", "FLAC")
-        if e in {"vtt", "srt", "ass", "ssa"}:
-            return "Subtitles"
-        if e in {"txt"}:
-            return "Text"
+        folder = _EXT_FOLDER_JOINED.get(e)
+        if folder:
+            return folder
         if e:
             return os.path.join("Other", e.upper())
         return "Other"
 
-    def _unique_path(dst: str) -> str:
-        if not os.path.exists(dst):
-            return dst
-        base, ext = os.path.splitext(dst)
+    abspath = os.path.abspath
+    normcase = os.path.normcase
+
+    def _unique_name(name: str, used: set[str]) -> str:
+        if normcase(name) not in used:
+            return name
+        base, ext = os.path.splitext(name)
         for i in range(1, 5000):
             cand = f"{base} ({i}){ext}"
-            if not os.path.exists(cand):
+            if normcase(cand) not in used:
                 return cand
-        return dst
+        return name
 
-    moved: Dict[str, str] = {}
+    # normcase keeps the prefix test case-insensitive on Windows, like commonpath was.
+    isfile = os.path.isfile
+    od = normcase(abspath(out_dir))
+    od_prefix = od if od.endswith(os.sep) else od + os.sep
+
+    # First pass: group the files by destination folder so each folder is
+    # created once rather than once per file.
+    by_target: Dict[str, List[Tuple[str, str]]] = {}
     seen: set[str] = set()
     for p in paths:
         if not p or not isinstance(p, str):
@@ -264,41 +510,251 @@ def _organize_download_outputs(paths: List[str], output_dir: str) -> Dict[str, s
             continue
         seen.add(p)
         try:
-            if not os.path.exists(p) or not os.path.isfile(p):
+            if not isfile(p):
                 continue
         except Exception:
             continue
 
         try:
             # Only organize files that are inside output_dir
-            ap = os.path.abspath(p)
-            od = os.path.abspath(out_dir)
-            if os.path.commonpath([ap, od]) != od:
+            ap = normcase(abspath(p))
+            if not (ap == od or ap.startswith(od_prefix)):
                 continue
         except Exception:
             continue
 
-        ext = os.path.splitext(p)[1]
-        folder = _folder_for_ext(ext)
-        target_dir = os.path.join(out_dir, folder)
+        target_dir = os.path.join(out_dir, _folder_for_ext(os.path.splitext(p)[1]))
+        by_target.setdefault(target_dir, []).append((p, ap))
+
+    moved: Dict[str, str] = {}
+    for target_dir, files in by_target.items():
         try:
             os.makedirs(target_dir, exist_ok=True)
+            # One listing per folder replaces an exists() probe per candidate name.
+            with os.scandir(target_dir) as it:
+                used = {normcase(e.name) for e in it}
         except Exception:
             continue
 
-        dst = os.path.join(target_dir, os.path.basename(p))
-        dst = _unique_path(dst)
-        if os.path.abspath(dst) == os.path.abspath(p):
-            continue
-        try:
-            os.replace(p, dst)
-            moved[p] = dst
-        except Exception:
-            # If move fails, leave file in place
-            continue
+        for p, ap in files:
+            name = os.path.basename(p)
+            if normcase(abspath(os.path.join(target_dir, name))) == ap:
+                continue
+            dst = os.path.join(target_dir, _unique_name(name, used))
+            try:
+                os.replace(p, dst)
+                moved[p] = dst
+                used.add(normcase(os.path.basename(dst)))
+            except Exception:
+                # If move fails, leave file in place
+                continue
     return moved
 
 
+@functools.lru_cache(maxsize=16)
+def _cookie_header_cached(p: str, _mtime: float, domains: Tuple[str, ...]) -> str:
+    try:
+        with open(p, "r", encoding="utf-8", errors="ignore") as f:
+            raw = f.read()
+    except Exception:
+        return ""
+
+    # Netscape columns: 0 = domain, 5 = name, 6 = value.
+    parts = [
+        f"{cols[5].strip()}={cols[6].strip()}"
+        for line in raw.splitlines()
+        if (s := line.strip())
+        and not s.startswith("#")
+        and len(cols := s.split("\t")) >= 7
+        and cols[5].strip()
+        and (not domains or any(d in cols[0].lower() for d in domains))
+    ]
+    return "; ".join(parts)
+
+
+def _cookie_header_from_netscape_file(path: str, domains: List[str]) -> str:
+    # Parsed headers are cached per (file, mtime, domains); re-exporting cookies.txt
+    # changes the mtime and so forces a fresh parse.
+    p = _validate_cookiefile(path)
+    if not p:
+        return ""
+    return _cookie_header_cached(p, _cookiefile_mtime(p), tuple(domains))
+
+
+def _fetch_html(url: str, headers: Dict[str, str], timeout: float) -> bytes:
+    # Ask for a compressed body; scraped profile pages shrink several-fold over the wire.
+    req = urllib.request.Request(url, headers=dict(headers, **{"Accept-Encoding": "gzip, deflate"}))
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        data = resp.read()
+        encoding = str(resp.headers.get("Content-Encoding") or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+# Image-mode verdicts from the pre-download probe, keyed on (url, cookiefile, cookies mtime),
+# so retries and re-queued jobs skip a second metadata round-trip to the site.
+_PROBE_TTL = 300.0
+_PROBE_CACHE: Dict[Tuple[str, str, float], Tuple[float, bool]] = {}
+_PROBE_LOCK = threading.Lock()
+
+
+def _probe_cache_get(key: Tuple[str, str, float]) -> Optional[bool]:
+    with _PROBE_LOCK:
+        hit = _PROBE_CACHE.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > _PROBE_TTL:
+            del _PROBE_CACHE[key]
+            return None
+        return hit[1]
+
+
+def _probe_cache_put(key: Tuple[str, str, float], is_image_mode: bool) -> None:
+    now = time.monotonic()
+    with _PROBE_LOCK:
+        if len(_PROBE_CACHE) >= 256:
+            for k in [k for k, (ts, _) in _PROBE_CACHE.items() if now - ts > _PROBE_TTL]:
+                del _PROBE_CACHE[k]
+            if len(_PROBE_CACHE) >= 256:
+                _PROBE_CACHE.clear()
+        _PROBE_CACHE[key] = (now, is_image_mode)
+
+
+class _TailBuffer(io.TextIOBase):
+    # Stand-in for StringIO that only remembers the last `maxlen` writes, so a long
+    # download cannot grow the capture without bound.
+    def __init__(self, maxlen: int = 200):
+        super().__init__()
+        self._chunks: Deque[str] = deque(maxlen=maxlen)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        self._chunks.append(s)
+        return len(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+
+def _playlist_pos(d: Dict[str, Any]) -> Tuple[int, int]:
+    # (playlist index, playlist count) from a yt-dlp progress dict; (0, 0) when unknown.
+    info = d.get("info_dict")
+    if not isinstance(info, dict):
+        info = {}
+    playlist_index = info.get("playlist_index") or d.get("playlist_index")
+    playlist_count = (
+        info.get("playlist_count")
+        or info.get("n_entries")
+        or d.get("playlist_count")
+        or d.get("playlist_n_entries")
+    )
+    try:
+        pi = int(playlist_index) if playlist_index else 0
+    except Exception:  # noqa: BLE001
+        pi = 0
+    try:
+        pc = int(playlist_count) if playlist_count else 0
+    except Exception:  # noqa: BLE001
+        pc = 0
+    return pi, pc
+
+
+class _CancelledDownload(BaseException):
+    # Raised from the progress hook when a job is cancelled. Deriving from BaseException
+    # keeps yt-dlp's (and our retry loop's) `except Exception` handlers from treating it
+    # as a download error to report or retry.
+    pass
+
+
+class _YDLLogger:
+    def __init__(self, log_fn: Callable[[str], None]):
+        self._log_fn = log_fn
+
+    def debug(self, msg: str) -> None:
+        return
+
+    def warning(self, msg: str) -> None:
+        self._log_fn(str(msg))
+
+    def error(self, msg: str) -> None:
+        self._log_fn(str(msg))
+
+
+class _QuietLogger:
+    def debug(self, msg: str) -> None:
+        pass
+
+    info = warning = error = debug
+
+
+# Metadata lookups (inspect/expand) reuse YoutubeDL instances across calls and threads:
+# constructing one initialises every extractor, which dominates short lookups. An
+# instance is checked out while in use, so two threads never share one at a time.
+_YDL_CACHE: Dict[str, Tuple[Any, float]] = {}
+_YDL_CACHE_LOCK = threading.Lock()
+
+
+def _cookiefile_mtime(cookiefile: str) -> float:
+    if not cookiefile:
+        return 0.0
+    try:
+        return os.path.getmtime(cookiefile)
+    except Exception:
+        return 0.0
+
+
+def _close_ydl(ydl: Any) -> None:
+    with contextlib.suppress(Exception):
+        ydl.close()
+
+
+def _close_shared_ydl() -> None:
+    # Close the cached lookup instances (session, cookie jar); called on shutdown.
+    with _YDL_CACHE_LOCK:
+        cached = list(_YDL_CACHE.values())
+        _YDL_CACHE.clear()
+    for ydl, _mtime in cached:
+        _close_ydl(ydl)
+
+
+def _extract_info_shared(url: str, ydl_opts: Dict[str, Any]) -> Any:
+    cookiefile = str(ydl_opts.get("cookiefile") or "")
+    key = repr(ydl_opts)
+    mtime = _cookiefile_mtime(cookiefile)
+    with _YDL_CACHE_LOCK:
+        hit = _YDL_CACHE.pop(key, None)
+    if hit is not None and hit[1] != mtime:
+        # cookies.txt was replaced on disk; reload it with a fresh instance.
+        _close_ydl(hit[0])
+        hit = None
+    # The logger keeps the cached instance from holding on to a redirected stdout.
+    ydl = hit[0] if hit is not None else YoutubeDL(dict(ydl_opts, logger=_QuietLogger()))
+
+    # _QuietLogger already swallows yt-dlp's messages, so no stdout/stderr redirect here.
+    try:
+        return ydl.extract_info(url, download=False)
+    finally:
+        if cookiefile:
+            # close() used to write the jar back after every call; keep doing that.
+            with contextlib.suppress(Exception):
+                ydl.save_cookies()
+        with _YDL_CACHE_LOCK:
+            # Another lookup may have checked in its own instance meanwhile; keep one.
+            spare = _YDL_CACHE.get(key)
+            if spare is None:
+                _YDL_CACHE[key] = (ydl, _cookiefile_mtime(cookiefile))
+        if spare is not None:
+            _close_ydl(ydl)
+
+
 def inspect_url(url: str, cookies_file: str = "", allow_playlist: bool = False) -> Dict[str, Any]:
     if YoutubeDL is None:
         raise RuntimeError("yt-dlp is not installed. Install it with: pip install yt-dlp")
@@ -324,10 +780,7 @@ def inspect_url(url: str, cookies_file: str = "", allow_playlist: bool = False)
         ydl_opts["cookiefile"] = cookiefile
 
     try:
-        buf = io.StringIO()
-        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+        info = _extract_info_shared(url, ydl_opts)
     except Exception as e:  # noqa: BLE001
         raise ValueError(f"Inspect failed: {e}")
     if not isinstance(info, dict):
@@ -354,77 +807,49 @@ def expand_url_entries(url: str, cookies_file: str = "", allow_playlist: bool =
         new_host = host
         if host.startswith("web.facebook.com") or host.startswith("m.facebook.com"):
             new_host = "www.facebook.com"
+        new_query = parsed.query
+        # Most links carry neither redirect marker; leave their query untouched.
+        if "_rdc" in new_query or "_rdr" in new_query:
+            try:
+                qs = urllib.parse.parse_qs(new_query)
+                qs.pop("_rdc", None)
+                qs.pop("_rdr", None)
+                new_query = urllib.parse.urlencode(qs, doseq=True)
+            except Exception:
+                new_query = parsed.query
         try:
-            qs = urllib.parse.parse_qs(parsed.query)
-            qs.pop("_rdc", None)
-            qs.pop("_rdr", None)
-            new_query = urllib.parse.urlencode(qs, doseq=True)
-        except Exception:
-            new_query = parsed.query
-        try:
-            return urllib.parse.urlunsplit((parsed.scheme or "https", new_host or parsed.netloc, parsed.path, new_query, ""))
+            return urllib.parse.urlunsplit(
+                parsed._replace(scheme=parsed.scheme or "https", netloc=new_host or parsed.netloc, query=new_query, fragment="")
+            )
         except Exception:
             return s
 
-    def _cookie_header_from_netscape_file(path: str, domains: List[str]) -> str:
-        p = _validate_cookiefile(path)
-        if not p:
-            return ""
-        try:
-            with open(p, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.read().splitlines()
-        except Exception:
-            return ""
-
-        parts: List[str] = []
-        for line in lines:
-            s = (line or "").strip()
-            if not s or s.startswith("#"):
-                continue
-            cols = s.split("\t")
-            if len(cols) < 7:
-                continue
-            domain = (cols[0] or "").strip().lower()
-            name = (cols[5] or "").strip()
-            value = (cols[6] or "").strip()
-            if not name:
-                continue
-            if domains and not any(d in domain for d in domains):
-                continue
-            parts.append(f"{name}={value}")
-
-        return "; ".join(parts)
-
     def _html_pin_links(u: str) -> List[str]:
         try:
-            req = urllib.request.Request(
+            html = _fetch_html(
                 u,
-                headers={
+                {
                     "User-Agent": "Mozilla/5.0",
                     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 },
+                timeout=20,
             )
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                html = resp.read().decode("utf-8", errors="ignore")
         except Exception:
             return []
 
         links: List[str] = []
 
-        for m in re.finditer(r"https?://(?:www\.)?pinterest\.[^\s\"']+/pin/\d+/", html, flags=re.IGNORECASE):
-            links.append(m.group(0))
-        for m in re.finditer(r"/pin/\d+/", html, flags=re.IGNORECASE):
-            links.append("https://www.pinterest.com" + m.group(0))
-        for m in re.finditer(r"https?://pin\.it/[A-Za-z0-9]+", html, flags=re.IGNORECASE):
-            links.append(m.group(0))
-
-        out2: List[str] = []
-        seen2 = set()
-        for x in links:
-            if x not in seen2:
-                out2.append(x)
-                seen2.add(x)
-        return out2
+        for m in _PIN_RE.finditer(html):
+            full, fpath, path, short = m.group("full", "fpath", "path", "short")
+            if full:
+                links.append(full.decode("utf-8", errors="ignore"))
+                links.append("https://www.pinterest.com" + fpath.decode("ascii"))
+            elif path:
+                links.append("https://www.pinterest.com" + path.decode("ascii"))
+            else:
+                links.append(short.decode("ascii"))
+
+        return list(dict.fromkeys(links))
 
     def _html_facebook_reel_links(u: str, cookie_header: str = "") -> List[str]:
         try:
@@ -436,36 +861,22 @@ def expand_url_entries(url: str, cookies_file: str = "", allow_playlist: bool =
             }
             if cookie_header:
                 headers["Cookie"] = cookie_header
-            req = urllib.request.Request(u, headers=headers)
-            with urllib.request.urlopen(req, timeout=25) as resp:
-                html = resp.read().decode("utf-8", errors="ignore")
+            html = _fetch_html(u, headers, timeout=25)
         except Exception:
             return []
 
         links: List[str] = []
-        for m in re.finditer(r"https?://(?:www\.|web\.|m\.)?facebook\.com/reel/\d+", html, flags=re.IGNORECASE):
-            links.append(m.group(0))
-        for m in re.finditer(r"href=\\?\"(/reel/\d+)\\?\"", html, flags=re.IGNORECASE):
-            links.append("https://www.facebook.com" + m.group(1))
-        for m in re.finditer(r"/reel/(\d+)", html, flags=re.IGNORECASE):
-            links.append("https://www.facebook.com/reel/" + m.group(1))
-        for m in re.finditer(r"/reels/(\d+)", html, flags=re.IGNORECASE):
-            links.append("https://www.facebook.com/reel/" + m.group(1))
-        for m in re.finditer(r"\"reel_id\"\s*:\s*\"(\d+)\"", html, flags=re.IGNORECASE):
-            links.append("https://www.facebook.com/reel/" + m.group(1))
-        for m in re.finditer(r"\"video_id\"\s*:\s*\"(\d+)\"", html, flags=re.IGNORECASE):
-            links.append("https://www.facebook.com/watch/?v=" + m.group(1))
-
-        out2: List[str] = []
-        seen2 = set()
-        for x in links:
-            x = str(x or "").strip()
-            if not x:
-                continue
-            if x not in seen2:
-                out2.append(x)
-                seen2.add(x)
-        return out2
+        for m in _FB_REEL_RE.finditer(html):
+            full, fid, pid, rid, vid = m.group("full", "fid", "pid", "rid", "vid")
+            if full:
+                links.append(full.decode("ascii"))
+                links.append("https://www.facebook.com/reel/" + fid.decode("ascii"))
+            elif vid:
+                links.append("https://www.facebook.com/watch/?v=" + vid.decode("ascii"))
+            else:
+                links.append("https://www.facebook.com/reel/" + (pid or rid).decode("ascii"))
+
+        return list(dict.fromkeys(x for x in links if x))
 
     ydl_opts: Dict[str, Any] = {
         "quiet": True,
@@ -491,10 +902,7 @@ def expand_url_entries(url: str, cookies_file: str = "", allow_playlist: bool =
 
     info: Any = None
     try:
-        buf = io.StringIO()
-        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+        info = _extract_info_shared(url, ydl_opts)
     except Exception as e:  # noqa: BLE001
         msg = str(e)
         low = msg.lower()
@@ -519,20 +927,13 @@ def expand_url_entries(url: str, cookies_file: str = "", allow_playlist: bool =
                     candidates.append(urllib.parse.urlunsplit((p.scheme or "https", "mbasic.facebook.com", p.path, p.query, "")))
             except Exception:
                 pass
-            out_links: List[str] = []
-            seen_fb = set()
-            for cand in candidates:
+            out_links: Dict[str, None] = {}
+            for cand in dict.fromkeys(candidates):
                 if not cand:
                     continue
-                if cand in seen_fb:
-                    continue
-                seen_fb.add(cand)
-                links = _html_facebook_reel_links(cand, cookie_header=cookie_header)
-                for x in links:
-                    if x not in out_links:
-                        out_links.append(x)
+                out_links.update(dict.fromkeys(_html_facebook_reel_links(cand, cookie_header=cookie_header)))
             if out_links:
-                return out_links
+                return list(out_links)
             raise ValueError(
                 "Facebook reels/profile page could not be expanded into individual reel links. "
                 "This is common for private/login-only pages or pages that require JavaScript. "
@@ -547,43 +948,36 @@ def expand_url_entries(url: str, cookies_file: str = "", allow_playlist: bool =
             )
         raise ValueError(f"Expand failed: {e}")
 
-    def _collect(node: Any, acc: List[str]) -> None:
+    # Same iterative pre-order walk as _collect_filepaths.
+    urls: List[str] = []
+    stack: List[Any] = [info]
+    while stack:
+        node = stack.pop()
         if not node:
-            return
+            continue
         if isinstance(node, dict):
             entries = node.get("entries")
             if isinstance(entries, list):
-                for e in entries:
-                    _collect(e, acc)
-                return
+                stack.extend(reversed(entries))
+                continue
 
             for k in ("webpage_url", "original_url", "url"):
                 v = node.get(k)
                 if isinstance(v, str) and v.strip():
-                    acc.append(v.strip())
-                    return
-
-        if isinstance(node, list):
-            for e in node:
-                _collect(e, acc)
-
-    urls: List[str] = []
-    _collect(info, urls)
+                    urls.append(v.strip())
+                    break
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
 
     # Deduplicate while preserving order
-    out: List[str] = []
-    seen = set()
-    for u in urls:
-        if u not in seen:
-            out.append(u)
-            seen.add(u)
+    out = list(dict.fromkeys(urls))
 
     if not out and ("pinterest.com" in url.lower() or "pin.it" in url.lower()):
         return _html_pin_links(url)
     return out
 
 
-@dataclass
+@dataclass(frozen=True)
 class DownloadOptions:
     output_dir: str
     quality: str
@@ -625,6 +1019,11 @@ class DownloadJob:
     thumbnail: str = ""
     created_at: float = field(default_factory=time.time)
     cancel_event: threading.Event = field(default_factory=threading.Event)
+    # monotonic time of the last "downloading" notification (see _progress_hook)
+    _last_notify: float = field(default=0.0, repr=False, compare=False)
+    # every file yt-dlp reported as finished for this job
+    _created_files: List[str] = field(default_factory=list, repr=False, compare=False)
+    _terminal_notified: bool = field(default=False, repr=False, compare=False)
 
 
 class DownloadManager:
@@ -633,82 +1032,184 @@ class DownloadManager:
         self._on_log = on_log
         self._lock = threading.Lock()
         self._jobs: List[DownloadJob] = []
-        self._pending: "queue.Queue[int]" = queue.Queue()
-        self._workers: List[threading.Thread] = []
-        self._stop_event = threading.Event()
+        # job_id -> job; written only under _lock, read without it (dict.get is atomic).
+        self._by_id: Dict[int, DownloadJob] = {}
+        self._next_id = itertools.count(1)
+        # Jobs wait in _pending until start() creates the executor; after that they are
+        # submitted directly and their futures are kept so queued work can be cancelled.
+        self._pending: List[int] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[int, Future] = {}
+        self._pending_notify: Dict[int, DownloadJob] = {}
+        self._notify_lock = threading.Lock()
+        self._notify_event = threading.Event()
+        self._notify_pump: Optional[threading.Thread] = None
+        self._post_pool = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 4) // 2), thread_name_prefix="post")
+        self._post_futures: Dict[int, Future] = {}
         self.ai = AIProcessor()
+        # Running aggregates for overall(); updated whenever a job is reported.
+        self._progress_sum = 0.0
+        self._seen_progress: Dict[int, float] = {}
+        self._running: Dict[int, DownloadJob] = {}
 
     def add_job(self, url: str, options: DownloadOptions) -> DownloadJob:
         with self._lock:
-            job = DownloadJob(job_id=len(self._jobs) + 1, url=url, options=options)
+            job = DownloadJob(job_id=next(self._next_id), url=url, options=options)
             self._jobs.append(job)
-            self._pending.put(job.job_id)
+            self._by_id[job.job_id] = job
+            self._submit_locked(job)
         self._notify(job)
         return job
 
+    def requeue_job(self, job: DownloadJob) -> None:
+        # Run an already-known job again (retry); the caller resets its fields first.
+        with self._lock:
+            self._submit_locked(job)
+
+    def _submit_locked(self, job: DownloadJob) -> None:
+        if self._executor is None:
+            self._pending.append(job.job_id)
+            return
+        self._futures[job.job_id] = self._executor.submit(self._run_queued, job)
+
+    def track_job(self, job: DownloadJob) -> None:
+        # Fold a job's current progress/status into the aggregates behind overall().
+        with self._lock:
+            try:
+                new = float(job.progress)
+            except Exception:  # noqa: BLE001
+                new = 0.0
+            self._progress_sum += new - self._seen_progress.get(job.job_id, 0.0)
+            self._seen_progress[job.job_id] = new
+            if job.status == "running":
+                self._running.setdefault(job.job_id, job)
+            elif self._running.pop(job.job_id, None) is not None and not self._running:
+                # Queue just went idle: re-add the sum exactly so += deltas never drift.
+                self._progress_sum = math.fsum(self._seen_progress.values())
+
+    def overall(self) -> Tuple[float, int, str]:
+        # (progress sum, job count, speed of the first running job) without touching every job.
+        with self._lock:
+            speed = ""
+            for job in self._running.values():
+                speed = job.speed
+                break
+            return self._progress_sum, len(self._jobs), speed
+
     def jobs(self) -> List[DownloadJob]:
         with self._lock:
             return list(self._jobs)
 
+    def iter_jobs(self) -> Iterator[DownloadJob]:
+        # Lock-free alternative to jobs(): jobs are only ever appended, so a live list
+        # iterator is safe (it may also yield jobs added while iterating) and skips the copy.
+        return iter(self._jobs)
+
     def get_job(self, job_id: int) -> Optional[DownloadJob]:
-        with self._lock:
-            for j in self._jobs:
-                if j.job_id == job_id:
-                    return j
-        return None
+        return self._by_id.get(job_id)
 
     def start(self) -> None:
         with self._lock:
-            if self._workers:
+            if self._executor is not None:
                 return
-        self._stop_event.clear()
-        max_workers = max(1, int(self._jobs[-1].options.concurrent_downloads) if self._jobs else 1)
-        self._workers = []
-        for idx in range(max_workers):
-            t = threading.Thread(target=self._worker_loop, name=f"worker-{idx+1}", daemon=True)
-            self._workers.append(t)
-            t.start()
-        self._log(f"Started {len(self._workers)} worker(s)")
+            max_workers = max(1, int(self._jobs[-1].options.concurrent_downloads) if self._jobs else 1)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="worker")
+            pending, self._pending = self._pending, []
+            for job_id in pending:
+                job = self._by_id.get(job_id)
+                if job is not None:
+                    self._submit_locked(job)
+        self._log(f"Started {max_workers} worker(s)")
 
     def stop(self) -> None:
-        self._stop_event.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            for job_id, fut in list(self._futures.items()):
+                if fut.cancel():
+                    # Not started yet: keep it queued for the next start().
+                    del self._futures[job_id]
+                    self._pending.append(job_id)
+            # Running futures stay in _futures (until _run_queued drops them) so a later
+            # shutdown() can still cancel and wait for them.
+        # Jobs already downloading are left to finish, as the old worker loop did.
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         self._log("Stopping workers...")
 
+    def shutdown(self, timeout: float = 2.0) -> bool:
+        # App exit: unlike stop(), in-flight downloads are cancelled as well. Pool threads
+        # are not daemons and a job inside extract_info or an ffmpeg merge never sees
+        # cancel_event, so only wait `timeout` seconds; False means some are still busy.
+        with self._lock:
+            inflight = list(self._futures.items())
+        self.stop()
+        _close_shared_ydl()
+        deadline = time.monotonic() + timeout
+        busy: List[Future] = []
+        for job_id, fut in inflight:
+            if fut.cancelled():
+                continue
+            job = self._by_id.get(job_id)
+            if job is not None:
+                job.cancel_event.set()
+            busy.append(fut)
+        if busy:
+            wait(busy, timeout=timeout)
+        # Post-processing is not cancellable; drop what has not started and give the
+        # rest whatever is left of the timeout.
+        self._post_pool.shutdown(wait=False, cancel_futures=True)
+        pending = [f for f in list(self._post_futures.values()) if not f.cancelled()]
+        pending += [f for f in busy if not f.done()]
+        if not pending:
+            return True
+        _done, not_done = wait(pending, timeout=max(0.0, deadline - time.monotonic()))
+        return not not_done
+
     def cancel_job(self, job_id: int) -> None:
         job = self.get_job(job_id)
         if not job:
             return
+        if job.status == "postprocessing":
+            # The files are already downloaded; let cleanup and organising finish.
+            return
+        with self._lock:
+            if job_id in self._pending:
+                self._pending.remove(job_id)
+                unqueued = True
+            else:
+                fut = self._futures.get(job_id)
+                # A future that has not started yet can be dropped outright.
+                unqueued = fut is not None and fut.cancel()
+                if unqueued:
+                    del self._futures[job_id]
         job.cancel_event.set()
-        if job.status in {"queued", "running"}:
+        if unqueued:
+            job.status = "cancelled"
+            self._notify(job)
+        elif job.status in {"queued", "running"}:
             job.status = "cancelling"
             self._notify(job)
 
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                job_id = self._pending.get(timeout=0.2)
-            except queue.Empty:
-                continue
-
-            job = self.get_job(job_id)
-            if not job:
-                continue
-
+    def _run_queued(self, job: DownloadJob) -> None:
+        try:
             if job.cancel_event.is_set():
                 job.status = "cancelled"
                 self._notify(job)
-                continue
-
-            try:
-                self._run_job(job)
-            finally:
-                self._pending.task_done()
+                return
+            self._run_job(job)
+        finally:
+            with self._lock:
+                fut = self._futures.get(job.job_id)
+                # Leave a future from a retry submitted meanwhile in place.
+                if fut is not None and fut.running():
+                    del self._futures[job.job_id]
 
     def _run_job(self, job: DownloadJob) -> None:
         job.status = "running"
         job.progress = 0.0
         job.error = ""
         job.thumbnail = ""
+        job._created_files = []
         self._notify(job)
 
         if YoutubeDL is None:
@@ -721,29 +1222,13 @@ class DownloadManager:
         self._log(f"[Security] Verifying {job.url} certificate...")
 
         opts = job.options
-        outtmpl = os.path.join(opts.output_dir, "%(title).200B [%(id)s].%(ext)s")
-
-        def _is_block_error(message: str) -> bool:
-            msg_l = str(message or "").lower()
-            return (
-                "sign in" in msg_l
-                or "cookies" in msg_l
-                or "confirm you\u2019re not a bot" in msg_l
-                or "confirm you're not a bot" in msg_l
-                or "captcha" in msg_l
-                or "429" in msg_l
-                or "too many requests" in msg_l
-                or "http error 403" in msg_l
-                or "forbidden" in msg_l
-            )
 
         def _is_image_info(node: Any) -> bool:
-            image_exts = {"jpg", "jpeg", "png", "webp", "gif", "bmp", "tif", "tiff"}
             if not node:
                 return False
             if isinstance(node, dict):
                 ext = str(node.get("ext") or "").lower().strip().lstrip(".")
-                if ext in image_exts:
+                if ext in _IMAGE_EXTS:
                     vcodec = str(node.get("vcodec") or "").lower()
                     acodec = str(node.get("acodec") or "").lower()
                     if vcodec in {"", "none"} and acodec in {"", "none"}:
@@ -764,182 +1249,92 @@ class DownloadManager:
                     for t in thumbnails:
                         if isinstance(t, dict):
                             te = str(t.get("ext") or "").lower().strip().lstrip(".")
-                            if te in image_exts:
+                            if te in _IMAGE_EXTS:
                                 return True
             if isinstance(node, list):
                 return any(_is_image_info(e) for e in node)
             return False
 
-        ydl_opts: Dict[str, Any] = {
-            "outtmpl": {"default": outtmpl},
-            "noplaylist": not opts.allow_playlist,
-            "retries": max(0, int(opts.retries)),
-            "fragment_retries": max(0, int(opts.retries)),
-            "continuedl": True,
-            "noprogress": True,
-            "progress_hooks": [lambda d: self._progress_hook(job, d)],
-            "concurrent_fragment_downloads": 4,
-            "nopart": False,
-            "quiet": True,
-            "no_warnings": True,
-            "sleep_interval": 1,
-            "max_sleep_interval": 5,
-            "sleep_interval_requests": 1,
-            "http_headers": {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-            "extractor_args": {
-                "tiktok": {
-                    "app_id": "1233", # Pseudo app id
-                    "no_watermark": True,
-                }
-            },
-        }
-
         cookiefile = _validate_cookiefile(opts.cookies_file)
         if opts.cookies_file.strip() and not cookiefile:
             raise ValueError("Invalid cookies file path. Please select a local cookies.txt file (not a URL).")
-        if cookiefile:
-            ydl_opts["cookiefile"] = cookiefile
-
-        if opts.audio_language and opts.audio_language != "auto":
-            # YouTube specific audio language
-            if "extractor_args" not in ydl_opts: ydl_opts["extractor_args"] = {}
-            if "youtube" not in ydl_opts["extractor_args"]: ydl_opts["extractor_args"]["youtube"] = {}
-            ydl_opts["extractor_args"]["youtube"]["lang"] = [opts.audio_language]
-
-        fmt = self._format_string(opts.quality, opts.fps, opts.container, opts.audio_only)
-        if fmt:
-            ydl_opts["format"] = fmt
-
-        postprocessors: List[Dict[str, Any]] = []
 
         if opts.audio_only:
             self._log(f"[AI] {self.ai.auto_noise_reduction(job.job_id)}")
-            postprocessors.append(
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": opts.audio_format,
-                    "preferredquality": "320", 
-                }
-            )
 
-        if opts.container.lower() in {"mp4", "mkv", "webm"} and not opts.audio_only:
-            ydl_opts["merge_output_format"] = opts.container.lower()
+        progress_hooks = [lambda d: self._progress_hook(job, d)]
+        ydl_logger = _YDLLogger(self._log)
 
-        if opts.write_thumbnail:
-            ydl_opts["writethumbnail"] = True
-            ydl_opts["write_all_thumbnails"] = True
-
-        if opts.write_subtitles or opts.auto_subtitles:
-            ydl_opts["writesubtitles"] = opts.write_subtitles
-            ydl_opts["writeautomaticsub"] = opts.auto_subtitles
-            if opts.subtitle_langs.strip():
-                ydl_opts["subtitleslangs"] = [s.strip() for s in opts.subtitle_langs.split(",") if s.strip()]
-            ydl_opts["subtitlesformat"] = opts.subtitle_format
-
-        if opts.embed_subtitles and (opts.write_subtitles or opts.auto_subtitles) and not opts.audio_only:
-            postprocessors.append({"key": "FFmpegEmbedSubtitle"})
-
-        # Trim feature
-        if opts.trim_start or opts.trim_end:
-            # We use external_args to pass to ffmpeg
-            ffmpeg_args = []
-            if opts.trim_start:
-                ffmpeg_args.extend(["-ss", opts.trim_start])
-            if opts.trim_end:
-                ffmpeg_args.extend(["-to", opts.trim_end])
-            
-            if "postprocessor_args" not in ydl_opts:
-                ydl_opts["postprocessor_args"] = {}
-            if "ffmpeg" not in ydl_opts["postprocessor_args"]:
-                ydl_opts["postprocessor_args"]["ffmpeg"] = []
-            ydl_opts["postprocessor_args"]["ffmpeg"].extend(ffmpeg_args)
-
-        if postprocessors:
-            ydl_opts["postprocessors"] = postprocessors
-
-        is_image_mode = False
-        try:
-            probe_opts = dict(ydl_opts)
-            probe_opts["skip_download"] = True
-            probe_opts.pop("postprocessors", None)
-            probe_opts.pop("postprocessor_args", None)
-            probe_opts.pop("progress_hooks", None)
-            probe_opts.pop("logger", None)
-            buf_probe = io.StringIO()
-            with contextlib.redirect_stdout(buf_probe), contextlib.redirect_stderr(buf_probe):
-                with YoutubeDL(probe_opts) as ydl:
-                    probe_info = ydl.extract_info(job.url, download=False)
-            is_image_mode = _is_image_info(probe_info)
-        except Exception:
+        def _job_opts(mode: str) -> Dict[str, Any]:
+            # Per-job additions on top of the cached option set for `mode`.
+            o = dict(self._ydl_opts_for(opts, mode))
+            if mode != "probe":
+                o["progress_hooks"] = progress_hooks
+                o["logger"] = ydl_logger
+            else:
+                # The probe's output is thrown away; a quiet logger does that without
+                # swapping the process-wide stdout/stderr under other threads.
+                o["logger"] = _QuietLogger()
+            if cookiefile:
+                o["cookiefile"] = cookiefile
+            return o
+
+        probe_key = (job.url, cookiefile, _cookiefile_mtime(cookiefile))
+        cached_mode = _probe_cache_get(probe_key)
+        if cached_mode is not None:
+            is_image_mode = cached_mode
+        else:
             is_image_mode = False
+            try:
+                with YoutubeDL(_job_opts("probe")) as ydl:
+                    probe_info = ydl.extract_info(job.url, download=False)
+                is_image_mode = _is_image_info(probe_info)
+                # Failed probes are not cached so a transient error is retried next time.
+                _probe_cache_put(probe_key, is_image_mode)
+            except Exception:
+                is_image_mode = False
 
         if is_image_mode:
-            ydl_opts.pop("format", None)
-            ydl_opts.pop("merge_output_format", None)
-            ydl_opts.pop("postprocessors", None)
-            ydl_opts.pop("postprocessor_args", None)
-            ydl_opts.pop("writesubtitles", None)
-            ydl_opts.pop("writeautomaticsub", None)
-            ydl_opts.pop("subtitleslangs", None)
-            ydl_opts.pop("subtitlesformat", None)
             self._log("[Info] Detected image-only post. Downloading images (no merge/ffmpeg).")
-
-        class _YDLLogger:
-            def __init__(self, log_fn: Callable[[str], None]):
-                self._log_fn = log_fn
-
-            def debug(self, msg: str) -> None:
-                return
-
-            def warning(self, msg: str) -> None:
-                self._log_fn(str(msg))
-
-            def error(self, msg: str) -> None:
-                self._log_fn(str(msg))
-
-        ydl_opts["logger"] = _YDLLogger(self._log)
+        ydl_opts = _job_opts("image" if is_image_mode else "download")
 
         try:
             info = None
             last_exc: Exception | None = None
             max_attempts = max(1, int(opts.retries) + 1)
+            delay = 1.0
+            captured_out = ""
             for attempt in range(1, max_attempts + 1):
                 if job.cancel_event.is_set():
-                    raise Exception("Cancelled")
+                    raise _CancelledDownload()
                 try:
-                    buf = io.StringIO()
+                    buf = _TailBuffer()
                     with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
                         with YoutubeDL(ydl_opts) as ydl:
                             info = ydl.extract_info(job.url, download=True)
+                    captured_out = buf.getvalue()
                     last_exc = None
                     break
                 except Exception as e:  # noqa: BLE001
                     last_exc = e
                     msg = str(e)
-                    msg_l = msg.lower()
-                    if (
-                        "requested format is not available" in msg_l
-                        or "requested format not available" in msg_l
-                        or "requested format" in msg_l
-                    ):
-                        ydl_opts_fallback = dict(ydl_opts)
-                        ydl_opts_fallback.pop("format", None)
-                        ydl_opts_fallback.pop("merge_output_format", None)
-                        buf = io.StringIO()
+                    if _FORMAT_UNAVAIL_RE.search(msg):
+                        # Image mode already has no format; otherwise drop format selection.
+                        ydl_opts_fallback = ydl_opts if is_image_mode else _job_opts("fallback")
+                        buf = _TailBuffer()
                         with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
                             with YoutubeDL(ydl_opts_fallback) as ydl:
                                 info = ydl.extract_info(job.url, download=True)
+                        captured_out = buf.getvalue()
                         last_exc = None
                         break
 
                     if _is_block_error(msg) and attempt < max_attempts and not job.cancel_event.is_set():
-                        delay = min(60.0, (2.0 ** (attempt - 1)) + random.uniform(0.0, 1.0))
+                        delay = _block_retry_delay(msg, delay)
                         self._log(f"[Retry] Temporary block detected (403/429/bot). Waiting {delay:.1f}s (attempt {attempt}/{max_attempts})...")
-                        time.sleep(delay)
+                        # Wait on the cancel event so cancelling during a backoff is immediate.
+                        if job.cancel_event.wait(timeout=delay):
+                            raise _CancelledDownload()
                         continue
 
                     raise
@@ -947,10 +1342,7 @@ class DownloadManager:
             if last_exc is not None and info is None:
                 raise last_exc
 
-            try:
-                out = buf.getvalue().strip() if "buf" in locals() else ""
-            except Exception:
-                out = ""
+            out = captured_out.strip()
             if out:
                 self._log(out)
 
@@ -969,69 +1361,29 @@ class DownloadManager:
                     if p_start > 0 or p_end > 0:
                         self._log(f"[AI] Detected Intro/Outro: {p_start}s - {p_end}s suggested.")
 
-                if opts.ai_summary:
-                    summary = self.ai.generate_summary(info)
-                    self._log(f"[AI Summary] {job.job_id}: {summary}")
-                    try:
-                        base = _sanitize_filename(job.title or info.get("title") or f"job_{job.job_id}")
-                        out_path = os.path.join(opts.output_dir, f"{base} - summary.txt")
-                        with open(out_path, "w", encoding="utf-8") as f:
-                            f.write(str(summary))
-                        self._log(f"[AI Summary] Saved: {out_path}")
-                    except Exception as e:  # noqa: BLE001
-                        self._log(f"[AI Summary] Save failed: {e}")
-
-                try:
-                    downloaded_paths = _collect_filepaths(info)
-                    cleaned_images = _cleanup_images(downloaded_paths)
-                    if cleaned_images and not job.filename:
-                        job.filename = cleaned_images[0]
-                except Exception:
-                    pass
-
-                try:
-                    extra_cleaned = _cleanup_recent_image_exts(opts.output_dir)
-                    if extra_cleaned and not job.filename:
-                        job.filename = extra_cleaned[0]
-                    if opts.write_thumbnail and extra_cleaned and not job.thumbnail:
-                        job.thumbnail = extra_cleaned[0]
-                except Exception:
-                    pass
-
+                # The AI summary, image cleanup and folder organisation run on the post-processing pool
+                # so this download slot can move on to the next queued URL.
+                job.status = "postprocessing"
+                self._notify(job)
                 try:
-                    organize_candidates: List[str] = []
-                    try:
-                        organize_candidates.extend(downloaded_paths if "downloaded_paths" in locals() else [])
-                    except Exception:
-                        pass
-                    try:
-                        organize_candidates.extend(cleaned_images if "cleaned_images" in locals() else [])
-                    except Exception:
-                        pass
-                    try:
-                        organize_candidates.extend(extra_cleaned if "extra_cleaned" in locals() else [])
-                    except Exception:
-                        pass
-                    if job.filename:
-                        organize_candidates.append(job.filename)
+                    fut = self._post_pool.submit(self._finalize_job, job, info, is_image_mode)
+                except RuntimeError:
+                    # Pool already shut down: the app is closing, leave the files as downloaded.
+                    return
+                self._post_futures[job.job_id] = fut
+                fut.add_done_callback(lambda _f, job_id=job.job_id: self._post_futures.pop(job_id, None))
+                return
 
-                    moved = _organize_download_outputs(organize_candidates, opts.output_dir)
-                    if job.filename and job.filename in moved:
-                        job.filename = moved[job.filename]
-                    else:
-                        for old, new in moved.items():
-                            if old == job.filename:
-                                job.filename = new
-                                break
-                except Exception:
-                    pass
-                    
             if job.cancel_event.is_set():
                 job.status = "cancelled"
             elif job.status not in {"error", "cancelled"}:
                 job.status = "done"
                 job.progress = 100.0
             self._notify(job)
+        except _CancelledDownload:
+            job.status = "cancelled"
+            job.error = ""
+            self._notify(job)
         except Exception as e:  # noqa: BLE001
             if job.cancel_event.is_set():
                 job.status = "cancelled"
@@ -1043,98 +1395,225 @@ class DownloadManager:
                 if _is_block_error(raw):
                     cookies_path = opts.cookies_file.strip()
                     if cookies_path:
-                        job.error = (
-                            f"YouTube blocked this request (403/429/bot). "
-                            f"The provided cookies file ({os.path.basename(cookies_path)}) might be expired or invalid. "
-                            "Please export a fresh cookies.txt from your browser and try again."
-                        )
+                        job.error = _ERR_BLOCK_WITH_COOKIES.format(cookie_name=os.path.basename(cookies_path))
                     else:
-                        job.error = (
-                            "YouTube blocked this request (403/429/bot). "
-                            "You must export browser cookies to a cookies.txt file and select it in the Advanced or Settings tab."
-                        )
+                        job.error = _ERR_BLOCK_NO_COOKIES
 
                 else:
                     job.error = raw
             self._notify(job)
 
-    def _format_string(self, quality: str, fps: int, container: str, audio_only: bool) -> str:
-        q = quality.strip().lower()
-        if audio_only:
-            return "bestaudio/best"
+    def _finalize_job(self, job: DownloadJob, info: Any, is_image_mode: bool = True) -> None:
+        opts = job.options
+        # The summary only needs the final title and metadata, so it is written here on
+        # the post-processing pool alongside the file cleanup, off the download slot.
+        if opts.ai_summary:
+            try:
+                summary = self.ai.generate_summary(info)
+                self._log(f"[AI Summary] {job.job_id}: {summary}")
+                base = _sanitize_filename(job.title or info.get("title") or f"job_{job.job_id}")
+                out_path = os.path.join(opts.output_dir, f"{base} - summary.txt")
+                Path(out_path).write_text(summary if isinstance(summary, str) else str(summary), encoding="utf-8")
+                self._log(f"[AI Summary] Saved: {out_path}")
+            except Exception as e:  # noqa: BLE001
+                self._log(f"[AI Summary] Save failed: {e}")
+
+        downloaded_paths: List[str] = []
+        cleaned_images: List[str] = []
+        extra_cleaned: List[str] = []
+        try:
+            downloaded_paths = _collect_filepaths(info)
+        except Exception:
+            pass
 
-        height_map = {
-            "144p": 144,
-            "240p": 240,
-            "360p": 360,
-            "480p": 480,
-            "720p": 720,
-            "1080p": 1080,
-            "2k": 1440,
-            "4k": 2160,
-            "8k": 4320,
-            "best": None,
+        # Image cleanup only matters when images can have been written: image posts,
+        # thumbnails, or image files reported by yt-dlp itself. A plain single-file
+        # video goes straight to organising.
+        has_images = is_image_mode or opts.write_thumbnail or any(_is_image_path(p) for p in downloaded_paths)
+        if not has_images and len(downloaded_paths) <= 1:
+            if downloaded_paths and not job.filename:
+                job.filename = downloaded_paths[0]
+        else:
+            try:
+                cleaned_images = _cleanup_images(downloaded_paths)
+                if cleaned_images and not job.filename:
+                    job.filename = cleaned_images[0]
+            except Exception:
+                pass
+
+        if has_images:
+            try:
+                # Prefer the files this job reported over a scan of the whole folder; only
+                # scan when it reported none (which could also catch other jobs' images).
+                reported = _thumbnail_filepaths(info) + job._created_files
+                known: Optional[List[str]] = None
+                if reported:
+                    already = set(downloaded_paths)
+                    known = [p for p in dict.fromkeys(reported) if p not in already and os.path.exists(p)]
+                extra_cleaned = _cleanup_recent_image_exts(opts.output_dir, candidates=known)
+                if extra_cleaned and not job.filename:
+                    job.filename = extra_cleaned[0]
+                if opts.write_thumbnail and extra_cleaned and not job.thumbnail:
+                    job.thumbnail = extra_cleaned[0]
+            except Exception:
+                pass
+
+        try:
+            candidates: Dict[str, None] = {}
+            for src in (downloaded_paths, cleaned_images, extra_cleaned, [job.filename] if job.filename else ()):
+                for p in src:
+                    candidates.setdefault(p, None)
+
+            moved = _organize_download_outputs(list(candidates), opts.output_dir)
+            if job.filename and job.filename in moved:
+                job.filename = moved[job.filename]
+            else:
+                for old, new in moved.items():
+                    if old == job.filename:
+                        job.filename = new
+                        break
+        except Exception:
+            pass
+
+        # cancel_job() ignores jobs in post-processing, so a finished download always ends "done".
+        job.status = "done"
+        job.progress = 100.0
+        self._notify(job)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _ydl_opts_template(opts: DownloadOptions) -> Dict[str, Any]:
+        # Everything in ydl_opts that depends only on the (frozen) options; queued jobs
+        # usually share one options object, so this is built once per batch. Callers
+        # shallow-copy it and add the per-job hooks and cookie file.
+        outtmpl = os.path.join(opts.output_dir, "%(title).200B [%(id)s].%(ext)s")
+        ydl_opts: Dict[str, Any] = {
+            "outtmpl": {"default": outtmpl},
+            "noplaylist": not opts.allow_playlist,
+            "retries": max(0, int(opts.retries)),
+            "fragment_retries": max(0, int(opts.retries)),
+            "continuedl": True,
+            "noprogress": True,
+            "concurrent_fragment_downloads": 4,
+            "nopart": False,
+            "quiet": True,
+            "no_warnings": True,
+            "sleep_interval": 1,
+            "max_sleep_interval": 5,
+            "sleep_interval_requests": 1,
+            "http_headers": {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+            "extractor_args": {
+                "tiktok": {
+                    "app_id": "1233", # Pseudo app id
+                    "no_watermark": True,
+                }
+            },
         }
-        h = height_map.get(q, None)
 
-        fps = int(fps) if isinstance(fps, int) else 0
-        if h is None:
-            if fps <= 0:
-                return "bestvideo+bestaudio/best"
-            if fps >= 60:
-                return "bestvideo[fps>=60]+bestaudio/best/bestvideo+bestaudio/best"
-            return "bestvideo[fps<=30]+bestaudio/best/bestvideo+bestaudio/best"
-
-        if fps <= 0:
-            return f"bestvideo[height<={h}]+bestaudio/best[height<={h}]"
-
-        if fps >= 60:
-            return (
-                f"bestvideo[height<={h}][fps>=60]+bestaudio/best/"
-                f"bestvideo[height<={h}]+bestaudio/best"
+        if opts.audio_language and opts.audio_language != "auto":
+            # YouTube specific audio language
+            if "extractor_args" not in ydl_opts: ydl_opts["extractor_args"] = {}
+            if "youtube" not in ydl_opts["extractor_args"]: ydl_opts["extractor_args"]["youtube"] = {}
+            ydl_opts["extractor_args"]["youtube"]["lang"] = [opts.audio_language]
+
+        fmt = DownloadManager._format_string(opts.quality, opts.fps, opts.container, opts.audio_only)
+        if fmt:
+            ydl_opts["format"] = fmt
+
+        postprocessors: List[Dict[str, Any]] = []
+
+        if opts.audio_only:
+            postprocessors.append(
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": opts.audio_format,
+                    "preferredquality": "320", 
+                }
             )
 
-        return (
-            f"bestvideo[height<={h}][fps<=30]+bestaudio/best/"
-            f"bestvideo[height<={h}]+bestaudio/best"
-        )
+        if opts.container.lower() in {"mp4", "mkv", "webm"} and not opts.audio_only:
+            ydl_opts["merge_output_format"] = opts.container.lower()
+
+        if opts.write_thumbnail:
+            ydl_opts["writethumbnail"] = True
+            ydl_opts["write_all_thumbnails"] = True
+
+        if opts.write_subtitles or opts.auto_subtitles:
+            ydl_opts["writesubtitles"] = opts.write_subtitles
+            ydl_opts["writeautomaticsub"] = opts.auto_subtitles
+            if opts.subtitle_langs.strip():
+                ydl_opts["subtitleslangs"] = [s.strip() for s in opts.subtitle_langs.split(",") if s.strip()]
+            ydl_opts["subtitlesformat"] = opts.subtitle_format
+
+        if opts.embed_subtitles and (opts.write_subtitles or opts.auto_subtitles) and not opts.audio_only:
+            postprocessors.append({"key": "FFmpegEmbedSubtitle"})
+
+        # Trim feature
+        if opts.trim_start or opts.trim_end:
+            # We use external_args to pass to ffmpeg
+            ffmpeg_args = []
+            if opts.trim_start:
+                ffmpeg_args.extend(["-ss", opts.trim_start])
+            if opts.trim_end:
+                ffmpeg_args.extend(["-to", opts.trim_end])
+            
+            if "postprocessor_args" not in ydl_opts:
+                ydl_opts["postprocessor_args"] = {}
+            if "ffmpeg" not in ydl_opts["postprocessor_args"]:
+                ydl_opts["postprocessor_args"]["ffmpeg"] = []
+            ydl_opts["postprocessor_args"]["ffmpeg"].extend(ffmpeg_args)
+
+        if postprocessors:
+            ydl_opts["postprocessors"] = postprocessors
+        return ydl_opts
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _ydl_opts_for(opts: DownloadOptions, mode: str) -> Dict[str, Any]:
+        # Variants of the option template, built once instead of copy-and-pop per job:
+        # "download" as-is, "probe" for the metadata-only image check, "image" for
+        # image-only posts and "fallback" for when the requested format is unavailable.
+        base = DownloadManager._ydl_opts_template(opts)
+        drop = _YDL_MODE_DROPS.get(mode)
+        if not drop:
+            return base
+        out = {k: v for k, v in base.items() if k not in drop}
+        if mode == "probe":
+            out["skip_download"] = True
+        return out
+
+    @staticmethod
+    def _format_string(quality: str, fps: int, container: str, audio_only: bool) -> str:
+        if audio_only:
+            return "bestaudio/best"
+        fps = int(fps) if isinstance(fps, int) else 0
+        bucket = "any" if fps <= 0 else ("hi" if fps >= 60 else "lo")
+        return _FORMAT_TABLE[(_HEIGHT_MAP.get(quality.strip().casefold()), bucket)]
 
     def _progress_hook(self, job: DownloadJob, d: Dict[str, Any]) -> None:
         if job.cancel_event.is_set():
-            raise Exception("Cancelled")
+            raise _CancelledDownload()
 
         status = d.get("status")
         if status == "downloading":
+            # Byte counts are already numeric; _percent_str is only a fallback (and may
+            # carry terminal colour codes).
             pct: float = 0.0
-            pct_str = str(d.get("_percent_str", "")).strip().replace("%", "")
-            try:
-                pct = float(pct_str)
-            except Exception:  # noqa: BLE001
+            downloaded = d.get("downloaded_bytes")
+            total = d.get("total_bytes") or d.get("total_bytes_estimate")
+            if isinstance(downloaded, (int, float)) and isinstance(total, (int, float)) and total > 0:
+                pct = float(downloaded) / float(total) * 100.0
+            else:
                 try:
-                    downloaded = d.get("downloaded_bytes")
-                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
-                    if isinstance(downloaded, (int, float)) and isinstance(total, (int, float)) and total > 0:
-                        pct = float(downloaded) / float(total) * 100.0
+                    pct = float(str(d.get("_percent_str", "")).strip().replace("%", ""))
                 except Exception:  # noqa: BLE001
                     pct = 0.0
 
-            info = d.get("info_dict") if isinstance(d.get("info_dict"), dict) else {}
-            playlist_index = info.get("playlist_index") or d.get("playlist_index")
-            playlist_count = (
-                info.get("playlist_count")
-                or info.get("n_entries")
-                or d.get("playlist_count")
-                or d.get("playlist_n_entries")
-            )
-            try:
-                pi = int(playlist_index) if playlist_index else 0
-            except Exception:  # noqa: BLE001
-                pi = 0
-            try:
-                pc = int(playlist_count) if playlist_count else 0
-            except Exception:  # noqa: BLE001
-                pc = 0
-
+            pi, pc = _playlist_pos(d)
             if pc > 0 and pi > 0:
                 job.progress = max(0.0, min(100.0, ((pi - 1) + (pct / 100.0)) / pc * 100.0))
             else:
@@ -1142,26 +1621,22 @@ class DownloadManager:
             job.speed = str(d.get("_speed_str", "")).strip()
             job.eta = str(d.get("_eta_str", "")).strip()
             filename = d.get("filename")
-            if isinstance(filename, str):
+            file_changed = False
+            if isinstance(filename, str) and filename != job.filename:
                 job.filename = filename
-            self._notify(job)
+                file_changed = True
+            # yt-dlp calls this per chunk; cap UI notifications at ~10 Hz per job so speed
+            # and ETA keep moving. "finished" below always notifies, so the final progress
+            # is never dropped.
+            now = time.monotonic()
+            if file_changed or now - job._last_notify >= _NOTIFY_INTERVAL:
+                job._last_notify = now
+                self._notify(job)
         elif status == "finished":
-            info = d.get("info_dict") if isinstance(d.get("info_dict"), dict) else {}
-            playlist_index = info.get("playlist_index") or d.get("playlist_index")
-            playlist_count = (
-                info.get("playlist_count")
-                or info.get("n_entries")
-                or d.get("playlist_count")
-                or d.get("playlist_n_entries")
-            )
-            try:
-                pi = int(playlist_index) if playlist_index else 0
-            except Exception:  # noqa: BLE001
-                pi = 0
-            try:
-                pc = int(playlist_count) if playlist_count else 0
-            except Exception:  # noqa: BLE001
-                pc = 0
+            filename = d.get("filename")
+            if isinstance(filename, str) and filename:
+                job._created_files.append(filename)
+            pi, pc = _playlist_pos(d)
             if pc > 0 and pi > 0:
                 job.progress = max(0.0, min(100.0, (pi / pc) * 100.0))
             else:
@@ -1169,11 +1644,48 @@ class DownloadManager:
             self._notify(job)
 
     def _notify(self, job: DownloadJob) -> None:
+        # One UI push per terminal state; late hook events after a cancel are dropped.
+        # Any non-terminal status (a retry starting) re-arms it.
+        if job.status in _TERMINAL_STATUSES:
+            if job._terminal_notified:
+                return
+            job._terminal_notified = True
+        else:
+            job._terminal_notified = False
+        self.track_job(job)
+        if job.status == "running":
+            # Progress updates are coalesced: the pump thread delivers the latest state
+            # of each running job at most every _NOTIFY_INTERVAL.
+            with self._notify_lock:
+                self._pending_notify[job.job_id] = job
+                if self._notify_pump is None:
+                    self._notify_pump = threading.Thread(target=self._notify_pump_loop, name="notify-pump", daemon=True)
+                    self._notify_pump.start()
+            self._notify_event.set()
+            return
+        # Status changes go out immediately; drop any queued progress update so the
+        # pump cannot deliver this job again after its final state.
+        with self._notify_lock:
+            self._pending_notify.pop(job.job_id, None)
+        self._fire_status(job)
+
+    def _fire_status(self, job: DownloadJob) -> None:
         try:
             self._on_status(job)
         except Exception:  # noqa: BLE001
             pass
 
+    def _notify_pump_loop(self) -> None:
+        while True:
+            self._notify_event.wait()
+            time.sleep(_NOTIFY_INTERVAL)
+            with self._notify_lock:
+                batch, self._pending_notify = self._pending_notify, {}
+                self._notify_event.clear()
+            for job in batch.values():
+                if job.status == "running":
+                    self._fire_status(job)
+
     def _log(self, msg: str) -> None:
         try:
             self._on_log(msg)